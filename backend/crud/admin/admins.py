@@ -22,7 +22,6 @@ def create_admin(db: Session, username: str, password: str, email: str, full_nam
     )
     db.add(new_admin)
     db.commit()
-    db.refresh(new_admin)
     return new_admin
 
 def get_admin_by_username(db: Session, username: str):
@@ -33,7 +32,6 @@ def create_role(db: Session, role_name: str, description: str = None):
     new_role = AdminRole(role_name=role_name, description=description)
     db.add(new_role)
     db.commit()
-    db.refresh(new_role)
     return new_role
 
 def get_all_roles(db: Session):
@@ -44,7 +42,6 @@ def create_permission(db: Session, permission_name: str, description: str = None
     new_perm = AdminPermission(permission_name=permission_name, description=description)
     db.add(new_perm)
     db.commit()
-    db.refresh(new_perm)
     return new_perm
 
 def get_all_permissions(db: Session):
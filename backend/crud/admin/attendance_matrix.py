@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from typing import List, Sequence
+
+from models.instructor.attendance_records import AttendanceStatusEnum
+
+# Category order for status codes; code -1 (no record / unknown status) maps
+# to the trailing '' label, so a single take() turns the codes into cell text.
+STATUS_CATEGORIES = [status.value for status in AttendanceStatusEnum]
+STATUS_LABELS = np.array(STATUS_CATEGORIES + [''], dtype=object)
+
+def pivot_attendance(student_ids: Sequence[str], attendance_dates: Sequence, statuses: Sequence[str], dates: Sequence):
+    """
+    Pivots (student_id, date, status) tuples, given column-wise, into a
+    student x date matrix of status labels.
+
+    Students keep their order of first appearance (the report query is sorted
+    by student), dates follow `dates`, and records outside `dates` or without
+    a date (students with no attendance) leave their cells blank. If a student
+    has two records for one date, the later one wins, as before.
+
+    Returns (first_rows, matrix): the position of each student's first tuple
+    and an object array of shape (number of students, len(dates)).
+    """
+    student_codes, students = pd.factorize(np.asarray(student_ids, dtype=object), sort=False)
+    date_codes = pd.Index(dates, dtype=object).get_indexer(pd.Index(attendance_dates, dtype=object))
+    status_codes = pd.Categorical(statuses, categories=STATUS_CATEGORIES).codes
+
+    matrix = np.full((len(students), len(dates)), -1, dtype=np.int8)
+    recorded = (date_codes >= 0) & (status_codes >= 0)
+    matrix[student_codes[recorded], date_codes[recorded]] = status_codes[recorded]
+    _, first_rows = np.unique(student_codes, return_index=True)
+    return first_rows, STATUS_LABELS.take(matrix)
+
+def iter_student_frames(partitions, columns: List[str]):
+    """
+    Turns result partitions sorted by student (first column) into DataFrames
+    that each hold complete students: the last student of a partition may
+    continue in the next one, so its tuples are carried over.
+    """
+    carry = None
+    for partition in partitions:
+        frame = pd.DataFrame.from_records(partition, columns=columns)
+        if carry is not None:
+            frame = pd.concat([carry, frame], ignore_index=True)
+        student_ids = frame[columns[0]].to_numpy()
+        split = int(np.argmax(student_ids == student_ids[-1]))
+        if split:
+            yield frame.iloc[:split]
+        carry = frame.iloc[split:]
+    if carry is not None and len(carry):
+        yield carry
@@ -1,42 +1,50 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.admin.course import Course
 from models.admin.pre_course import CoursePrerequisite
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+from crud.search import SEARCH_LIMIT_DEFAULT, course_index
+
+_COURSE_BY_ID = lookup_statement(Course, Course.course_id)
+_COURSE_BY_NAME = lookup_statement(Course, Course.course_name)
+
 
 # CREATE course
 def create_course(db: Session, course_data: dict):
     course = Course(**course_data)
     db.add(course)
     db.commit()
-    db.refresh(course)
+    course_index.upsert(db, course)
     return course
 
 # GET all courses
-def get_courses(db: Session):
-    return db.query(Course).all()
+def get_courses(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(Course), Keyset(Course.course_id), page)
 
-# SEARCH course by name 
-def search_course(db: Session, keyword: str):
-    return db.query(Course).filter(
-        (Course.course_name.ilike(f"%{keyword}%")) 
-    ).all()
+# SEARCH course by name or ID, best matches first (crud/search.py)
+def search_course(db: Session, keyword: str, limit: int = SEARCH_LIMIT_DEFAULT):
+    return course_index.search(db, keyword, limit)
 
 def get_course_by_name(db: Session, course_name: str):
-    return db.query(Course).filter(Course.course_name == course_name).first()
+    return fetch_one(db, _COURSE_BY_NAME, course_name)
 
 def get_course_by_id(db: Session, course_id: str):
     """
     Retrieves a course by its course ID.
     """
-    return db.query(Course).filter(Course.course_id == course_id).first()
+    return fetch_one(db, _COURSE_BY_ID, course_id)
 
 # UPDATE course
 def update_course(db: Session, course_name: str, updated_data: dict):
-    course = db.query(Course).filter(Course.course_name == course_name).first()
+    course = fetch_one(db, _COURSE_BY_NAME, course_name)
     if course:
+        old_course_id = course.course_id
         for key, value in updated_data.items():
             setattr(course, key, value)
         db.commit()
-        db.refresh(course)
+        course_index.upsert(db, course, old_key=old_course_id)
         return course
     return None
 
@@ -46,10 +54,11 @@ def delete_course(db: Session, course_id: str):
     db.query(CoursePrerequisite).filter(CoursePrerequisite.prereq_course_id == course_id).delete()
     
     # Now, delete the course itself
-    course = db.query(Course).filter(Course.course_id == course_id).first()
+    course = fetch_one(db, _COURSE_BY_ID, course_id)
     if course:
         db.delete(course)
         db.commit()
+        course_index.remove(db, course_id)
         return True
     db.commit() # Commit changes even if course not found (for prereq deletion)
     return False
@@ -1,8 +1,14 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Optional
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import and_, select
 from models.admin.course_offerings import CourseOffering
 from models.admin.course import Course # Import Course model for joins
 from models.admin.instructor import Instructor # Import Instructor model for joins
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+
+
+_OFFERING_BY_ID = lookup_statement(CourseOffering, CourseOffering.offering_id)
 
 
 def create_course_offering(db: Session, course_id: str, section_name: str, instructor_id: str, capacity: int):
@@ -24,33 +30,33 @@ def create_course_offering(db: Session, course_id: str, section_name: str, instr
     )
     db.add(new_offering)
     db.commit()
-    db.refresh(new_offering)
     return new_offering
 
 
-def get_all_course_offerings(db: Session):
-    return db.query(CourseOffering).all()
+def get_all_course_offerings(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(CourseOffering), Keyset(CourseOffering.offering_id), page)
 
 
 def get_course_offering_by_id(db: Session, offering_id: int):
-    return db.query(CourseOffering).filter(CourseOffering.offering_id == offering_id).first()
+    return fetch_one(db, _OFFERING_BY_ID, offering_id)
 
 
-def get_offerings_by_course(db: Session, course_id: str):
-    return db.query(CourseOffering).filter(CourseOffering.course_id == course_id).all()
+def get_offerings_by_course(db: Session, course_id: str, page: Optional[PageParams] = None) -> Page:
+    statement = select(CourseOffering).where(CourseOffering.course_id == course_id)
+    return paginate(db, statement, Keyset(CourseOffering.offering_id), page)
 
 
-def get_offerings_by_instructor(db: Session, instructor_id: str):
-    return db.query(CourseOffering).filter(CourseOffering.instructor_id == instructor_id).all()
+def get_offerings_by_instructor(db: Session, instructor_id: str, page: Optional[PageParams] = None) -> Page:
+    statement = select(CourseOffering).where(CourseOffering.instructor_id == instructor_id)
+    return paginate(db, statement, Keyset(CourseOffering.offering_id), page)
 
 
 def update_course_offering(db: Session, offering_id: int, updated_data: dict):
-    offering = db.query(CourseOffering).filter(CourseOffering.offering_id == offering_id).first()
+    offering = fetch_one(db, _OFFERING_BY_ID, offering_id)
     if offering:
         for key, value in updated_data.items():
             setattr(offering, key, value)
         db.commit()
-        db.refresh(offering)
         return offering
     return None
 
@@ -64,17 +70,13 @@ def delete_course_offering(db: Session, offering_id: int):
     return False
 
 # New function to view course offerings by section name with details
-def get_course_offerings_by_section_details(db: Session, section_name: str):
-    return (
-        db.query(
-            CourseOffering.offering_id,
-            CourseOffering.capacity,
-            Course.course_name, # Access course name from joined Course model
-            Instructor.first_name, # Access instructor first name from joined Instructor model
-            Instructor.last_name # Access instructor last name from joined Instructor model
-        )
+def get_course_offerings_by_section_details(db: Session, section_name: str, page: Optional[PageParams] = None) -> Page:
+    # Course and instructor come from the same joined query
+    statement = (
+        select(CourseOffering)
         .join(Course, CourseOffering.course_id == Course.course_id)
         .join(Instructor, CourseOffering.instructor_id == Instructor.instructor_id)
-        .filter(CourseOffering.section_name == section_name)
-        .all()
+        .options(contains_eager(CourseOffering.course_rel), contains_eager(CourseOffering.instructor_rel))
+        .where(CourseOffering.section_name == section_name)
     )
+    return paginate(db, statement, Keyset(CourseOffering.offering_id), page)
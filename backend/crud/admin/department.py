@@ -1,17 +1,23 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.admin.department import Department
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+
+_DEPARTMENT_BY_NAME = lookup_statement(Department, Department.department_name)
+
 
 # CREATE department
 def create_department(db: Session, department_data: dict):
     department = Department(**department_data)
     db.add(department)
     db.commit()
-    db.refresh(department)
     return department
 
 # GET all department
-def get_department(db: Session):
-    return db.query(Department).all()
+def get_department(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(Department), Keyset(Department.department_name), page)
 
 # SEARCH department by name 
 def search_department(db: Session, keyword: str):
@@ -21,7 +27,7 @@ def search_department(db: Session, keyword: str):
 
 # DELETE department
 def delete_department(db: Session, department_name: str):
-    department = db.query(Department).filter(Department.department_name == department_name).first()
+    department = fetch_one(db, _DEPARTMENT_BY_NAME, department_name)
     if department:
         db.delete(department)
         db.commit()
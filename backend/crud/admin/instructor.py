@@ -1,46 +1,51 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.admin.instructor import Instructor
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+from crud.search import SEARCH_LIMIT_DEFAULT, instructor_index
+
+_INSTRUCTOR_BY_ID = lookup_statement(Instructor, Instructor.instructor_id)
+
 
 # CREATE instructor
 def create_instructor(db: Session, instructor_data: dict):
     instructor = Instructor(**instructor_data)
     db.add(instructor)
     db.commit()
-    db.refresh(instructor)
+    instructor_index.upsert(db, instructor)
     return instructor
 
 # GET all instructors
-def get_instructors(db: Session):
-    return db.query(Instructor).all()
+def get_instructors(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(Instructor), Keyset(Instructor.instructor_id), page)
 
-# SEARCH instructor by name or ID
-def search_instructor(db: Session, keyword: str):
-    return db.query(Instructor).filter(
-        (Instructor.instructor_id.ilike(f"%{keyword}%")) |
-        (Instructor.first_name.ilike(f"%{keyword}%")) |
-        (Instructor.last_name.ilike(f"%{keyword}%"))
-    ).all()
+# SEARCH instructor by name or ID, best matches first (crud/search.py)
+def search_instructor(db: Session, keyword: str, limit: int = SEARCH_LIMIT_DEFAULT):
+    return instructor_index.search(db, keyword, limit)
 
 def get_instructor_by_id(db: Session, instructor_id: str):
-    return db.query(Instructor).filter(Instructor.instructor_id == instructor_id).first()
+    return fetch_one(db, _INSTRUCTOR_BY_ID, instructor_id)
 
 
 # UPDATE instructor
 def update_instructor(db: Session, instructor_id: str, updated_data: dict):
-    instructor = db.query(Instructor).filter(Instructor.instructor_id == instructor_id).first()
+    instructor = fetch_one(db, _INSTRUCTOR_BY_ID, instructor_id)
     if instructor:
         for key, value in updated_data.items():
             setattr(instructor, key, value)
         db.commit()
-        db.refresh(instructor)
+        instructor_index.upsert(db, instructor, old_key=instructor_id)
         return instructor
     return None
 
 # DELETE instructor
 def delete_instructor(db: Session, instructor_id: str):
-    instructor = db.query(Instructor).filter(Instructor.instructor_id == instructor_id).first()
+    instructor = fetch_one(db, _INSTRUCTOR_BY_ID, instructor_id)
     if instructor:
         db.delete(instructor)
         db.commit()
+        instructor_index.remove(db, instructor_id)
         return True
     return False
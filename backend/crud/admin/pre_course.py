@@ -1,9 +1,11 @@
 # crud/course_prerequisite.py
 
+from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from models.admin.pre_course import CoursePrerequisite # Your model
 from models.admin.course import Course # You'll need this to validate course_ids later, and for joins
+from crud.pagination import Keyset, Page, PageParams, paginate
 
 # --- Create Operations ---
 def create_prerequisite_link(db: Session, course_id: str, prereq_course_id: str):
@@ -33,34 +35,30 @@ def create_prerequisite_link(db: Session, course_id: str, prereq_course_id: str)
     )
     db.add(new_prereq_link)
     db.commit()
-    db.refresh(new_prereq_link)
     return new_prereq_link
 
 # --- Read Operations ---
-def get_all_prerequisite_links(db: Session):
+def get_all_prerequisite_links(db: Session, page: Optional[PageParams] = None) -> Page:
     """
-    Retrieves all prerequisite links in the database.
+    Retrieves prerequisite links in the database, a page at a time.
     """
-    return db.query(CoursePrerequisite).all()
+    return paginate(db, select(CoursePrerequisite), Keyset(CoursePrerequisite.prerequisite_id), page)
 
-def get_prerequisites_for_course(db: Session, main_course_id: str):
+def get_prerequisites_for_course(db: Session, main_course_id: str, page: Optional[PageParams] = None) -> Page:
     """
-    Retrieves all prerequisite courses for a given main course ID.
-    Returns a list of CoursePrerequisite objects.
+    Retrieves the prerequisite links of a given main course ID, a page at a time.
     """
     # You might want to eager load the prerequisite_course details here for display
-    return db.query(CoursePrerequisite).\
-        filter(CoursePrerequisite.course_id == main_course_id).\
-        all()
+    statement = select(CoursePrerequisite).where(CoursePrerequisite.course_id == main_course_id)
+    return paginate(db, statement, Keyset(CoursePrerequisite.prerequisite_id), page)
 
-def get_courses_requiring_this_prereq(db: Session, prereq_course_id: str):
+def get_courses_requiring_this_prereq(db: Session, prereq_course_id: str, page: Optional[PageParams] = None) -> Page:
     """
-    Retrieves all courses that require a given prerequisite course ID.
-    Returns a list of CoursePrerequisite objects.
+    Retrieves the links of courses that require a given prerequisite course ID,
+    a page at a time.
     """
-    return db.query(CoursePrerequisite).\
-        filter(CoursePrerequisite.prereq_course_id == prereq_course_id).\
-        all()
+    statement = select(CoursePrerequisite).where(CoursePrerequisite.prereq_course_id == prereq_course_id)
+    return paginate(db, statement, Keyset(CoursePrerequisite.prerequisite_id), page)
 
 # --- Delete Operations ---
 def delete_prerequisite_link(db: Session, course_id: str, prereq_course_id: str):
@@ -1,205 +1,341 @@
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from models.admin.student import Student
 from models.admin.course_offerings import CourseOffering
 from models.admin.student_enrollment import StudentCourseEnrollment
 from models.instructor.exam_records import ExamRecord
-from models.instructor.attendance_records import Attendance
+from models.instructor.attendance_records import Attendance, AttendanceStatusEnum
+from models.instructor.attendance_summary import AttendanceStudentSummary
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 from models.admin.section import Section
 from models.admin.course import Course
-from sqlalchemy.orm import joinedload
+from sqlalchemy import String, and_, case, distinct, exists, func, type_coerce
+from crud.admin.report_cache import report_cache, normalize_filters
+from database.routing import on_primary
+from crud.admin import attendance_matrix
+
+class ReportCohort:
+    """
+    Composable query builder shared by every admin report.
+
+    A cohort is the set of enrollments whose student matches the department
+    and semester filters, optionally narrowed to one offering. Report queries
+    start from students ⋈ enrollments restricted to the cohort (semester is an
+    EXISTS on sections) and attach their fact table (exam records, attendance
+    records or the attendance rollup) on (student_id, offering_id), so all
+    filtering stays in the database and no ID lists are built in Python.
+    """
+
+    def __init__(self, department: Optional[str], semester: Optional[str], course: Optional[str]):
+        self.department = department
+        self.semester = semester
+        self.course = course
+
+    def query(self, db: Session, *columns):
+        query = (
+            db.query(*columns)
+            .select_from(Student)
+            .join(StudentCourseEnrollment, StudentCourseEnrollment.student_id == Student.student_id)
+        )
+        if self.department:
+            query = query.filter(Student.program == self.department)
+        if self.semester:
+            query = query.filter(
+                exists().where(Section.section_name == Student.section, Section.semester == self.semester)
+            )
+        if self.course:
+            query = query.filter(StudentCourseEnrollment.offering_id == self.course)
+        return query
+
+    @staticmethod
+    def _enrollment_join(model, *conditions):
+        return and_(
+            model.student_id == StudentCourseEnrollment.student_id,
+            model.offering_id == StudentCourseEnrollment.offering_id,
+            *conditions,
+        )
+
+    def with_exam_records(self, query, exam_type: Optional[str]):
+        conditions = [ExamRecord.exam_type == exam_type] if exam_type else []
+        return query.outerjoin(ExamRecord, self._enrollment_join(ExamRecord, *conditions))
+
+    def with_attendance(self, query, from_date: Optional[str], to_date: Optional[str], outer: bool = True):
+        # Date range goes in the join so students without records in range are kept
+        conditions = []
+        if from_date:
+            conditions.append(Attendance.attendance_date >= from_date)
+        if to_date:
+            conditions.append(Attendance.attendance_date <= to_date)
+        join = query.outerjoin if outer else query.join
+        return join(Attendance, self._enrollment_join(Attendance, *conditions))
+
+    def with_attendance_summary(self, query):
+        return query.outerjoin(AttendanceStudentSummary, self._enrollment_join(AttendanceStudentSummary))
+
+    def count_students(self, db: Session) -> int:
+        return self.query(db, func.count(distinct(StudentCourseEnrollment.student_id))).scalar()
+
+    def offering_ids(self, db: Session) -> List[int]:
+        if self.course:
+            # course is free text: one that is not an offering ID matches nothing
+            try:
+                return [int(self.course)]
+            except ValueError:
+                return []
+        return [offering_id for (offering_id,) in self.query(db, StudentCourseEnrollment.offering_id).distinct()]
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
 
 # Exam Report Stats
 
 def get_exam_report_stats(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
-    # Filter students by department/semester (join with Section for semester)
-    query = db.query(Student)
-    if department:
-        query = query.filter(Student.program == department)
-    if semester:
-        query = query.join(Section, Student.section == Section.section_name).filter(Section.semester == semester)
-    students = query.all()
-    student_ids = [s.student_id for s in students]
-
-    # Filter enrollments by offering_id (course param is now offering_id)
-    enrollments = db.query(StudentCourseEnrollment)
-    if course:
-        enrollments = enrollments.filter(StudentCourseEnrollment.offering_id == course)
-    enrollments = enrollments.filter(StudentCourseEnrollment.student_id.in_(student_ids)).all()
-    enrolled_student_ids = [e.student_id for e in enrollments]
-
-    # Filter exam records for those students and offering
-    exam_query = db.query(ExamRecord).filter(ExamRecord.student_id.in_(enrolled_student_ids))
-    if course:
-        exam_query = exam_query.filter(ExamRecord.offering_id == course)
-    if exam_type:
-        exam_query = exam_query.filter(ExamRecord.exam_type == exam_type)
-    exams = exam_query.all()
-
-    total_students = len(set(enrolled_student_ids))
-    passed_students = sum(1 for e in exams if (e.remarks or '').lower() == 'pass')
-    failed_students = sum(1 for e in exams if (e.remarks or '').lower() == 'fail')
-    absent_students = sum(1 for e in exams if (e.remarks or '').lower() == 'absent')
+    # One aggregate query over students ⋈ enrollments ⟕ exam records,
+    # so only the four counts travel back from the database.
+    # Exam records are matched on (student, offering) so a student enrolled in
+    # several offerings does not have their records counted once per enrollment.
+    cohort = ReportCohort(department, semester, course)
+    remarks = func.lower(ExamRecord.remarks)
+    query = cohort.with_exam_records(cohort.query(
+        db,
+        func.count(distinct(StudentCourseEnrollment.student_id)),
+        _count_where(remarks == 'pass'),
+        _count_where(remarks == 'fail'),
+        _count_where(remarks == 'absent'),
+    ), exam_type)
+
+    total_students, passed_students, failed_students, absent_students = query.one()
 
     return {
         'total_students': total_students,
-        'passed_students': passed_students,
-        'failed_students': failed_students,
-        'absent_students': absent_students,
+        'passed_students': int(passed_students),
+        'failed_students': int(failed_students),
+        'absent_students': int(absent_students),
     }
 
 # Attendance Report Stats
 
 def get_attendance_report_stats(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
-    # Filter students by department/semester (join with Section for semester)
-    query = db.query(Student)
-    if department:
-        query = query.filter(Student.program == department)
-    if semester:
-        query = query.join(Section, Student.section == Section.section_name).filter(Section.semester == semester)
-    students = query.all()
-    student_ids = [s.student_id for s in students]
-
-    # Filter enrollments by offering_id (course param is now offering_id)
-    enrollments = db.query(StudentCourseEnrollment)
-    if course:
-        enrollments = enrollments.filter(StudentCourseEnrollment.offering_id == course)
-    enrollments = enrollments.filter(StudentCourseEnrollment.student_id.in_(student_ids)).all()
-    enrolled_student_ids = [e.student_id for e in enrollments]
-
-    # Filter attendance records
-    attendance_query = db.query(Attendance).filter(Attendance.student_id.in_(enrolled_student_ids))
-    if from_date:
-        attendance_query = attendance_query.filter(Attendance.attendance_date >= from_date)
-    if to_date:
-        attendance_query = attendance_query.filter(Attendance.attendance_date <= to_date)
-    records = attendance_query.all()
-
-    total_students = len(set(enrolled_student_ids))
-    present = sum(1 for r in records if (getattr(r.status, 'value', r.status).lower() == 'present'))
-    absent = sum(1 for r in records if (getattr(r.status, 'value', r.status).lower() == 'absent'))
-    leave = sum(1 for r in records if (getattr(r.status, 'value', r.status).lower() == 'leave'))
+    # Counts come from the per-student attendance rollup when there is no date
+    # range; with one, from attendance_records. The per-date rollup is not
+    # used: it counts every record of an offering, including those of students
+    # no longer enrolled, and cannot be restricted to the cohort.
+    cohort = ReportCohort(department, semester, course)
+    if not (from_date or to_date):
+        query = cohort.with_attendance_summary(cohort.query(
+            db,
+            func.count(distinct(StudentCourseEnrollment.student_id)),
+            func.coalesce(func.sum(AttendanceStudentSummary.present_count), 0),
+            func.coalesce(func.sum(AttendanceStudentSummary.absent_count), 0),
+            func.coalesce(func.sum(AttendanceStudentSummary.leave_count), 0),
+        ))
+        total_students, present, absent, leave = query.one()
+    else:
+        # One aggregate query over students ⋈ enrollments ⟕ attendance records,
+        # date range in the join.
+        query = cohort.with_attendance(cohort.query(
+            db,
+            func.count(distinct(StudentCourseEnrollment.student_id)),
+            _count_where(Attendance.status == AttendanceStatusEnum.Present),
+            _count_where(Attendance.status == AttendanceStatusEnum.Absent),
+            _count_where(Attendance.status == AttendanceStatusEnum.Leave),
+        ), from_date, to_date)
+        total_students, present, absent, leave = query.one()
 
     return {
         'total_students': total_students,
-        'present': present,
-        'absent': absent,
-        'leave': leave,
+        'present': int(present),
+        'absent': int(absent),
+        'leave': int(leave),
     }
 
-def get_exam_report_detailed_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
-    # Get course info
-    course_offering = db.query(CourseOffering).filter(CourseOffering.offering_id == course).first() if course else None
-    course_id = course_offering.course_id if course_offering else ''
-    course_name = course_offering.course_rel.course_name if course_offering and course_offering.course_rel else ''
-
-    # Filter students by department/semester (join with Section for semester)
-    query = db.query(Student)
-    if department:
-        query = query.filter(Student.program == department)
-    if semester:
-        query = query.join(Section, Student.section == Section.section_name).filter(Section.semester == semester)
-    students = query.all()
-    student_ids = [s.student_id for s in students]
-
-    # Filter enrollments by offering_id
-    enrollments = db.query(StudentCourseEnrollment)
-    if course:
-        enrollments = enrollments.filter(StudentCourseEnrollment.offering_id == course)
-    enrollments = enrollments.filter(StudentCourseEnrollment.student_id.in_(student_ids)).all()
-    enrolled_student_ids = [e.student_id for e in enrollments]
-
-    # Get exam records for those students and offering
-    exam_query = db.query(ExamRecord).filter(ExamRecord.student_id.in_(enrolled_student_ids))
-    if course:
-        exam_query = exam_query.filter(ExamRecord.offering_id == course)
-    if exam_type:
-        exam_query = exam_query.filter(ExamRecord.exam_type == exam_type)
-    exams = exam_query.all()
-    exam_map = {(e.student_id): e for e in exams}
-
-    rows = []
-    for s in students:
-        if s.student_id not in enrolled_student_ids:
-            continue
-        exam = exam_map.get(s.student_id)
-        status = (exam.remarks or '').capitalize() if exam and exam.remarks else 'N/A'
-        rows.append({
-            'Student Name': f"{s.first_name} {s.last_name}",
-            'Student ID': s.student_id,
-            'Status': status,
+# Cached stats
+#
+# Result week means the same filter combinations are requested over and over;
+# these wrappers serve them from report_cache until a write touches one of the
+# offerings the cached result was computed from.
+
+def get_report_offering_ids(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str]):
+    """
+    Returns the offering IDs a report over this cohort reads from.
+    """
+    return ReportCohort(department, semester, course).offering_ids(db)
+
+def get_cached_exam_report_stats(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
+    filters = normalize_filters(department=department, semester=semester, course=course, exam_type=exam_type)
+    args = dict(filters)
+    return report_cache.get_or_compute(
+        ('exam',) + filters,
+        lambda: get_exam_report_stats(on_primary(db), **args),
+        lambda: get_report_offering_ids(on_primary(db), args['department'], args['semester'], args['course']),
+        cohort_wide=not args['course'],
+    )
+
+def get_cached_attendance_report_stats(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
+    filters = normalize_filters(department=department, semester=semester, course=course, from_date=from_date, to_date=to_date)
+    args = dict(filters)
+    return report_cache.get_or_compute(
+        ('attendance',) + filters,
+        lambda: get_attendance_report_stats(on_primary(db), **args),
+        lambda: get_report_offering_ids(on_primary(db), args['department'], args['semester'], args['course']),
+        cohort_wide=not args['course'],
+    )
+
+# Detailed report rows
+#
+# The iter_* builders read from a server-side cursor (yield_per) ordered by
+# student, so rows can be written out as they arrive without holding the
+# whole cohort in memory. The get_*_detailed_rows wrappers keep the list API.
+
+EXAM_REPORT_COLUMNS = ['Department', 'Semester', 'Course ID', 'Course Name', 'Exam Type', 'Student Name', 'Student ID', 'Status']
+ATTENDANCE_REPORT_COLUMNS = ['Student Name', 'Student ID', 'Course Name', 'Course ID', 'Department', 'Semester']
+REPORT_STREAM_BATCH_SIZE = 1000
+# Attendance tuples (student x date) fetched and pivoted per batch
+ATTENDANCE_PIVOT_BATCH_ROWS = 50000
+
+def get_report_course_info(db: Session, course: Optional[str]):
+    """
+    Returns (course_id, course_name) for the offering a report is filtered by,
+    or ('', '') when no offering filter is set.
+    """
+    if not course:
+        return '', ''
+    row = (
+        db.query(CourseOffering.course_id, Course.course_name)
+        .outerjoin(Course, CourseOffering.course_id == Course.course_id)
+        .filter(CourseOffering.offering_id == course)
+        .first()
+    )
+    if not row:
+        return '', ''
+    return row.course_id, row.course_name or ''
+
+def iter_exam_report_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
+    course_id, course_name = get_report_course_info(db, course)
+
+    cohort = ReportCohort(department, semester, course)
+    query = cohort.with_exam_records(
+        cohort.query(db, Student.student_id, Student.first_name, Student.last_name, ExamRecord.remarks), exam_type
+    )
+    query = query.order_by(Student.student_id, ExamRecord.id).yield_per(REPORT_STREAM_BATCH_SIZE)
+
+    # One output row per student; the latest exam record wins
+    for student_id, group in groupby(query, key=itemgetter(0)):
+        *_, (_, first_name, last_name, remarks) = group
+        yield {
+            'Student Name': f"{first_name} {last_name}",
+            'Student ID': student_id,
+            'Status': remarks.capitalize() if remarks else 'N/A',
             'Course Name': course_name,
             'Course ID': course_id,
             'Department': department,
             'Semester': semester,
             'Exam Type': exam_type
-        })
-    return rows
+        }
 
-def get_attendance_report_detailed_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
-    # Get course info with eager loading
-    course_offering = (
-        db.query(CourseOffering)
-        .options(joinedload(CourseOffering.course_rel))
-        .filter(CourseOffering.offering_id == course)
-        .first()
-    ) if course else None
-    course_id = course_offering.course_id if course_offering else ''
-    course_name = course_offering.course_rel.course_name if course_offering and course_offering.course_rel else ''
-
-    # Filter students by department/semester (join with Section for semester)
-    query = db.query(Student)
-    if department:
-        query = query.filter(Student.program == department)
-    if semester:
-        query = query.join(Section, Student.section == Section.section_name).filter(Section.semester == semester)
-    students = query.all()
-    student_ids = [s.student_id for s in students]
-
-    # Filter enrollments by offering_id
-    enrollments = db.query(StudentCourseEnrollment)
-    if course:
-        enrollments = enrollments.filter(StudentCourseEnrollment.offering_id == course)
-    enrollments = enrollments.filter(StudentCourseEnrollment.student_id.in_(student_ids)).all()
-    enrolled_student_ids = [e.student_id for e in enrollments]
-
-    # Get attendance records for those students and offering
-    attendance_query = db.query(Attendance).filter(Attendance.student_id.in_(enrolled_student_ids))
-    if course:
-        attendance_query = attendance_query.filter(Attendance.offering_id == course)
-    if from_date:
-        attendance_query = attendance_query.filter(Attendance.attendance_date >= from_date)
-    if to_date:
-        attendance_query = attendance_query.filter(Attendance.attendance_date <= to_date)
-    records = attendance_query.all()
-
-    # Build a map: (student_id, date) -> status
-    att_map = {}
-    for r in records:
-        att_map[(r.student_id, r.attendance_date)] = getattr(r.status, 'value', r.status)
-
-    # Build date range columns
+def get_exam_report_detailed_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
+    return list(iter_exam_report_rows(db, department, semester, course, exam_type))
+
+def get_attendance_report_dates(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
+    """
+    Returns the date columns of the attendance matrix: every day in the range
+    when both bounds are given, otherwise the distinct dates that have records.
+    """
     if from_date and to_date:
         start = datetime.strptime(from_date, '%Y-%m-%d').date()
         end = datetime.strptime(to_date, '%Y-%m-%d').date()
-        date_list = [(start + timedelta(days=x)) for x in range((end - start).days + 1)]
-    else:
-        date_list = sorted(list(set(r.attendance_date for r in records)))
-
-    rows = []
-    for s in students:
-        if s.student_id not in enrolled_student_ids:
-            continue
-        row = {
-            'Student Name': f"{s.first_name} {s.last_name}",
-            'Student ID': s.student_id,
+        return [(start + timedelta(days=x)) for x in range((end - start).days + 1)]
+
+    cohort = ReportCohort(department, semester, course)
+    query = cohort.with_attendance(cohort.query(db, Attendance.attendance_date), from_date, to_date, outer=False)
+    return [d for (d,) in query.distinct().order_by(Attendance.attendance_date)]
+
+def iter_attendance_report_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str], dates=None):
+    """
+    Streams one row per enrolled student with a status column per date.
+
+    (student_id, date, status) tuples are read in student order and pivoted
+    ATTENDANCE_PIVOT_BATCH_ROWS at a time (crud/admin/attendance_matrix.py),
+    so each batch is one vectorized scatter instead of a lookup per cell.
+    """
+    course_id, course_name = get_report_course_info(db, course)
+    if dates is None:
+        dates = get_attendance_report_dates(db, department, semester, course, from_date, to_date)
+    # Format the date columns once rather than per cell
+    date_columns = [d.strftime('%Y-%m-%d') for d in dates]
+
+    # Raw status strings (type_coerce skips the per-value enum conversion),
+    # fetched on the Core connection in large partitions rather than as ORM rows
+    cohort = ReportCohort(department, semester, course)
+    query = cohort.with_attendance(
+        cohort.query(db, Student.student_id, Attendance.attendance_date, type_coerce(Attendance.status, String), Student.first_name, Student.last_name),
+        from_date, to_date
+    )
+    statement = query.order_by(Student.student_id, Attendance.attendance_date).statement
+    result = db.connection().execute(statement.execution_options(yield_per=ATTENDANCE_PIVOT_BATCH_ROWS))
+
+    columns = ['student_id', 'attendance_date', 'status', 'first_name', 'last_name']
+    for frame in attendance_matrix.iter_student_frames(result.partitions(), columns):
+        first_rows, cells = attendance_matrix.pivot_attendance(frame['student_id'], frame['attendance_date'], frame['status'], dates)
+        students = frame.iloc[first_rows]
+        for student_id, first_name, last_name, student_cells in zip(students['student_id'], students['first_name'], students['last_name'], cells):
+            row = {
+                'Student Name': f"{first_name} {last_name}",
+                'Student ID': student_id,
+                'Course Name': course_name,
+                'Course ID': course_id,
+                'Department': department,
+                'Semester': semester,
+            }
+            row.update(zip(date_columns, student_cells))
+            yield row
+
+def get_attendance_report_detailed_rows(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
+    return list(iter_attendance_report_rows(db, department, semester, course, from_date, to_date))
+
+# Export specs shared by the synchronous export and the report jobs:
+# file name, sheet, column order, the filter row written under the header,
+# and the streamed data rows.
+
+def get_exam_report_export(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], exam_type: Optional[str]):
+    course_id, course_name = get_report_course_info(db, course)
+    return {
+        'name': 'exam_report',
+        'sheet_name': 'Exam Report',
+        'columns': EXAM_REPORT_COLUMNS,
+        'filter_row': {
+            'Department': department,
+            'Semester': semester,
+            'Course ID': course_id or course,
             'Course Name': course_name,
-            'Course ID': course_id,
+            'Exam Type': exam_type
+        },
+        'rows': iter_exam_report_rows(db, department, semester, course, exam_type),
+    }
+
+def get_attendance_report_export(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str], from_date: Optional[str], to_date: Optional[str]):
+    course_id, course_name = get_report_course_info(db, course)
+    dates = get_attendance_report_dates(db, department, semester, course, from_date, to_date)
+    return {
+        'name': 'attendance_report',
+        'sheet_name': 'Attendance Report',
+        'columns': ATTENDANCE_REPORT_COLUMNS + [d.strftime('%Y-%m-%d') for d in dates] + ['From Date', 'To Date'],
+        # Filter row spans all columns, like the data rows
+        'filter_row': {
             'Department': department,
             'Semester': semester,
-        }
-        for d in date_list:
-            row[d.strftime('%Y-%m-%d')] = att_map.get((s.student_id, d), '')
-        rows.append(row)
-    return rows 
\ No newline at end of file
+            'Course ID': course_id or course,
+            'Course Name': course_name,
+            'From Date': from_date,
+            'To Date': to_date
+        },
+        'rows': iter_attendance_report_rows(db, department, semester, course, from_date, to_date, dates=dates),
+    }
+
+def count_report_students(db: Session, department: Optional[str], semester: Optional[str], course: Optional[str]) -> int:
+    """
+    Number of rows a detailed export will contain (one per enrolled student).
+    """
+    return ReportCohort(department, semester, course).count_students(db)
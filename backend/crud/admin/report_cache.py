@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+REPORT_CACHE_TTL_SECONDS = float(os.getenv("LMS_REPORT_CACHE_TTL", "300"))
+REPORT_CACHE_MAX_ENTRIES = int(os.getenv("LMS_REPORT_CACHE_MAX_ENTRIES", "256"))
+
+def normalize_filters(**filters) -> tuple:
+    """
+    Turns report query parameters into a hashable key: blank strings become None,
+    text is trimmed, and exam types are lowercased like ExamTypeEnum. Callers
+    compute the report from dict(key) too, so equal keys mean equal queries.
+    """
+    normalized = []
+    for name in sorted(filters):
+        value = filters[name]
+        if isinstance(value, str):
+            value = value.strip() or None
+            if value is not None and name == "exam_type":
+                value = value.lower()
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "offering_ids", "cohort_wide")
+
+    def __init__(self, value, expires_at: float, offering_ids: frozenset, cohort_wide: bool):
+        self.value = value
+        self.expires_at = expires_at
+        self.offering_ids = offering_ids
+        self.cohort_wide = cohort_wide
+
+
+class ReportCache:
+    """
+    In-process LRU cache for report results with a per-entry TTL.
+
+    Each entry remembers the offerings its result was computed from, so writes
+    only drop the entries they can affect:
+      - exam/attendance writes on offering X drop entries that read X;
+      - enrollment writes on X also drop cohort-wide entries (no course filter),
+        since a new enrollment can change which offerings a cohort spans.
+    A generation counter stops a computation that overlapped a write from
+    storing its (possibly stale) result.
+    """
+
+    def __init__(self, max_entries: int = REPORT_CACHE_MAX_ENTRIES, ttl_seconds: float = REPORT_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key: tuple, compute: Callable, offering_ids: Callable[[], Iterable[int]], cohort_wide: bool):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        value = compute()
+        entry = _Entry(value, time.monotonic() + self.ttl_seconds, frozenset(offering_ids()), cohort_wide)
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate_offering(self, offering_id: Optional[int], enrollment: bool = False):
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key for key, entry in self._entries.items()
+                if offering_id in entry.offering_ids or (enrollment and entry.cohort_wide)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+report_cache = ReportCache()
+
+def invalidate_offering(offering_id: Optional[int], enrollment: bool = False):
+    report_cache.invalidate_offering(int(offering_id) if offering_id is not None else None, enrollment=enrollment)
@@ -0,0 +1,189 @@
+import csv
+import io
+import json
+import tempfile
+from typing import Iterable, List, Optional
+
+import xlsxwriter
+
+XLSX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_CHUNK_SIZE = 64 * 1024
+EXPORT_BATCH_ROWS = 1000
+
+# Supported export formats. xlsx keeps the filter row under the header (as the
+# admin UI download always has); the tabular formats carry data rows only,
+# since their consumers are scripts. Parquet stores the filters as file metadata.
+EXPORT_FORMATS = {
+    'xlsx': {'media_type': XLSX_MEDIA_TYPE, 'extension': 'xlsx'},
+    'csv': {'media_type': 'text/csv', 'extension': 'csv'},
+    'ndjson': {'media_type': 'application/x-ndjson', 'extension': 'ndjson'},
+    'parquet': {'media_type': 'application/vnd.apache.parquet', 'extension': 'parquet'},
+}
+EXPORT_FORMAT_PATTERN = '^(' + '|'.join(EXPORT_FORMATS) + ')$'
+
+def write_report_xlsx(target, sheet_name: str, columns: List[str], filter_row: dict, rows: Iterable[dict]):
+    """
+    Writes a report workbook row by row using xlsxwriter's constant_memory mode:
+    each row is flushed to disk as soon as the next one starts, so memory use
+    does not grow with the number of rows. Layout matches the previous pandas
+    export: a header row, the filter row, then one row per student.
+    """
+    workbook = xlsxwriter.Workbook(target, {'constant_memory': True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({'bold': True, 'border': 1})
+
+    worksheet.write_row(0, 0, columns, header_format)
+    worksheet.write_row(1, 0, [filter_row.get(column) for column in columns])
+    for row_index, row in enumerate(rows, start=2):
+        worksheet.write_row(row_index, 0, [row.get(column) for column in columns])
+    workbook.close()
+
+def iter_report_csv(columns: List[str], rows: Iterable[dict]):
+    """
+    Yields the report as UTF-8 CSV, one chunk per EXPORT_BATCH_ROWS rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([row.get(column) for column in columns])
+        if count % EXPORT_BATCH_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+def iter_report_ndjson(columns: List[str], rows: Iterable[dict]):
+    """
+    Yields the report as newline-delimited JSON objects, batched like the CSV output.
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({column: row.get(column) for column in columns}, default=str))
+        if len(lines) == EXPORT_BATCH_ROWS:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that hands out what was written since the last drain().
+    tell() keeps counting across drains, since the Parquet footer records
+    absolute row group offsets.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def iter_report_parquet(columns: List[str], filter_row: dict, rows: Iterable[dict]):
+    """
+    Yields the report as Parquet, one row group per EXPORT_BATCH_ROWS rows, each
+    sent as soon as it is written, then the footer. Only a single batch is held
+    in memory. Every column is a nullable string.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    metadata = {f'filter.{name}': str(value) for name, value in filter_row.items() if value is not None}
+    schema = pa.schema([pa.field(column, pa.string()) for column in columns], metadata=metadata)
+
+    def to_batch(batch):
+        return pa.RecordBatch.from_arrays(
+            [pa.array([_to_text(row.get(column)) for row in batch], type=pa.string()) for column in columns],
+            schema=schema,
+        )
+
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == EXPORT_BATCH_ROWS:
+                writer.write_batch(to_batch(batch))
+                batch = []
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        if batch:
+            writer.write_batch(to_batch(batch))
+    yield sink.drain()
+
+def _to_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+def write_report(fmt: str, target, export: dict):
+    """
+    Writes an export spec (see crud/admin/report.get_*_report_export) to a binary file object.
+    """
+    if fmt == 'xlsx':
+        write_report_xlsx(target, export['sheet_name'], export['columns'], export['filter_row'], export['rows'])
+    else:
+        for chunk in iter_report_chunks(fmt, export):
+            target.write(chunk)
+
+def iter_report_chunks(fmt: str, export: dict):
+    """
+    Yields the export as bytes. CSV, NDJSON and Parquet are produced from the
+    row iterator as it is read. XLSX is a zip archive that xlsxwriter only
+    assembles when the workbook is closed, so it is written to an anonymous
+    temporary file and then read back in chunks: its first bytes come after the
+    whole workbook is built. That build runs when the body is first read, so
+    the response headers still go out at once.
+    """
+    if fmt == 'csv':
+        return iter_report_csv(export['columns'], export['rows'])
+    if fmt == 'ndjson':
+        return iter_report_ndjson(export['columns'], export['rows'])
+    if fmt == 'parquet':
+        return iter_report_parquet(export['columns'], export['filter_row'], export['rows'])
+    return _iter_built_file(fmt, export)
+
+def _iter_built_file(fmt: str, export: dict):
+    yield from iter_file_chunks(build_report_file(fmt, export))
+
+def build_report_file(fmt: str, export: dict):
+    """
+    Writes the export into an anonymous temporary file and returns it
+    rewound, ready to be streamed. The file is removed when closed.
+    """
+    output = tempfile.TemporaryFile(suffix='.' + EXPORT_FORMATS[fmt]['extension'])
+    try:
+        write_report(fmt, output, export)
+    except Exception:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+def iter_file_chunks(fileobj, chunk_size: Optional[int] = None):
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    try:
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fileobj.close()
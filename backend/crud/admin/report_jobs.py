@@ -0,0 +1,169 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from database import SessionLocal
+from crud.admin import report as crud_report
+from crud.admin import report_export
+from crud.admin.report_cache import normalize_filters
+
+logger = logging.getLogger(__name__)
+
+REPORT_JOB_DIR = os.getenv("LMS_REPORT_JOB_DIR", "report_exports")
+REPORT_JOB_WORKERS = int(os.getenv("LMS_REPORT_JOB_WORKERS", "2"))
+REPORT_JOB_RETENTION_SECONDS = float(os.getenv("LMS_REPORT_JOB_RETENTION", "3600"))
+
+# Filters each report type understands; anything else is ignored so it
+# cannot split the de-duplication key.
+REPORT_JOB_FILTERS = {
+    "exam": ("department", "semester", "course", "exam_type"),
+    "attendance": ("department", "semester", "course", "from_date", "to_date"),
+}
+
+
+class ReportJob:
+    def __init__(self, job_id: str, report_type: str, fmt: str, filters: dict, key: tuple):
+        self.job_id = job_id
+        self.report_type = report_type
+        self.format = fmt
+        self.filters = filters
+        self.key = key
+        self.status = "queued"
+        self.rows_written = 0
+        self.total_rows: Optional[int] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.finished_monotonic: Optional[float] = None
+        self.file_path: Optional[str] = None
+        self.filename: Optional[str] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == "completed":
+            return 1.0
+        if not self.total_rows:
+            return 0.0
+        return round(min(self.rows_written / self.total_rows, 1.0), 4)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "report_type": self.report_type,
+            "format": self.format,
+            "status": self.status,
+            "progress": self.progress,
+            "rows_written": self.rows_written,
+            "total_rows": self.total_rows,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ReportJobManager:
+    """
+    Runs detailed report exports on a bounded thread pool, outside the request.
+
+    Each job opens its own database session, streams rows from the same
+    builders as the synchronous export (crud/admin/report.py) into a file
+    on disk in the requested format, and tracks progress against the expected row count. A job with
+    the same report type, format and normalized filters as one still queued or running
+    is not started twice; the existing job is returned instead. Finished jobs
+    and their files are pruned after REPORT_JOB_RETENTION_SECONDS.
+    """
+
+    def __init__(self, max_workers: int = REPORT_JOB_WORKERS, job_dir: str = REPORT_JOB_DIR, retention_seconds: float = REPORT_JOB_RETENTION_SECONDS):
+        self.job_dir = job_dir
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-job")
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, report_type: str, fmt: str, filters: dict) -> ReportJob:
+        # The job runs on the same normalized filters its dedup key is built from
+        normalized = normalize_filters(**{name: filters.get(name) for name in REPORT_JOB_FILTERS[report_type]})
+        key = (report_type, fmt) + normalized
+        filters = dict(normalized)
+        with self._lock:
+            self._prune()
+            job_id = self._in_flight.get(key)
+            if job_id is not None:
+                return self._jobs[job_id]
+            job = ReportJob(uuid.uuid4().hex, report_type, fmt, filters, key)
+            self._jobs[job.job_id] = job
+            self._in_flight[key] = job.job_id
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _prune(self):
+        cutoff = time.monotonic() - self.retention_seconds
+        expired = [
+            job for job in self._jobs.values()
+            if job.finished_monotonic is not None and job.finished_monotonic < cutoff
+        ]
+        for job in expired:
+            del self._jobs[job.job_id]
+            if job.file_path and os.path.exists(job.file_path):
+                os.remove(job.file_path)
+
+    def _build_export(self, db, job: ReportJob) -> dict:
+        f = job.filters
+        if job.report_type == "exam":
+            return crud_report.get_exam_report_export(db, f["department"], f["semester"], f["course"], f["exam_type"])
+        return crud_report.get_attendance_report_export(db, f["department"], f["semester"], f["course"], f["from_date"], f["to_date"])
+
+    def _track_rows(self, job: ReportJob, rows):
+        for row in rows:
+            yield row
+            job.rows_written += 1
+
+    def _run(self, job: ReportJob):
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        os.makedirs(self.job_dir, exist_ok=True)
+        extension = report_export.EXPORT_FORMATS[job.format]["extension"]
+        file_path = os.path.join(self.job_dir, f"{job.job_id}.{extension}")
+        partial_path = file_path + ".part"
+        db = SessionLocal()
+        try:
+            job.total_rows = crud_report.count_report_students(db, job.filters["department"], job.filters["semester"], job.filters["course"])
+            export = self._build_export(db, job)
+            export["rows"] = self._track_rows(job, export["rows"])
+            with open(partial_path, "wb") as output:
+                report_export.write_report(job.format, output, export)
+            os.replace(partial_path, file_path)
+            job.file_path = file_path
+            job.filename = f"{export['name']}.{extension}"
+            job.status = "completed"
+        except Exception as e:
+            logger.exception(f"Report job {job.job_id} failed")
+            job.status = "failed"
+            job.error = str(e)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        finally:
+            db.close()
+            job.finished_at = datetime.utcnow()
+            job.finished_monotonic = time.monotonic()
+            with self._lock:
+                if self._in_flight.get(job.key) == job.job_id:
+                    del self._in_flight[job.key]
+
+
+report_jobs = ReportJobManager()
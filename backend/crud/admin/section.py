@@ -1,50 +1,58 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.admin.section import Section
 from models.admin.course_offerings import CourseOffering  # Import CourseOffering model
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+from crud.search import SEARCH_LIMIT_DEFAULT, section_index
+
+_SECTION_BY_NAME = lookup_statement(Section, Section.section_name)
+
 
 # CREATE section
 def create_section(db: Session, section_data: dict):
     section = Section(**section_data)
     db.add(section)
     db.commit()
-    db.refresh(section)
+    section_index.upsert(db, section)
     return section
 
 # GET all sections
-def get_sections(db: Session):
-    return db.query(Section).all()
+def get_sections(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(Section), Keyset(Section.section_name), page)
 
-# SEARCH section by name 
-def search_section(db: Session, keyword: str):
-    return db.query(Section).filter(
-        (Section.section_name.ilike(f"%{keyword}%")) 
-    ).all()
+# SEARCH section by name, best matches first (crud/search.py)
+def search_section(db: Session, keyword: str, limit: int = SEARCH_LIMIT_DEFAULT):
+    return section_index.search(db, keyword, limit)
 
 def get_section_by_name(db: Session, section_name: str):
-    return db.query(Section).filter(Section.section_name == section_name).first()
+    return fetch_one(db, _SECTION_BY_NAME, section_name)
 
 
 # UPDATE section
 def update_section(db: Session, section_name: str, updated_data: dict):
-    section = db.query(Section).filter(Section.section_name == section_name).first()
+    section = fetch_one(db, _SECTION_BY_NAME, section_name)
     if section:
         for key, value in updated_data.items():
             setattr(section, key, value)
         db.commit()
-        db.refresh(section)
+        section_index.upsert(db, section)
         return section
     return None
 
 # DELETE section
 def delete_section(db: Session, section_name: str):
-    section = db.query(Section).filter(Section.section_name == section_name).first()
+    section = fetch_one(db, _SECTION_BY_NAME, section_name)
     if section:
         # Delete all course offerings associated with this section first
         db.query(CourseOffering).filter(CourseOffering.section_name == section_name).delete()
         db.delete(section)
         db.commit()
+        section_index.remove(db, section_name)
         return True
     return False
 
-def get_sections_by_department_semester(db: Session, department: str, semester: str):
-    return db.query(Section).filter(Section.department == department, Section.semester == semester).all()
+def get_sections_by_department_semester(db: Session, department: str, semester: str, page: Optional[PageParams] = None) -> Page:
+    statement = select(Section).where(Section.department == department, Section.semester == semester)
+    return paginate(db, statement, Keyset(Section.section_name), page)
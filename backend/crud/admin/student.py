@@ -1,32 +1,40 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from models.admin.student import Student
 from models.admin.course_offerings import CourseOffering
 from models.admin.section import Section
 from models.admin.student_enrollment import StudentCourseEnrollment
 from typing import List, Optional
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+from crud.search import SEARCH_LIMIT_DEFAULT, student_index
+from crud.admin.report_cache import invalidate_offering
+from crud.instructor.grade_distribution import invalidate_grade_distribution
+
+# Student columns that decide which report cohorts the student falls in
+COHORT_FIELDS = ("student_id", "program", "section")
+
+_STUDENT_BY_ID = lookup_statement(Student, Student.student_id)
+
 
 # CREATE student
 def create_student(db: Session, student_data: dict):
     student = Student(**student_data)
     db.add(student)
     db.commit()
-    db.refresh(student)
+    student_index.upsert(db, student)
     return student
 
 # GET all students
-def get_students(db: Session):
-    return db.query(Student).all()
-
-# SEARCH student by name or ID
-def search_student(db: Session, keyword: str):
-    return db.query(Student).filter(
-        (Student.student_id.ilike(f"%{keyword}%")) |
-        (Student.first_name.ilike(f"%{keyword}%")) |
-        (Student.last_name.ilike(f"%{keyword}%"))
-    ).all()
+def get_students(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(Student), Keyset(Student.student_id), page)
+
+# SEARCH student by name or ID, best matches first (crud/search.py)
+def search_student(db: Session, keyword: str, limit: int = SEARCH_LIMIT_DEFAULT):
+    return student_index.search(db, keyword, limit)
 
 def get_student_by_id(db: Session, student_id: str):
-    return db.query(Student).filter(Student.student_id == student_id).first()
+    return fetch_one(db, _STUDENT_BY_ID, student_id)
 
 def get_students_by_offering_id(db: Session, offering_id: int) -> List[Student]:
     # Only return students actually enrolled in the given offering
@@ -37,22 +45,42 @@ def get_students_by_offering_id(db: Session, offering_id: int) -> List[Student]:
     ).all()
     return students
 
+def _enrolled_offering_ids(db: Session, student_id: str) -> List[int]:
+    return db.execute(
+        select(StudentCourseEnrollment.offering_id).where(StudentCourseEnrollment.student_id == student_id)
+    ).scalars().all()
+
+def _invalidate_reports(offering_ids: List[int], grades: bool = False):
+    # The student's enrollments change which cohorts they count in, like an
+    # enrollment write: drop the entries of their offerings and the cohort-wide ones
+    for offering_id in offering_ids:
+        invalidate_offering(offering_id, enrollment=True)
+        if grades:
+            invalidate_grade_distribution(offering_id)
+
 # UPDATE student
 def update_student(db: Session, student_id: str, updated_data: dict):
-    student = db.query(Student).filter(Student.student_id == student_id).first()
+    student = fetch_one(db, _STUDENT_BY_ID, student_id)
     if student:
+        moved = any(key in COHORT_FIELDS and getattr(student, key) != value for key, value in updated_data.items())
+        offering_ids = _enrolled_offering_ids(db, student_id) if moved else []
         for key, value in updated_data.items():
             setattr(student, key, value)
         db.commit()
-        db.refresh(student)
+        student_index.upsert(db, student, old_key=student_id)
+        _invalidate_reports(offering_ids)
         return student
     return None
 
 # DELETE student
 def delete_student(db: Session, student_id: str):
-    student = db.query(Student).filter(Student.student_id == student_id).first()
+    student = fetch_one(db, _STUDENT_BY_ID, student_id)
     if student:
+        # Enrollments, attendance and exam records go with the student (ON DELETE CASCADE)
+        offering_ids = _enrolled_offering_ids(db, student_id)
         db.delete(student)
         db.commit()
+        student_index.remove(db, student_id)
+        _invalidate_reports(offering_ids, grades=True)
         return True
     return False
@@ -1,3 +1,5 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import date
@@ -6,6 +8,12 @@ from models.admin.student_enrollment import StudentCourseEnrollment, StudentCour
 from models.admin.course_offerings import CourseOffering
 from models.admin.course import Course
 from models.admin.instructor import Instructor
+from crud.admin.report_cache import invalidate_offering
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate, paginate_async
+
+_ENROLLMENT_BY_ID = lookup_statement(StudentCourseEnrollment, StudentCourseEnrollment.enrollment_id)
+
 
 def create_student_enrollment(db: Session, enrollment: StudentCourseEnrollmentCreate) -> StudentCourseEnrollment:
     db_enrollment = StudentCourseEnrollment(
@@ -16,58 +24,78 @@ def create_student_enrollment(db: Session, enrollment: StudentCourseEnrollmentCr
     )
     db.add(db_enrollment)
     db.commit()
-    db.refresh(db_enrollment)
+    invalidate_offering(enrollment.offering_id, enrollment=True)
     return db_enrollment
 
 def bulk_create_student_enrollments(db: Session, offering_id: int, student_ids: List[str]) -> List[StudentCourseEnrollment]:
-    new_enrollments = []
-    for student_id in student_ids:
-        enrollment = StudentCourseEnrollment(
-            student_id=student_id,
-            offering_id=offering_id,
-            enrollment_date=date.today(),
-            grade=None # Grade is initially null
+    # One executemany INSERT without RETURNING (MySQL has none), then one SELECT
+    # for the new rows by the unique (student, offering) pair. The offering
+    # the response nests is loaded in the same query, so the cost does not
+    # grow with the number of students.
+    if not student_ids:
+        return []
+    today = date.today()
+    db.execute(insert(StudentCourseEnrollment), [
+        {"student_id": student_id, "offering_id": offering_id, "enrollment_date": today, "grade": None} # Grade is initially null
+        for student_id in student_ids
+    ])
+    new_enrollments = db.execute(
+        select(StudentCourseEnrollment)
+        .where(StudentCourseEnrollment.offering_id == offering_id, StudentCourseEnrollment.student_id.in_(student_ids))
+        .options(
+            joinedload(StudentCourseEnrollment.offering_rel).joinedload(CourseOffering.course_rel),
+            joinedload(StudentCourseEnrollment.offering_rel).joinedload(CourseOffering.instructor_rel),
         )
-        db.add(enrollment)
-        new_enrollments.append(enrollment)
+    ).scalars().all()
     db.commit()
-    for enrollment in new_enrollments:
-        db.refresh(enrollment)
-    return new_enrollments
+    invalidate_offering(offering_id, enrollment=True)
+    position = {student_id: i for i, student_id in enumerate(student_ids)}
+    return sorted(new_enrollments, key=lambda enrollment: position[enrollment.student_id])
 
-def get_all_enrollments(db: Session) -> List[StudentCourseEnrollment]:
-    return db.query(StudentCourseEnrollment).all()
+def get_all_enrollments(db: Session, page: Optional[PageParams] = None) -> Page:
+    return paginate(db, select(StudentCourseEnrollment), Keyset(StudentCourseEnrollment.enrollment_id), page)
 
 def get_enrollment_by_id(db: Session, enrollment_id: int) -> Optional[StudentCourseEnrollment]:
-    return db.query(StudentCourseEnrollment).filter(StudentCourseEnrollment.enrollment_id == enrollment_id).first()
+    return fetch_one(db, _ENROLLMENT_BY_ID, enrollment_id)
 
-def get_enrollments_by_student_id(db: Session, student_id: str) -> List[StudentCourseEnrollment]:
-    return db.query(StudentCourseEnrollment)\
-        .filter(StudentCourseEnrollment.student_id == student_id)\
+def _enrollments_by_student_query(student_id: str):
+    # Everything StudentCourseEnrollmentResponse serializes is loaded up front,
+    # which the async variant requires (no lazy loads on an AsyncSession)
+    return select(StudentCourseEnrollment)\
+        .where(StudentCourseEnrollment.student_id == student_id)\
         .options(\
             joinedload(StudentCourseEnrollment.offering_rel)
             .joinedload(CourseOffering.course_rel),
             joinedload(StudentCourseEnrollment.offering_rel)
             .joinedload(CourseOffering.instructor_rel)
-        )\
-        .all()
+        )
+
+def get_enrollments_by_student_id(db: Session, student_id: str) -> List[StudentCourseEnrollment]:
+    return db.execute(_enrollments_by_student_query(student_id)).unique().scalars().all()
+
+async def get_enrollments_by_student_id_async(db: AsyncSession, student_id: str, page: Optional[PageParams] = None) -> Page:
+    return await paginate_async(db, _enrollments_by_student_query(student_id), Keyset(StudentCourseEnrollment.enrollment_id), page)
 
-def get_enrollments_by_offering_id(db: Session, offering_id: int) -> List[StudentCourseEnrollment]:
-    return db.query(StudentCourseEnrollment).filter(StudentCourseEnrollment.offering_id == offering_id).all()
+def get_enrollments_by_offering_id(db: Session, offering_id: int, page: Optional[PageParams] = None) -> Page:
+    statement = select(StudentCourseEnrollment).where(StudentCourseEnrollment.offering_id == offering_id)
+    return paginate(db, statement, Keyset(StudentCourseEnrollment.enrollment_id), page)
 
 def update_student_enrollment(db: Session, enrollment_id: int, enrollment_update: StudentCourseEnrollmentUpdate) -> Optional[StudentCourseEnrollment]:
-    db_enrollment = db.query(StudentCourseEnrollment).filter(StudentCourseEnrollment.enrollment_id == enrollment_id).first()
+    db_enrollment = fetch_one(db, _ENROLLMENT_BY_ID, enrollment_id)
     if db_enrollment:
         for key, value in enrollment_update.dict(exclude_unset=True).items():
             setattr(db_enrollment, key, value)
+        offering_id = db_enrollment.offering_id
         db.commit()
-        db.refresh(db_enrollment)
+        invalidate_offering(offering_id, enrollment=True)
     return db_enrollment
 
 def delete_student_enrollment(db: Session, enrollment_id: int) -> bool:
-    db_enrollment = db.query(StudentCourseEnrollment).filter(StudentCourseEnrollment.enrollment_id == enrollment_id).first()
+    db_enrollment = fetch_one(db, _ENROLLMENT_BY_ID, enrollment_id)
     if db_enrollment:
         db.delete(db_enrollment)
+        offering_id = db_enrollment.offering_id
         db.commit()
+        invalidate_offering(offering_id, enrollment=True)
         return True
     return False 
\ No newline at end of file
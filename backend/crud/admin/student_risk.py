@@ -0,0 +1,190 @@
+import os
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Float, and_, case, cast, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from models.admin.student import Student
+from models.admin.course_offerings import CourseOffering
+from models.admin.student_enrollment import StudentCourseEnrollment
+from models.admin.student_risk import StudentRiskSnapshot
+from models.instructor.exam_records import ExamRecord
+from models.instructor.attendance_summary import AttendanceStudentSummary
+
+# Risk configuration. A student is flagged on attendance below
+# RISK_ATTENDANCE_THRESHOLD percent or exam marks below RISK_EXAM_THRESHOLD
+# percent; each shortfall is scaled to 0..1 (how far below the threshold) and
+# the two are combined with the weights into a 0..1 risk score.
+RISK_ATTENDANCE_THRESHOLD = float(os.getenv("LMS_RISK_ATTENDANCE_THRESHOLD", "75"))
+RISK_EXAM_THRESHOLD = float(os.getenv("LMS_RISK_EXAM_THRESHOLD", "50"))
+RISK_ATTENDANCE_WEIGHT = float(os.getenv("LMS_RISK_ATTENDANCE_WEIGHT", "0.5"))
+RISK_EXAM_WEIGHT = float(os.getenv("LMS_RISK_EXAM_WEIGHT", "0.5"))
+RISK_HIGH_SCORE = float(os.getenv("LMS_RISK_HIGH_SCORE", "0.4"))
+RISK_MEDIUM_SCORE = float(os.getenv("LMS_RISK_MEDIUM_SCORE", "0.15"))
+RISK_LEVELS = ("high", "medium", "low")
+
+SNAPSHOT_COLUMNS = [
+    "offering_id", "student_id", "student_name", "department", "course_id",
+    "attendance_percentage", "exam_percentage", "exam_percentile",
+    "risk_score", "risk_level", "offering_rank", "overall_rank", "computed_at",
+]
+
+def _shortfall(percentage, threshold: float):
+    # 0 when at or above the threshold (or no data yet), 1 at 0%
+    return case((percentage < threshold, (threshold - percentage) / threshold), else_=0.0)
+
+def risk_select(
+    offering_id: Optional[int] = None,
+    attendance_threshold: float = RISK_ATTENDANCE_THRESHOLD,
+    exam_threshold: float = RISK_EXAM_THRESHOLD,
+    attendance_weight: float = RISK_ATTENDANCE_WEIGHT,
+    exam_weight: float = RISK_EXAM_WEIGHT,
+    computed_at: Optional[datetime] = None,
+):
+    """
+    One statement scoring every enrollment (or one offering's):
+
+      enrollments ⟕ attendance_student_summary ⟕ exam marks per (student, offering)
+        -> attendance %, exam %, weighted risk score and level
+        -> window functions: rank within the offering and overall by risk,
+           percent_rank of exam % within the offering
+
+    Attendance comes from the per-student rollup, which mirrors
+    attendance_records. The columns match StudentRiskSnapshot.
+    """
+    exams = (
+        select(
+            ExamRecord.student_id,
+            ExamRecord.offering_id,
+            func.sum(ExamRecord.obtained_marks).label("obtained"),
+            func.sum(ExamRecord.total_marks).label("total"),
+        )
+        .where(ExamRecord.total_marks > 0, ExamRecord.obtained_marks.isnot(None))
+        .group_by(ExamRecord.student_id, ExamRecord.offering_id)
+    )
+    if offering_id is not None:
+        exams = exams.where(ExamRecord.offering_id == offering_id)
+    exams = exams.subquery("exams")
+
+    attended = (
+        AttendanceStudentSummary.present_count
+        + AttendanceStudentSummary.absent_count
+        + AttendanceStudentSummary.leave_count
+    )
+    attendance_percentage = case(
+        (attended > 0, cast(AttendanceStudentSummary.present_count, Float) * 100 / attended), else_=None
+    )
+    exam_percentage = case((exams.c.total > 0, cast(exams.c.obtained, Float) * 100 / exams.c.total), else_=None)
+    total_weight = (attendance_weight + exam_weight) or 1.0
+    risk_score = (
+        _shortfall(attendance_percentage, attendance_threshold) * (attendance_weight / total_weight)
+        + _shortfall(exam_percentage, exam_threshold) * (exam_weight / total_weight)
+    )
+
+    scored = (
+        select(
+            StudentCourseEnrollment.offering_id,
+            StudentCourseEnrollment.student_id,
+            (Student.first_name + " " + Student.last_name).label("student_name"),
+            Student.program.label("department"),
+            CourseOffering.course_id,
+            attendance_percentage.label("attendance_percentage"),
+            exam_percentage.label("exam_percentage"),
+            risk_score.label("risk_score"),
+        )
+        .select_from(StudentCourseEnrollment)
+        .join(Student, Student.student_id == StudentCourseEnrollment.student_id)
+        .join(CourseOffering, CourseOffering.offering_id == StudentCourseEnrollment.offering_id)
+        .outerjoin(AttendanceStudentSummary, and_(
+            AttendanceStudentSummary.student_id == StudentCourseEnrollment.student_id,
+            AttendanceStudentSummary.offering_id == StudentCourseEnrollment.offering_id,
+        ))
+        .outerjoin(exams, and_(
+            exams.c.student_id == StudentCourseEnrollment.student_id,
+            exams.c.offering_id == StudentCourseEnrollment.offering_id,
+        ))
+    )
+    if offering_id is not None:
+        scored = scored.where(StudentCourseEnrollment.offering_id == offering_id)
+    scored = scored.subquery("scored")
+
+    risk_level = case(
+        (scored.c.risk_score >= RISK_HIGH_SCORE, "high"),
+        (scored.c.risk_score >= RISK_MEDIUM_SCORE, "medium"),
+        else_="low",
+    )
+    return select(
+        scored.c.offering_id,
+        scored.c.student_id,
+        scored.c.student_name,
+        scored.c.department,
+        scored.c.course_id,
+        scored.c.attendance_percentage,
+        scored.c.exam_percentage,
+        # Students without marks get their own partition so they do not shift the others
+        case(
+            (scored.c.exam_percentage.isnot(None), func.percent_rank().over(
+                partition_by=[scored.c.offering_id, scored.c.exam_percentage.is_(None)],
+                order_by=scored.c.exam_percentage,
+            )),
+            else_=None,
+        ).label("exam_percentile"),
+        scored.c.risk_score,
+        risk_level.label("risk_level"),
+        func.rank().over(partition_by=scored.c.offering_id, order_by=scored.c.risk_score.desc()).label("offering_rank"),
+        func.rank().over(order_by=scored.c.risk_score.desc()).label("overall_rank"),
+        literal(computed_at or datetime.utcnow()).label("computed_at"),
+    )
+
+def rebuild_risk_snapshot(db: Session) -> dict:
+    """
+    Replaces student_risk_snapshot with a fresh scoring of every enrollment
+    in one INSERT ... SELECT. Meant to run nightly (scripts/snapshot_student_risk.py).
+    """
+    computed_at = datetime.utcnow().replace(microsecond=0)
+    db.query(StudentRiskSnapshot).delete(synchronize_session=False)
+    result = db.execute(
+        insert(StudentRiskSnapshot.__table__).from_select(SNAPSHOT_COLUMNS, risk_select(computed_at=computed_at))
+    )
+    db.commit()
+    return {"rows": result.rowcount, "computed_at": computed_at}
+
+def get_risk_snapshot(
+    db: Session,
+    offering_id: Optional[int] = None,
+    department: Optional[str] = None,
+    risk_level: Optional[str] = None,
+    limit: int = 50,
+) -> List[StudentRiskSnapshot]:
+    """
+    Highest-risk students from the latest snapshot, by offering, department or
+    overall; each filter is served by one of the snapshot's rank indexes.
+    """
+    query = db.query(StudentRiskSnapshot)
+    if offering_id is not None:
+        query = query.filter(StudentRiskSnapshot.offering_id == offering_id).order_by(StudentRiskSnapshot.offering_rank)
+    else:
+        if department:
+            query = query.filter(StudentRiskSnapshot.department == department)
+        query = query.order_by(StudentRiskSnapshot.overall_rank)
+    if risk_level:
+        query = query.filter(StudentRiskSnapshot.risk_level == risk_level)
+    return query.limit(limit).all()
+
+def get_live_risk(
+    db: Session,
+    offering_id: int,
+    risk_level: Optional[str] = None,
+    limit: int = 50,
+    **thresholds,
+) -> List[dict]:
+    """
+    Scores one offering on the spot, optionally with different thresholds or
+    weights than the snapshot. overall_rank is then relative to the offering.
+    """
+    ranked = risk_select(offering_id=offering_id, **thresholds).subquery("ranked")
+    query = select(ranked).order_by(ranked.c.offering_rank)
+    if risk_level:
+        query = query.where(ranked.c.risk_level == risk_level)
+    return [dict(row) for row in db.execute(query.limit(limit)).mappings()]
@@ -0,0 +1,52 @@
+from email.utils import format_datetime
+from datetime import timezone
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from database import get_db
+from database.table_versions import read_versions, version_tag
+
+# Conditional GETs for the reference data (departments, sections, courses,
+# prerequisites, offerings). A route declares the tables its response is built
+# from:
+#
+#   @router.get("/", dependencies=[reference_data("courses")])
+#
+# and answers with ETag / Last-Modified derived from their change counters
+# (database/table_versions.py). A request whose If-None-Match still matches
+# gets 304 Not Modified before the route runs, so the list query and the
+# serialization are skipped; the check itself is one primary-key read.
+# Cache-Control: no-cache makes browsers revalidate on every use instead of
+# guessing a freshness lifetime from Last-Modified. If-Modified-Since is not
+# honoured: Last-Modified has one-second resolution, so two writes within the
+# same second would look like no change.
+CONDITIONAL_HEADERS = ["ETag", "Last-Modified"]
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+    if if_none_match.strip() == "*":
+        return True
+    return any(_opaque(candidate) == _opaque(etag) for candidate in if_none_match.split(","))
+
+def reference_data(*tables: str):
+    """
+    Dependency for a GET route whose response depends only on `tables`.
+    """
+    def check_version(request: Request, response: Response, db: Session = Depends(get_db)):
+        versions = read_versions(db, tables)
+        # Weak: the same data may go out with different bytes (compression)
+        headers = {"ETag": f'W/"{version_tag(versions)}"', "Cache-Control": "no-cache"}
+        modified = [updated_at for version, updated_at in versions.values() if updated_at is not None]
+        if modified:
+            headers["Last-Modified"] = format_datetime(max(modified).replace(tzinfo=timezone.utc), usegmt=True)
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return Depends(check_version)
@@ -4,6 +4,8 @@ from typing import List, Optional
 from datetime import date
 
 from models.instructor.attendance_records import Attendance, AttendanceStatusEnum, AttendanceCreate, AttendanceUpdate
+from crud.instructor.attendance_summary import record_attendance_change
+from crud.admin.report_cache import invalidate_offering
 
 def get_attendance_records(db: Session, offering_id: int) -> List[Attendance]:
     records = db.query(Attendance).filter(Attendance.offering_id == offering_id).all()
@@ -37,8 +39,9 @@ def create_attendance_record(db: Session, attendance: AttendanceCreate) -> Atten
         status=attendance.status
     )
     db.add(db_attendance)
+    record_attendance_change(db, attendance.offering_id, attendance.student_id, attendance.attendance_date, attendance.status, +1)
     db.commit()
-    db.refresh(db_attendance)
+    invalidate_offering(attendance.offering_id)
     return db_attendance
 
 def update_attendance_record(db: Session, record_id: int, attendance: AttendanceUpdate) -> Optional[Attendance]:
@@ -46,11 +49,15 @@ def update_attendance_record(db: Session, record_id: int, attendance: Attendance
     if not db_attendance:
         return None
     
-    if attendance.status is not None:
+    if attendance.status is not None and attendance.status != db_attendance.status:
+        # Move the mark between rollup counters
+        record_attendance_change(db, db_attendance.offering_id, db_attendance.student_id, db_attendance.attendance_date, db_attendance.status, -1)
+        record_attendance_change(db, db_attendance.offering_id, db_attendance.student_id, db_attendance.attendance_date, attendance.status, +1)
         db_attendance.status = attendance.status
     
+    offering_id = db_attendance.offering_id
     db.commit()
-    db.refresh(db_attendance)
+    invalidate_offering(offering_id)
     return db_attendance
 
 def delete_attendance_record(db: Session, record_id: int) -> Optional[Attendance]:
@@ -59,5 +66,8 @@ def delete_attendance_record(db: Session, record_id: int) -> Optional[Attendance
         return None
     
     db.delete(db_attendance)
+    record_attendance_change(db, db_attendance.offering_id, db_attendance.student_id, db_attendance.attendance_date, db_attendance.status, -1)
+    offering_id = db_attendance.offering_id
     db.commit()
+    invalidate_offering(offering_id)
     return db_attendance
\ No newline at end of file
@@ -0,0 +1,119 @@
+# crud/attendance_summary.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case, insert, select
+from sqlalchemy.dialects import mysql, sqlite, postgresql
+from typing import List, Optional
+from datetime import date
+
+from models.instructor.attendance_records import Attendance, AttendanceStatusEnum
+from models.instructor.attendance_summary import AttendanceStudentSummary, AttendanceDailySummary
+
+STATUS_COLUMNS = {
+    AttendanceStatusEnum.Present: "present_count",
+    AttendanceStatusEnum.Absent: "absent_count",
+    AttendanceStatusEnum.Leave: "leave_count",
+}
+COUNT_COLUMNS = tuple(STATUS_COLUMNS.values())
+
+def _status_column(status) -> str:
+    return STATUS_COLUMNS[AttendanceStatusEnum(getattr(status, "value", status))]
+
+def _bump_counter(db: Session, model, key: dict, column: str, delta: int):
+    """
+    Adds delta to one counter of a rollup row, creating the row if needed.
+    Uses the dialect's native upsert so concurrent markers cannot race on the insert.
+    """
+    table = model.__table__
+    values = dict(key, **{name: 0 for name in COUNT_COLUMNS})
+    values[column] = max(delta, 0)
+    increment = {column: table.c[column] + delta}
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql.insert(table).values(**values).on_duplicate_key_update(**increment)
+    elif dialect in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = dialect_insert(table).values(**values).on_conflict_do_update(
+            index_elements=[c.name for c in table.primary_key.columns], set_=increment
+        )
+    else:
+        updated = db.execute(
+            table.update()
+            .where(*[table.c[name] == value for name, value in key.items()])
+            .values(**increment)
+        )
+        if updated.rowcount:
+            return
+        stmt = insert(table).values(**values)
+    db.execute(stmt)
+
+def record_attendance_change(db: Session, offering_id: int, student_id: str, attendance_date: date, status, delta: int):
+    """
+    Applies +1/-1 for one attendance mark to both rollups. Called by the attendance
+    crud before it commits, so the rollups change in the same transaction as the raw row.
+    """
+    column = _status_column(status)
+    _bump_counter(db, AttendanceStudentSummary, {"offering_id": offering_id, "student_id": student_id}, column, delta)
+    _bump_counter(db, AttendanceDailySummary, {"offering_id": offering_id, "attendance_date": attendance_date}, column, delta)
+
+def _status_sums():
+    return [
+        func.sum(case((Attendance.status == status, 1), else_=0)).label(column)
+        for status, column in STATUS_COLUMNS.items()
+    ]
+
+def rebuild_attendance_summaries(db: Session, offering_id: Optional[int] = None):
+    """
+    Recomputes both rollups from attendance_records (all offerings, or one) with
+    two INSERT ... SELECT ... GROUP BY statements.
+    """
+    for model, group_column in (
+        (AttendanceStudentSummary, Attendance.student_id),
+        (AttendanceDailySummary, Attendance.attendance_date),
+    ):
+        delete_query = db.query(model)
+        source = select(Attendance.offering_id, group_column, *_status_sums())
+        if offering_id is not None:
+            delete_query = delete_query.filter(model.offering_id == offering_id)
+            source = source.where(Attendance.offering_id == offering_id)
+        delete_query.delete(synchronize_session=False)
+        source = source.group_by(Attendance.offering_id, group_column)
+        db.execute(
+            insert(model.__table__).from_select(
+                ["offering_id", group_column.key, *COUNT_COLUMNS], source
+            )
+        )
+    db.commit()
+
+def _with_percentage(row) -> dict:
+    data = {c.name: getattr(row, c.name) for c in row.__table__.columns}
+    total = sum(data[name] for name in COUNT_COLUMNS)
+    data["attendance_percentage"] = round(data["present_count"] * 100.0 / total, 2) if total else None
+    return data
+
+def get_offering_student_summaries(db: Session, offering_id: int) -> List[dict]:
+    rows = db.query(AttendanceStudentSummary).filter(AttendanceStudentSummary.offering_id == offering_id).order_by(AttendanceStudentSummary.student_id).all()
+    return [_with_percentage(row) for row in rows]
+
+def get_offering_daily_summaries(db: Session, offering_id: int, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[dict]:
+    query = db.query(AttendanceDailySummary).filter(AttendanceDailySummary.offering_id == offering_id)
+    if start_date:
+        query = query.filter(AttendanceDailySummary.attendance_date >= start_date)
+    if end_date:
+        query = query.filter(AttendanceDailySummary.attendance_date <= end_date)
+    return [_with_percentage(row) for row in query.order_by(AttendanceDailySummary.attendance_date).all()]
+
+def _student_summaries_query(student_id: str, offering_id: Optional[int] = None):
+    query = select(AttendanceStudentSummary).where(AttendanceStudentSummary.student_id == student_id)
+    if offering_id:
+        query = query.where(AttendanceStudentSummary.offering_id == offering_id)
+    return query.order_by(AttendanceStudentSummary.offering_id)
+
+def get_student_summaries(db: Session, student_id: str, offering_id: Optional[int] = None) -> List[dict]:
+    rows = db.execute(_student_summaries_query(student_id, offering_id)).scalars().all()
+    return [_with_percentage(row) for row in rows]
+
+async def get_student_summaries_async(db: AsyncSession, student_id: str, offering_id: Optional[int] = None) -> List[dict]:
+    rows = (await db.execute(_student_summaries_query(student_id, offering_id))).scalars().all()
+    return [_with_percentage(row) for row in rows]
@@ -33,7 +33,6 @@ def create_material(db: Session, material_data: dict) -> dict:
     material = CourseMaterial(**material_data)
     db.add(material)
     db.commit()
-    db.refresh(material)
     return material.to_dict()
 
 def update_material(db: Session, material_id: int, material_data: dict) -> Optional[dict]:
@@ -45,7 +44,6 @@ def update_material(db: Session, material_id: int, material_data: dict) -> Optio
         setattr(material, key, value)
     
     db.commit()
-    db.refresh(material)
     return material.to_dict()
 
 def delete_material(db: Session, material_id: int) -> Optional[dict]:
@@ -4,6 +4,8 @@ from typing import List, Optional
 from datetime import datetime
 
 from models.instructor.exam_records import ExamRecord, ExamTypeEnum, ExamRecordCreate, ExamRecordUpdate
+from crud.admin.report_cache import invalidate_offering
+from crud.instructor.grade_distribution import invalidate_grade_distribution
 
 def get_exam_records(db: Session, offering_id: int) -> List[ExamRecord]:
     records = db.query(ExamRecord).filter(ExamRecord.offering_id == offering_id).all()
@@ -41,7 +43,8 @@ def create_exam_record(db: Session, exam_record: ExamRecordCreate) -> ExamRecord
     )
     db.add(db_exam)
     db.commit()
-    db.refresh(db_exam)
+    invalidate_offering(exam_record.offering_id)
+    invalidate_grade_distribution(exam_record.offering_id)
     return db_exam
 
 def update_exam_record(db: Session, record_id: int, exam_record: ExamRecordUpdate) -> Optional[ExamRecord]:
@@ -58,8 +61,10 @@ def update_exam_record(db: Session, record_id: int, exam_record: ExamRecordUpdat
     if exam_record.remarks is not None:
         db_exam.remarks = exam_record.remarks
     
+    offering_id = db_exam.offering_id
     db.commit()
-    db.refresh(db_exam)
+    invalidate_offering(offering_id)
+    invalidate_grade_distribution(offering_id)
     return db_exam
 
 def delete_exam_record(db: Session, record_id: int) -> Optional[ExamRecord]:
@@ -68,5 +73,8 @@ def delete_exam_record(db: Session, record_id: int) -> Optional[ExamRecord]:
         return None
     
     db.delete(db_exam)
+    offering_id = db_exam.offering_id
     db.commit()
+    invalidate_offering(offering_id)
+    invalidate_grade_distribution(offering_id)
     return db_exam
@@ -0,0 +1,126 @@
+# crud/instructor/grade_distribution.py
+import os
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import String, type_coerce
+from sqlalchemy.orm import Session
+
+from models.instructor.exam_records import ExamRecord, ExamTypeEnum
+from crud.admin.report_cache import ReportCache, normalize_filters
+from database.routing import on_primary
+
+GRADE_HISTOGRAM_BUCKETS = 10
+GRADE_PERCENTILES = (10, 25, 50, 75, 90)
+EXAM_TYPES = [exam_type.value for exam_type in ExamTypeEnum]
+
+# Distributions only change when an exam record of the offering is written,
+# so entries live until then; the TTL only covers writes made outside the API.
+grade_distribution_cache = ReportCache(
+    max_entries=int(os.getenv("LMS_GRADE_CACHE_MAX_ENTRIES", "512")),
+    ttl_seconds=float(os.getenv("LMS_GRADE_CACHE_TTL", "3600")),
+)
+
+def invalidate_grade_distribution(offering_id: Optional[int]):
+    grade_distribution_cache.invalidate_offering(int(offering_id) if offering_id is not None else None)
+
+def summarize_scores(group_codes: np.ndarray, scores: np.ndarray, n_groups: int) -> List[Optional[dict]]:
+    """
+    Distribution statistics of `scores` (obtained / total ratios) for every
+    group code in one pass: a single sort by (group, score), then bincount
+    sums for counts, means and variances, direct indexing into the sorted
+    array for min/max/percentiles (linear interpolation, as np.percentile),
+    and a 2-D bincount for the histograms. Returns one dict per group, or
+    None for groups without scores.
+    """
+    order = np.lexsort((scores, group_codes))
+    codes, values = group_codes[order], scores[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    present = counts > 0
+    safe_counts = np.maximum(counts, 1)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ends = starts + safe_counts - 1
+
+    means = np.bincount(codes, weights=values, minlength=n_groups) / safe_counts
+    variances = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=n_groups) / safe_counts
+
+    quantiles = np.asarray(GRADE_PERCENTILES, dtype=float) / 100
+    positions = starts[:, None] + (safe_counts - 1)[:, None] * quantiles
+    # Empty groups point past the end; clamp them, their rows are dropped below
+    last = max(len(values) - 1, 0)
+    lower = np.minimum(np.floor(positions).astype(np.intp), last)
+    upper = np.minimum(np.ceil(positions).astype(np.intp), last)
+    padded = values if len(values) else np.zeros(1)
+    percentiles = padded[lower] + (padded[upper] - padded[lower]) * (positions - lower)
+
+    # Scores above full marks (bonus) land in the top bucket, below zero in the first
+    buckets = np.minimum((np.clip(values, 0, 1) * GRADE_HISTOGRAM_BUCKETS).astype(np.intp), GRADE_HISTOGRAM_BUCKETS - 1)
+    histograms = np.bincount(codes * GRADE_HISTOGRAM_BUCKETS + buckets, minlength=n_groups * GRADE_HISTOGRAM_BUCKETS)
+    histograms = histograms.reshape(n_groups, GRADE_HISTOGRAM_BUCKETS)
+
+    median_index = GRADE_PERCENTILES.index(50)
+    summaries = []
+    for group in range(n_groups):
+        if not present[group]:
+            summaries.append(None)
+            continue
+        summaries.append({
+            "count": int(counts[group]),
+            "mean": round(float(means[group]), 4),
+            "median": round(float(percentiles[group, median_index]), 4),
+            "std": round(float(np.sqrt(variances[group])), 4),
+            "min": round(float(values[starts[group]]), 4),
+            "max": round(float(values[ends[group]]), 4),
+            "percentiles": {f"p{p}": round(float(v), 4) for p, v in zip(GRADE_PERCENTILES, percentiles[group])},
+            "histogram": [
+                {
+                    "lower": round(bucket / GRADE_HISTOGRAM_BUCKETS, 2),
+                    "upper": round((bucket + 1) / GRADE_HISTOGRAM_BUCKETS, 2),
+                    "count": int(histograms[group, bucket]),
+                }
+                for bucket in range(GRADE_HISTOGRAM_BUCKETS)
+            ],
+        })
+    return summaries
+
+def get_grade_distribution(db: Session, offering_id: int, exam_type: Optional[str] = None) -> dict:
+    """
+    Per exam type statistics of obtained_marks / total_marks for one offering,
+    from a single fetch of (exam_type, obtained_marks, total_marks). Records
+    without marks or with a non-positive total are skipped.
+    """
+    query = db.query(type_coerce(ExamRecord.exam_type, String), ExamRecord.obtained_marks, ExamRecord.total_marks).filter(
+        ExamRecord.offering_id == offering_id,
+        ExamRecord.exam_type.isnot(None),
+        ExamRecord.obtained_marks.isnot(None),
+        ExamRecord.total_marks > 0,
+    )
+    if exam_type:
+        query = query.filter(ExamRecord.exam_type == exam_type)
+    rows = db.connection().execute(query.statement).all()
+
+    exam_types = [row[0] for row in rows]
+    obtained = np.fromiter((row[1] for row in rows), dtype=float, count=len(rows))
+    total = np.fromiter((row[2] for row in rows), dtype=float, count=len(rows))
+    group_codes = pd.Categorical(exam_types, categories=EXAM_TYPES).codes.astype(np.intp)
+    known = group_codes >= 0
+
+    summaries = summarize_scores(group_codes[known], (obtained / total)[known], len(EXAM_TYPES))
+    return {
+        "offering_id": offering_id,
+        "exam_types": [
+            dict(summary, exam_type=name)
+            for name, summary in zip(EXAM_TYPES, summaries) if summary is not None
+        ],
+    }
+
+def get_cached_grade_distribution(db: Session, offering_id: int, exam_type: Optional[str] = None) -> dict:
+    filters = normalize_filters(exam_type=exam_type)
+    return grade_distribution_cache.get_or_compute(
+        ("grades", offering_id) + filters,
+        lambda: get_grade_distribution(on_primary(db), offering_id, **dict(filters)),
+        lambda: [offering_id],
+        cohort_wide=False,
+    )
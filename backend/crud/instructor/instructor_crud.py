@@ -1,8 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models.admin.instructor import Instructor # Import the Instructor model
+from crud.lookups import lookup_statement, fetch_one, fetch_one_async
+
+_INSTRUCTOR_BY_ID = lookup_statement(Instructor, Instructor.instructor_id)
+
 
 def get_instructor_by_id(db: Session, instructor_id: str):
-    return db.query(Instructor).filter(Instructor.instructor_id == instructor_id).first()
+    return fetch_one(db, _INSTRUCTOR_BY_ID, instructor_id)
 
 def verify_instructor_password(db: Session, instructor_id: str, cnic: str):
     instructor = get_instructor_by_id(db, instructor_id)
@@ -10,5 +15,11 @@ def verify_instructor_password(db: Session, instructor_id: str, cnic: str):
         return instructor
     return None
 
+async def verify_instructor_password_async(db: AsyncSession, instructor_id: str, cnic: str):
+    instructor = await fetch_one_async(db, _INSTRUCTOR_BY_ID, instructor_id)
+    if instructor and instructor.cnic == cnic:
+        return instructor
+    return None
+
 # NOTE: In a real-world application, passwords (like cnic here) should be hashed and securely stored.
 # This example directly compares the cnic for demonstration purposes. 
\ No newline at end of file
@@ -0,0 +1,20 @@
+# crud/lookups.py
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+def lookup_statement(model, column, *options):
+    """
+    Prebuilt `SELECT model WHERE column = :key LIMIT 1` for the fixed-shape
+    lookups (by ID or name) that run several times per request. The legacy
+    db.query(...).filter(...).first() chain builds a new Query and a new
+    cache key on every call. A module-level statement is built once, and its
+    compiled SQL is found in the engine's cache on every call after the first.
+    """
+    return select(model).where(column == bindparam("key")).options(*options).limit(1)
+
+def fetch_one(db: Session, statement, key):
+    return db.execute(statement, {"key": key}).scalars().first()
+
+async def fetch_one_async(db: AsyncSession, statement, key):
+    return (await db.execute(statement, {"key": key})).scalars().first()
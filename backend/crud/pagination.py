@@ -0,0 +1,190 @@
+import base64
+import json
+import os
+from datetime import date, datetime
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import and_, func, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from crud.serialization import json_list
+
+# Pagination of the list endpoints, read from the environment:
+#
+#   LMS_PAGE_SIZE_DEFAULT   rows per page when the client sends no limit
+#   LMS_PAGE_SIZE_MAX       largest limit a client may ask for
+#
+# Pages stay JSON arrays, so existing clients keep working; the next page is
+# advertised in headers: X-Next-Cursor and a Link rel="next" URL, plus
+# X-Total-Count when the client asked for include_total. With ?fields=a,b only
+# those columns are selected and returned, as plain rows instead of ORM objects.
+PAGE_SIZE_DEFAULT = int(os.getenv("LMS_PAGE_SIZE_DEFAULT", "100"))
+PAGE_SIZE_MAX = int(os.getenv("LMS_PAGE_SIZE_MAX", "500"))
+PAGE_HEADERS = ["X-Next-Cursor", "X-Total-Count", "Link"]
+
+
+class PageParams:
+    """
+    Query parameters of a paginated list route, used as
+    `page: PageParams = Depends()`: the page size, the opaque cursor from the
+    previous page's X-Next-Cursor header, whether to count all rows, and the
+    columns to return.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX, description="Rows per page"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+        include_total: bool = Query(False, description="Return the row count in X-Total-Count"),
+        fields: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. student_id,first_name"),
+    ):
+        self.request = request
+        self.limit = limit
+        self.cursor = cursor
+        self.include_total = include_total
+        self.fields = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+
+    def respond(self, response: Response, page: "Page", schema=None) -> list:
+        """
+        Sets the pagination headers for `page` and returns its rows as the body.
+        Projected rows are encoded here, skipping the route's response_model,
+        which describes full objects. With `schema` (the response_model's item
+        type) full rows are encoded here too, in one batch (crud/serialization.py).
+        """
+        headers = {}
+        if page.next_cursor is not None:
+            headers["X-Next-Cursor"] = page.next_cursor
+            params = dict(self.request.query_params, cursor=page.next_cursor)
+            headers["Link"] = f'<{self.request.url.replace(query=urlencode(params))}>; rel="next"'
+        if page.total is not None:
+            headers["X-Total-Count"] = str(page.total)
+        if page.projected:
+            # Keeps headers other dependencies set on `response` (ETag, ...)
+            return ORJSONResponse(jsonable_encoder(page.items), headers={**response.headers, **headers})
+        if schema is not None:
+            return json_list(schema, page.items, headers={**response.headers, **headers})
+        response.headers.update(headers)
+        return page.items
+
+
+class Page:
+    def __init__(self, items: list, next_cursor: Optional[str] = None, total: Optional[int] = None, projected: bool = False):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.total = total
+        self.projected = projected
+
+
+class Keyset:
+    """
+    Sort key of a paginated statement: one or more mapped columns, the last
+    of which must be unique (normally the primary key), all in one direction.
+    A page continues strictly after the previous page's last row, so it costs
+    an index range scan however deep the client pages, unlike OFFSET.
+    """
+
+    def __init__(self, *columns, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self) -> list:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def after(self, values: list):
+        # (a, b) > (x, y) spelled out as a > x OR (a = x AND b > y), which every
+        # backend can serve from an index on the key columns
+        clauses = []
+        for i, column in enumerate(self.columns):
+            beyond = column < values[i] if self.descending else column > values[i]
+            clauses.append(and_(*[self.columns[j] == values[j] for j in range(i)], beyond))
+        return or_(*clauses)
+
+    def encode(self, item) -> str:
+        values = []
+        for column in self.columns:
+            value = getattr(item, column.key)
+            values.append(value.isoformat() if isinstance(value, (date, datetime)) else value)
+        return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("wrong number of key values")
+            decoded = []
+            for column, value in zip(self.columns, values):
+                python_type = column.type.python_type
+                if python_type in (date, datetime) and value is not None:
+                    value = python_type.fromisoformat(value)
+                decoded.append(value)
+            return decoded
+        except (ValueError, TypeError, NotImplementedError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _projection(statement, keyset: Keyset, page: Optional[PageParams], fields: Optional[list]):
+    """
+    (names, statement selecting only those columns) for ?fields=, or for a
+    route that always returns a fixed column list (`fields`, which then also
+    bounds what the client may ask for). None when the full entity is wanted.
+    Keyset columns are selected too, for the cursor, but not returned.
+    """
+    requested = page.fields if page is not None else None
+    if not requested and fields is None:
+        return None
+    entity = statement.column_descriptions[0]["entity"]
+    allowed = list(fields) if fields is not None else [attr.key for attr in inspect(entity).column_attrs]
+    names = list(dict.fromkeys(requested or allowed))
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(allowed)}")
+    key_names = [column.key for column in keyset.columns if column.key not in names]
+    return names, statement.with_only_columns(*[getattr(entity, name) for name in names + key_names])
+
+def _page_statement(statement, keyset: Keyset, page: Optional[PageParams]):
+    statement = statement.order_by(None).order_by(*keyset.order_by())
+    if page is None:
+        return statement
+    if page.cursor:
+        statement = statement.where(keyset.after(keyset.decode(page.cursor)))
+    # One row past the page tells whether another page follows
+    return statement.limit(page.limit + 1)
+
+def _count_statement(statement):
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+def _build_page(items: list, keyset: Keyset, page: Optional[PageParams], total: Optional[int], names: Optional[list]) -> Page:
+    next_cursor = None
+    if page is not None and len(items) > page.limit:
+        items = items[:page.limit]
+        next_cursor = keyset.encode(items[-1])
+    if names is not None:
+        # Rows are plain tuples; only the requested columns go into the body
+        items = [dict(zip(names, row)) for row in items]
+    return Page(items, next_cursor, total, projected=names is not None)
+
+def paginate(db: Session, statement, keyset: Keyset, page: Optional[PageParams] = None, fields: Optional[list] = None) -> Page:
+    """
+    Runs a select() of one entity a page at a time. Without `page` (scripts,
+    internal callers) every row is returned, in keyset order.
+    """
+    projection = _projection(statement, keyset, page, fields)
+    names, query = projection if projection else (None, statement)
+    result = db.execute(_page_statement(query, keyset, page)).unique()
+    items = result.all() if projection else result.scalars().all()
+    total = db.execute(_count_statement(statement)).scalar_one() if page is not None and page.include_total else None
+    return _build_page(list(items), keyset, page, total, names)
+
+async def paginate_async(db: AsyncSession, statement, keyset: Keyset, page: Optional[PageParams] = None, fields: Optional[list] = None) -> Page:
+    projection = _projection(statement, keyset, page, fields)
+    names, query = projection if projection else (None, statement)
+    result = (await db.execute(_page_statement(query, keyset, page))).unique()
+    items = result.all() if projection else result.scalars().all()
+    total = (await db.execute(_count_statement(statement))).scalar_one() if page is not None and page.include_total else None
+    return _build_page(list(items), keyset, page, total, names)
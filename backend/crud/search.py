@@ -0,0 +1,387 @@
+import bisect
+import heapq
+import logging
+import os
+import re
+import threading
+from array import array
+from itertools import chain, islice
+from typing import Callable, List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+import database
+from database.table_versions import read_versions
+from models.admin.course import Course
+from models.admin.instructor import Instructor
+from models.admin.section import Section
+from models.admin.student import Student
+
+logger = logging.getLogger(__name__)
+
+# Search behind the admin /search/ routes, read from the environment:
+#
+#   LMS_SEARCH_INDEX           1 = in-process index (default), 0 = SQL LIKE scan
+#   LMS_SEARCH_LIMIT_DEFAULT   results per search when the client sends no limit
+#   LMS_SEARCH_LIMIT_MAX       largest limit a client may ask for
+#   LMS_SEARCH_INDEX_MAX_ROWS  tables with more rows than this are not indexed
+#
+# Each searchable table has an in-memory index of its key and name columns:
+# sorted lists of field values and words for prefix matches of any length,
+# and trigram postings for substring matches of 3+ characters. Results are
+# ranked (exact match, then field prefix, then word prefix, then substring)
+# and only the top `limit` keys are loaded from the database, by primary key.
+# The same indexes answer /api/autocomplete (crud/shared/autocomplete.py)
+# from memory alone: prefix matches only, with the original column values
+# kept for the labels.
+#
+# The crud write functions update the index of their own process. Writes from
+# other workers and scripts show up through the table's change counter
+# (database/table_versions.py): a search that sees a newer version than the
+# index was built from starts a rebuild in the background and answers from the
+# current index meanwhile. Until the first build finishes, searches run the SQL
+# LIKE query, as they do for a table past LMS_SEARCH_INDEX_MAX_ROWS. Updated
+# and deleted rows leave dead entries behind; once they outnumber the live
+# ones the index is rebuilt to drop them.
+SEARCH_INDEX_ENABLED = os.getenv("LMS_SEARCH_INDEX", "1") == "1"
+SEARCH_LIMIT_DEFAULT = int(os.getenv("LMS_SEARCH_LIMIT_DEFAULT", "20"))
+SEARCH_LIMIT_MAX = int(os.getenv("LMS_SEARCH_LIMIT_MAX", "100"))
+SEARCH_INDEX_MAX_ROWS = int(os.getenv("LMS_SEARCH_INDEX_MAX_ROWS", "200000"))
+
+# Terms of one or two characters only match at the start of a word; the
+# multi-term path stops collecting their candidates past this many documents
+SHORT_QUERY_CANDIDATES = 2000
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text) -> str:
+    return str(text).casefold().strip() if text is not None else ""
+
+def _trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _score(field: str, term: str) -> int:
+    if field == term:
+        return 4
+    if field.startswith(term):
+        return 3
+    position = field.find(term)
+    if position < 0:
+        return 0
+    # Start of a later word ("khan" in "ali khan"), or anywhere inside one
+    return 2 if not field[position - 1].isalnum() else 1
+
+
+class _Snapshot:
+    """
+    One index generation. Documents are numbered in insertion order (key
+    order after a build); a removed document keeps its number with `fields`
+    set to None, so nothing needs rewriting until the next rebuild.
+    `fields` holds the normalized column values, `display` the original ones.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.fields = []
+        self.display = []
+        self.doc_by_key = {}
+        self.grams = {}
+        self.values = []  # sorted (field value, doc)
+        self.tokens = []  # sorted (word, doc)
+
+    @property
+    def dead(self) -> int:
+        return len(self.keys) - len(self.doc_by_key)
+
+    def add(self, key, fields: tuple, display: tuple, keep_sorted: bool = True):
+        self.remove(key)
+        doc = len(self.keys)
+        self.keys.append(key)
+        self.fields.append(fields)
+        self.display.append(display)
+        self.doc_by_key[key] = doc
+        for gram in set().union(*(_trigrams(field) for field in fields)):
+            self.grams.setdefault(gram, array("I")).append(doc)
+        entries = [(self.values, (field, doc)) for field in set(fields) if field]
+        entries += [(self.tokens, (word, doc)) for word in set(word for field in fields for word in _WORD.findall(field))]
+        for sorted_list, entry in entries:
+            if keep_sorted:
+                bisect.insort(sorted_list, entry)
+            else:
+                sorted_list.append(entry)
+
+    def sort(self):
+        self.values.sort()
+        self.tokens.sort()
+
+    def remove(self, key):
+        doc = self.doc_by_key.pop(key, None)
+        if doc is not None:
+            self.fields[doc] = self.display[doc] = None
+
+    def _prefixed(self, sorted_list: list, term: str):
+        for position in range(bisect.bisect_left(sorted_list, (term,)), len(sorted_list)):
+            value, doc = sorted_list[position]
+            if not value.startswith(term):
+                return
+            if self.fields[doc] is not None:
+                yield doc
+
+    def _containing(self, term: str):
+        # Every match contains all of the term's trigrams; walk the rarest
+        # posting list and check the rest against the fields
+        postings = [self.grams.get(gram) for gram in _trigrams(term)]
+        if any(p is None for p in postings):
+            return
+        for doc in min(postings, key=len):
+            fields = self.fields[doc]
+            if fields is not None and any(term in field for field in fields):
+                yield doc
+
+    def search_term(self, term: str, limit: int) -> list:
+        """
+        A single term, tier by tier: whole field (exact before prefix, in
+        value order), then the start of a later word, then anywhere inside a
+        word in index order. Each tier is read only as far as `limit`.
+        """
+        docs = {}
+        tiers = [self._prefixed(self.values, term), self._prefixed(self.tokens, term)]
+        if len(term) >= 3:
+            tiers.append(self._containing(term))
+        for tier in tiers:
+            for doc in tier:
+                if len(docs) >= limit:
+                    break
+                docs[doc] = None
+        return [self.keys[doc] for doc in docs]
+
+    def complete(self, terms: List[str], limit: int) -> dict:
+        """
+        {doc: score} for up to `limit` documents where every term starts a
+        field or a word. The longest term's prefix ranges are walked in the
+        same tier order as search_term(), at most SHORT_QUERY_CANDIDATES
+        entries deep, and the other terms are checked per document.
+        """
+        term = max(terms, key=len)
+        others = list(terms)
+        others.remove(term)
+        docs = {}
+        walked = chain(self._prefixed(self.values, term), self._prefixed(self.tokens, term))
+        for doc in islice(walked, SHORT_QUERY_CANDIDATES):
+            if len(docs) >= limit:
+                break
+            fields = self.fields[doc]
+            if doc not in docs and all(max(_score(field, other) for field in fields) >= 2 for other in others):
+                docs[doc] = max(_score(field, term) for field in fields)
+        return docs
+
+    def _candidates(self, term: str) -> set:
+        if len(term) >= 3:
+            postings = [self.grams.get(gram) for gram in _trigrams(term)]
+            return set() if any(p is None for p in postings) else set(min(postings, key=len))
+        return set(islice(self._prefixed(self.tokens, term), SHORT_QUERY_CANDIDATES))
+
+    def search(self, terms: List[str], limit: int) -> list:
+        if len(terms) == 1:
+            return self.search_term(terms[0], limit)
+        # Several terms: only documents that can match all of them are scored,
+        # by the sum of each term's best field
+        candidates = None
+        for term in sorted(terms, key=len, reverse=True):
+            found = self._candidates(term)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+        ranked = []
+        for doc in candidates:
+            fields = self.fields[doc]
+            if fields is None:
+                continue
+            score = 0
+            for term in terms:
+                best = max(_score(field, term) for field in fields)
+                if not best:
+                    break
+                score += best
+            else:
+                ranked.append((-score, doc))
+        return [self.keys[doc] for score, doc in heapq.nsmallest(limit, ranked)]
+
+
+class SearchIndex:
+    """
+    In-process search over `columns` of one table, keyed by its primary key.
+    """
+
+    def __init__(self, key, columns: list, session_factory: Optional[Callable[[], Session]] = None):
+        self.key = key
+        self.model = key.class_
+        self.table = self.model.__tablename__
+        self.columns = columns
+        self.session_factory = session_factory
+        self.version = None
+        self._snapshot = None
+        self._pending = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def _entry(self, values) -> tuple:
+        values = tuple(values)
+        return tuple(normalize(value) for value in values), values
+
+    def build(self):
+        """
+        Loads the table into a new snapshot and swaps it in. Changes the crud
+        functions reported while it ran are applied again on top.
+        """
+        with self._lock:
+            if self._pending is not None:
+                return
+            self._pending = []
+        db = (self.session_factory or database.SessionLocal)()
+        try:
+            version = read_versions(db, [self.table])[self.table][0]
+            snapshot = _Snapshot()
+            for row in db.execute(select(self.key, *self.columns).order_by(self.key)).yield_per(5000):
+                if len(snapshot.keys) >= SEARCH_INDEX_MAX_ROWS:
+                    raise OverflowError(f"more than {SEARCH_INDEX_MAX_ROWS} rows")
+                snapshot.add(row[0], *self._entry(row[1:]), keep_sorted=False)
+            snapshot.sort()
+        except Exception as exc:
+            if isinstance(exc, OverflowError):
+                logger.warning("Not indexing %s for search: %s (LMS_SEARCH_INDEX_MAX_ROWS)", self.table, exc)
+            else:
+                logger.exception("Building the %s search index failed", self.table)
+            with self._lock:
+                self._pending = None
+                if isinstance(exc, OverflowError):
+                    self._snapshot = self.version = None
+            return
+        finally:
+            db.close()
+        with self._lock:
+            for key, entry in self._pending:
+                if entry is None:
+                    snapshot.remove(key)
+                else:
+                    snapshot.add(key, *entry)
+            self._snapshot, self.version, self._pending = snapshot, version, None
+        logger.info("Built the %s search index: %d rows at version %s", self.table, len(snapshot.doc_by_key), version)
+
+    def build_in_background(self):
+        threading.Thread(target=self.build, name=f"search-index-{self.table}", daemon=True).start()
+
+    def _record(self, db: Session, key, entry: Optional[tuple]):
+        # Our own commit moved the version by one; anything more came from
+        # another process and needs a rebuild
+        version = read_versions(db, [self.table])[self.table][0] if self.ready else None
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((key, entry))
+            snapshot = self._snapshot
+            if snapshot is None:
+                return
+            if entry is None:
+                snapshot.remove(key)
+            else:
+                snapshot.add(key, *entry)
+            if version == self.version + 1:
+                self.version = version
+            if len(snapshot.doc_by_key) > SEARCH_INDEX_MAX_ROWS:
+                logger.warning("Dropping the %s search index: more than %d rows (LMS_SEARCH_INDEX_MAX_ROWS)", self.table, SEARCH_INDEX_MAX_ROWS)
+                self._snapshot = self.version = None
+                return
+            compact = snapshot.dead > max(len(snapshot.doc_by_key), 1000) and self._pending is None
+        if compact:
+            self.build_in_background()
+
+    def upsert(self, db: Session, obj, old_key=None):
+        """
+        Indexes a created or updated row, after its commit.
+        """
+        if old_key is not None and old_key != getattr(obj, self.key.key):
+            self.remove(db, old_key)
+        self._record(db, getattr(obj, self.key.key), self._entry(getattr(obj, column.key) for column in self.columns))
+
+    def remove(self, db: Session, key):
+        self._record(db, key, None)
+
+    def usable(self, db: Session, version: Optional[int] = None) -> bool:
+        """
+        Whether the index can answer now. Starts a background rebuild when
+        the table's `version` (read here when not given) is ahead of it.
+        """
+        if not SEARCH_INDEX_ENABLED or not self.ready:
+            return False
+        if version is None:
+            version = read_versions(db, [self.table])[self.table][0]
+        if self.version is not None and version > self.version and self._pending is None:
+            self.build_in_background()
+        return True
+
+    def search(self, db: Session, keyword: str, limit: int) -> list:
+        """
+        Up to `limit` rows matching every word of `keyword`, best first.
+        """
+        terms = normalize(keyword).split()
+        if not terms:
+            return []
+        if not self.usable(db):
+            return self._scan(db, terms, limit)
+        with self._lock:
+            keys = self._snapshot.search(terms, limit)
+        if not keys:
+            return []
+        rows = {getattr(row, self.key.key): row for row in db.execute(select(self.model).where(self.key.in_(keys))).scalars()}
+        return [rows[key] for key in keys if key in rows]
+
+    def complete(self, db: Session, keyword: str, limit: int, version: Optional[int] = None) -> list:
+        """
+        Up to `limit` (score, key, column values) whose fields or words start
+        with every word of `keyword`, best first. Answered from memory; the
+        database is only queried while the index is unusable.
+        """
+        terms = normalize(keyword).split()
+        if not terms:
+            return []
+        if not self.usable(db, version):
+            return self._scan_prefix(db, terms, limit)
+        with self._lock:
+            snapshot = self._snapshot
+            return [(score, snapshot.keys[doc], snapshot.display[doc]) for doc, score in snapshot.complete(terms, limit).items()]
+
+    def _scan(self, db: Session, terms: List[str], limit: int) -> list:
+        statement = select(self.model)
+        for term in terms:
+            statement = statement.where(or_(*[column.ilike(f"%{term}%") for column in self.columns]))
+        return db.execute(statement.order_by(self.key).limit(limit)).scalars().all()
+
+    def _scan_prefix(self, db: Session, terms: List[str], limit: int) -> list:
+        statement = select(self.key, *self.columns)
+        for term in terms:
+            statement = statement.where(or_(*[
+                condition for column in self.columns for condition in (column.ilike(f"{term}%"), column.ilike(f"% {term}%"))
+            ]))
+        term = max(terms, key=len)
+        ranked = []
+        for row in db.execute(statement.order_by(self.key).limit(limit)):
+            fields, values = self._entry(row[1:])
+            ranked.append((max(_score(field, term) for field in fields), row[0], values))
+        return sorted(ranked, key=lambda match: -match[0])
+
+
+student_index = SearchIndex(Student.student_id, [Student.student_id, Student.first_name, Student.last_name])
+instructor_index = SearchIndex(Instructor.instructor_id, [Instructor.instructor_id, Instructor.first_name, Instructor.last_name])
+course_index = SearchIndex(Course.course_id, [Course.course_id, Course.course_name])
+section_index = SearchIndex(Section.section_name, [Section.section_name])
+SEARCH_INDEXES = [student_index, instructor_index, course_index, section_index]
+
+def build_search_indexes():
+    if SEARCH_INDEX_ENABLED:
+        for index in SEARCH_INDEXES:
+            index.build_in_background()
@@ -0,0 +1,27 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# JSON for the large list endpoints. A route with response_model=List[X] that
+# returns ORM rows has FastAPI validate the rows, dump them to Python dicts and
+# hand those to the JSON encoder; routes that first built X.from_orm(row) per
+# row paid for a second validation on top. json_list() validates the whole
+# list in one TypeAdapter call and has pydantic-core write the JSON bytes
+# directly. The route keeps its response_model for the OpenAPI schema; a
+# returned Response skips FastAPI's own pass.
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+def json_list(schema, rows, headers: Optional[dict] = None, status_code: int = 200) -> Response:
+    """
+    `rows` (ORM objects or dicts) as a JSON array of `schema`, encoded as
+    FastAPI would: by alias, dates in ISO format, enums by value.
+    """
+    adapter = list_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True), by_alias=True)
+    return Response(body, status_code=status_code, media_type="application/json", headers=headers)
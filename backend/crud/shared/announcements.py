@@ -1,7 +1,23 @@
+from typing import Optional
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session, joinedload
 from datetime import date
-from models.shared.announcements import Announcement
+from functools import lru_cache
+from models.shared.announcements import Announcement, AnnouncementRecipient
 from models.admin.department import Department  # Import Department model
+from models.admin.instructor import Instructor
+from models.admin.student import Student
+from crud.lookups import lookup_statement, fetch_one
+from crud.pagination import Keyset, Page, PageParams, paginate
+
+_ANNOUNCEMENT_BY_ID = lookup_statement(Announcement, Announcement.announcement_id)
+
+@lru_cache(maxsize=None)
+def _announcement_with_department_by_id():
+    # Built on first use: joinedload() configures the mappers, which needs
+    # every model module imported first.
+    return lookup_statement(Announcement, Announcement.announcement_id, joinedload(Announcement.department))
+
 
 # Helper to convert string date to date object
 def _convert_date_string_to_date(date_str: str | None) -> date | None:
@@ -12,6 +28,42 @@ def _convert_date_string_to_date(date_str: str | None) -> date | None:
     except (ValueError, TypeError):
         return None # Handle invalid date string gracefully
 
+# Targets each recipient_type expands to in announcement_recipients:
+# (role, target_type, where the target IDs come from). recipient_ids is
+# comma-separated; 'all' targets carry an empty ID.
+RECIPIENT_TARGETS = {
+    'all': [('student', 'all', None), ('instructor', 'all', None)],
+    'all_students': [('student', 'all', None)],
+    'all_instructors': [('instructor', 'all', None)],
+    'specific_students': [('student', 'id', 'recipient_ids')],
+    'specific_instructors': [('instructor', 'id', 'recipient_ids')],
+    'department_students': [('student', 'department', 'department_name')],
+    'department_instructors': [('instructor', 'department', 'department_name')],
+    'section_students': [('student', 'section', 'recipient_ids')],
+}
+
+# What each role's feed matches: the user's own ID, plus these of their columns
+_FEED_GROUPS = {
+    'student': (Student, Student.student_id, {'department': Student.program, 'section': Student.section}),
+    'instructor': (Instructor, Instructor.instructor_id, {'department': Instructor.department}),
+}
+
+def _recipients(recipient_type: str, recipient_ids: str | None, department_name: str | None) -> list:
+    if recipient_type not in RECIPIENT_TARGETS:
+        raise ValueError(f"Unknown recipient_type '{recipient_type}'. Available: {', '.join(RECIPIENT_TARGETS)}")
+    sources = {
+        None: [''],
+        'recipient_ids': [part.strip() for part in (recipient_ids or '').split(',') if part.strip()],
+        'department_name': [department_name] if department_name else [],
+    }
+    targets = {}
+    for role, target_type, source in RECIPIENT_TARGETS[recipient_type]:
+        if not sources[source]:
+            raise ValueError(f"recipient_type '{recipient_type}' needs {source}")
+        for target_id in sources[source]:
+            targets[(role, target_type, target_id)] = None
+    return [AnnouncementRecipient(role=role, target_type=target_type, target_id=target_id) for role, target_type, target_id in targets]
+
 # CREATE announcement
 def create_announcement(
     db: Session,
@@ -38,11 +90,11 @@ def create_announcement(
             valid_until=valid_until_date,
             department_name=department_name,
             sender_type=sender_type,  # Assign sender_type
-            sender_id=sender_id       # Assign sender_id
+            sender_id=sender_id,      # Assign sender_id
+            recipients=_recipients(recipient_type, recipient_ids, department_name)
         )
         db.add(announcement)
         db.commit()
-        db.refresh(announcement)
         print(f"[DEBUG] CRUD - Announcement added to DB with ID: {announcement.announcement_id}")
         return announcement
     except Exception as e:
@@ -51,12 +103,37 @@ def create_announcement(
         raise Exception(f"Error creating announcement: {str(e)}")
 
 # GET all announcements
-def get_all_announcements(db: Session):
-    return db.query(Announcement).options(joinedload(Announcement.department)).all()
+def get_all_announcements(db: Session, page: Optional[PageParams] = None) -> Page:
+    # Newest first, served from idx_announcements_created_at
+    statement = select(Announcement).options(joinedload(Announcement.department))
+    return paginate(db, statement, Keyset(Announcement.created_at, Announcement.announcement_id, descending=True), page)
 
 # GET announcement by ID
 def get_announcement_by_id(db: Session, announcement_id: int):
-    return db.query(Announcement).options(joinedload(Announcement.department)).filter(Announcement.announcement_id == announcement_id).first()
+    return fetch_one(db, _announcement_with_department_by_id(), announcement_id)
+
+# GET the announcements a student or instructor can see, newest first
+def get_announcement_feed(db: Session, role: str, user_id: str, page: Optional[PageParams] = None, include_expired: bool = False) -> Page:
+    # One query: the user's row is joined in for their department and
+    # section, and each target is an idx_announcement_recipients_target
+    # lookup. An unknown user gets an empty feed.
+    user, user_key, groups = _FEED_GROUPS[role]
+    matches = [
+        AnnouncementRecipient.target_type == 'all',
+        and_(AnnouncementRecipient.target_type == 'id', AnnouncementRecipient.target_id == user_id),
+    ] + [
+        and_(AnnouncementRecipient.target_type == target_type, AnnouncementRecipient.target_id == column)
+        for target_type, column in groups.items()
+    ]
+    recipients = (
+        select(AnnouncementRecipient.announcement_id)
+        .join(user, user_key == user_id)
+        .where(AnnouncementRecipient.role == role, or_(*matches))
+    )
+    statement = select(Announcement).where(Announcement.announcement_id.in_(recipients))
+    if not include_expired:
+        statement = statement.where(or_(Announcement.valid_until.is_(None), Announcement.valid_until >= date.today()))
+    return paginate(db, statement, Keyset(Announcement.created_at, Announcement.announcement_id, descending=True), page)
 
 # UPDATE announcement
 def update_announcement(
@@ -70,8 +147,16 @@ def update_announcement(
     valid_until: str | None = None,
     department_name: str | None = None # Add department_id
 ):
-    announcement = db.query(Announcement).filter(Announcement.announcement_id == announcement_id).first()
+    announcement = fetch_one(db, _ANNOUNCEMENT_BY_ID, announcement_id)
     if announcement:
+        if recipient_type is not None or recipient_ids is not None or department_name is not None:
+            # Validated before anything changes; the old targets are deleted
+            # as orphans
+            announcement.recipients = _recipients(
+                recipient_type if recipient_type is not None else announcement.recipient_type,
+                recipient_ids if recipient_ids is not None else announcement.recipient_ids,
+                department_name if department_name is not None else announcement.department_name,
+            )
         if title is not None: announcement.title = title
         if message is not None: announcement.message = message
         if recipient_type is not None: announcement.recipient_type = recipient_type
@@ -81,13 +166,12 @@ def update_announcement(
             announcement.valid_until = _convert_date_string_to_date(valid_until)
         if department_name is not None: announcement.department_name = department_name # Update department_id
         db.commit()
-        db.refresh(announcement)
         return announcement
     return None
 
 # DELETE announcement
 def delete_announcement(db: Session, announcement_id: int):
-    announcement = db.query(Announcement).filter(Announcement.announcement_id == announcement_id).first()
+    announcement = fetch_one(db, _ANNOUNCEMENT_BY_ID, announcement_id)
     if announcement:
         db.delete(announcement)
         db.commit()
@@ -95,9 +179,10 @@ def delete_announcement(db: Session, announcement_id: int):
     return False
 
 # SEARCH announcements (example: by title or recipient_type)
-def search_announcements(db: Session, keyword: str):
-    return db.query(Announcement).options(joinedload(Announcement.department)).filter(
+def search_announcements(db: Session, keyword: str, page: Optional[PageParams] = None) -> Page:
+    statement = select(Announcement).options(joinedload(Announcement.department)).where(
         (Announcement.title.ilike(f"%{keyword}%")) |
         (Announcement.message.ilike(f"%{keyword}%")) |
         (Announcement.recipient_type.ilike(f"%{keyword}%"))
-    ).all() 
\ No newline at end of file
+    )
+    return paginate(db, statement, Keyset(Announcement.created_at, Announcement.announcement_id, descending=True), page) 
\ No newline at end of file
@@ -0,0 +1,40 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from database.table_versions import read_versions
+from crud.search import SEARCH_INDEX_ENABLED, SEARCH_LIMIT_MAX, course_index, instructor_index, section_index, student_index
+
+# Type-ahead suggestions for the pickers in the enrollment, offering and
+# announcement forms. Served from the search indexes (crud/search.py), which
+# the admin crud functions already keep current, so a keystroke costs one
+# primary-key read of table_versions and no table query.
+AUTOCOMPLETE_SOURCES = {
+    "student": student_index,
+    "instructor": instructor_index,
+    "course": course_index,
+    "section": section_index,
+}
+AUTOCOMPLETE_LIMIT_DEFAULT = 10
+AUTOCOMPLETE_LIMIT_MAX = SEARCH_LIMIT_MAX
+
+
+def _label(values: tuple) -> str:
+    # The name columns after the key ("Ada Lovelace", "Algorithms"); a
+    # section is only its name
+    return " ".join(str(value) for value in values[1:] if value) or str(values[0])
+
+def autocomplete(db: Session, prefix: str, types: Optional[List[str]] = None, limit: int = AUTOCOMPLETE_LIMIT_DEFAULT) -> list:
+    """
+    Up to `limit` {"type", "id", "label"} whose ID or name starts with every
+    word of `prefix`: exact matches first, then field prefixes, then words
+    inside a name, in the order of `types` within each.
+    """
+    indexes = [(name, AUTOCOMPLETE_SOURCES[name]) for name in (types or AUTOCOMPLETE_SOURCES)]
+    versions = read_versions(db, [index.table for name, index in indexes]) if SEARCH_INDEX_ENABLED else {}
+    matches = []
+    for name, index in indexes:
+        version = versions.get(index.table, (None,))[0]
+        matches += [(score, name, key, values) for score, key, values in index.complete(db, prefix, limit, version)]
+    matches.sort(key=lambda match: -match[0])
+    return [{"type": name, "id": key, "label": _label(values)} for score, name, key, values in matches[:limit]]
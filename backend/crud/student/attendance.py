@@ -1,9 +1,18 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models.instructor.attendance_records import Attendance
 from typing import Optional
+from crud.pagination import Keyset, Page, PageParams, paginate_async
 
-def get_attendance_records(db: Session, student_id: str, offering_id: Optional[int] = None):
-    query = db.query(Attendance).filter(Attendance.student_id == student_id)
+def _attendance_records_query(student_id: str, offering_id: Optional[int] = None):
+    query = select(Attendance).where(Attendance.student_id == student_id)
     if offering_id:
-        query = query.filter(Attendance.offering_id == offering_id)
-    return query.all() 
\ No newline at end of file
+        query = query.where(Attendance.offering_id == offering_id)
+    return query
+
+def get_attendance_records(db: Session, student_id: str, offering_id: Optional[int] = None):
+    return db.execute(_attendance_records_query(student_id, offering_id)).scalars().all()
+
+async def get_attendance_records_async(db: AsyncSession, student_id: str, offering_id: Optional[int] = None, page: Optional[PageParams] = None) -> Page:
+    return await paginate_async(db, _attendance_records_query(student_id, offering_id), Keyset(Attendance.attendance_id), page)
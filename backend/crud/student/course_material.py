@@ -1,17 +1,28 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models.instructor.course_materials import CourseMaterial
 from models.admin.student_enrollment import StudentCourseEnrollment
 from models.admin.course_offerings import CourseOffering
 from typing import Optional
+from crud.pagination import Keyset, Page, PageParams, paginate_async
 
-def get_course_materials(db: Session, student_id: str, offering_id: Optional[int] = None):
-    query = db.query(CourseMaterial).join(
-        CourseOffering, CourseMaterial.offering_id == CourseOffering.offering_id
-    ).join(
-        StudentCourseEnrollment, CourseOffering.offering_id == StudentCourseEnrollment.offering_id
-    ).filter(
-        StudentCourseEnrollment.student_id == student_id
-    )
+def _course_materials_query(student_id: Optional[str] = None, offering_id: Optional[int] = None):
+    query = select(CourseMaterial)
+    if student_id is not None:
+        query = query.join(
+            CourseOffering, CourseMaterial.offering_id == CourseOffering.offering_id
+        ).join(
+            StudentCourseEnrollment, CourseOffering.offering_id == StudentCourseEnrollment.offering_id
+        ).where(
+            StudentCourseEnrollment.student_id == student_id
+        )
     if offering_id:
-        query = query.filter(CourseMaterial.offering_id == offering_id)
-    return query.all() 
\ No newline at end of file
+        query = query.where(CourseMaterial.offering_id == offering_id)
+    return query
+
+def get_course_materials(db: Session, student_id: Optional[str] = None, offering_id: Optional[int] = None):
+    return db.execute(_course_materials_query(student_id, offering_id)).scalars().all()
+
+async def get_course_materials_async(db: AsyncSession, student_id: Optional[str] = None, offering_id: Optional[int] = None, page: Optional[PageParams] = None) -> Page:
+    return await paginate_async(db, _course_materials_query(student_id, offering_id), Keyset(CourseMaterial.material_id), page)
@@ -1,9 +1,18 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models.instructor.exam_records import ExamRecord
 from typing import Optional
+from crud.pagination import Keyset, Page, PageParams, paginate_async
 
-def get_exam_records(db: Session, student_id: str, offering_id: Optional[int] = None):
-    query = db.query(ExamRecord).filter(ExamRecord.student_id == student_id)
+def _exam_records_query(student_id: str, offering_id: Optional[int] = None):
+    query = select(ExamRecord).where(ExamRecord.student_id == student_id)
     if offering_id:
-        query = query.filter(ExamRecord.offering_id == offering_id)
-    return query.all() 
\ No newline at end of file
+        query = query.where(ExamRecord.offering_id == offering_id)
+    return query
+
+def get_exam_records(db: Session, student_id: str, offering_id: Optional[int] = None):
+    return db.execute(_exam_records_query(student_id, offering_id)).scalars().all()
+
+async def get_exam_records_async(db: AsyncSession, student_id: str, offering_id: Optional[int] = None, page: Optional[PageParams] = None) -> Page:
+    return await paginate_async(db, _exam_records_query(student_id, offering_id), Keyset(ExamRecord.id), page)
@@ -1,8 +1,13 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from models.admin.student import Student # Import the Student model
+from crud.lookups import lookup_statement, fetch_one, fetch_one_async
+
+_STUDENT_BY_ID = lookup_statement(Student, Student.student_id)
+
 
 def get_student_by_id(db: Session, student_id: str):
-    return db.query(Student).filter(Student.student_id == student_id).first()
+    return fetch_one(db, _STUDENT_BY_ID, student_id)
 
 def verify_student_password(db: Session, student_id: str, cnic: str):
     student = get_student_by_id(db, student_id)
@@ -10,4 +15,10 @@ def verify_student_password(db: Session, student_id: str, cnic: str):
         return student
     return None
 
+async def verify_student_password_async(db: AsyncSession, student_id: str, cnic: str):
+    student = await fetch_one_async(db, _STUDENT_BY_ID, student_id)
+    if student and student.cnic == cnic:
+        return student
+    return None
+
 # NOTE: As with instructors, in a real-world application, passwords should be hashed and securely stored. 
\ No newline at end of file
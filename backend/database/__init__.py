@@ -1,17 +1,48 @@
-from sqlalchemy import create_engine
+from fastapi import Request
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-# MySQL DB URL for XAMPP (no password case)
-SQLALCHEMY_DATABASE_URL = "mysql+pymysql://root:@localhost/lms_db"
+from database.config import build_engine, engine_settings, pool_status
+from database.routing import ReplicaSet, RoutingSession, replica_urls
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# Connection URL and pool tuning come from LMS_DATABASE_URL / LMS_DB_* (database/config.py)
+SQLALCHEMY_DATABASE_URL = engine_settings()["url"]
+
+engine = build_engine(SQLALCHEMY_DATABASE_URL)
+# Optional read replicas from LMS_DATABASE_REPLICA_URLS (database/routing.py)
+RoutingSession.replicas = ReplicaSet([build_engine(url) for url in replica_urls()])
+# Objects keep their state after commit: create/update functions return what
+# they wrote without a SELECT per object to reload it. Keys come back from the
+# INSERT itself (lastrowid, or RETURNING where the backend supports it).
+SessionLocal = sessionmaker(bind=engine, class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+# Change counters of the reference tables, bumped by every write (database/table_versions.py)
+from database import table_versions  # noqa: E402
+
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+def request_client_key(request: Request) -> str:
+    # Token when authenticated, so one user's browser tabs share a window
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return authorization
+    return request.client.host if request.client else None
+
+def get_db(request: Request):
+    client_key = request_client_key(request)
+    read_only = request.method in READ_ONLY_METHODS and not RoutingSession.sticky.is_sticky(client_key)
+    db = SessionLocal(info={"read_only": read_only, "client_key": client_key})
     try:
         yield db
     finally:
         db.close()
+
+def database_status() -> dict:
+    status = pool_status(engine)
+    if RoutingSession.replicas.engines:
+        status["replicas"] = [
+            dict(pool_status(replica), healthy=replica_status["healthy"])
+            for replica, replica_status in zip(RoutingSession.replicas.engines, RoutingSession.replicas.status())
+        ]
+    return status
@@ -0,0 +1,71 @@
+import os
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from database.config import track_pool_events, engine_settings
+
+# Async drivers for the sync URLs in LMS_DATABASE_URL; LMS_ASYNC_DATABASE_URL
+# overrides the derived URL (e.g. to use asyncmy instead of aiomysql).
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# The async pool is sized apart from the sync one (LMS_DB_POOL_SIZE /
+# LMS_DB_MAX_OVERFLOW) and shares its other LMS_DB_* settings. Only the login
+# and student portal routes are async, and each worker holds both pools
+# against the database's connection limit:
+#
+#   LMS_ASYNC_DB_POOL_SIZE       connections kept open per process
+#   LMS_ASYNC_DB_MAX_OVERFLOW    extra connections opened under bursts
+ASYNC_POOL_SIZE = int(os.getenv("LMS_ASYNC_DB_POOL_SIZE", "5"))
+ASYNC_MAX_OVERFLOW = int(os.getenv("LMS_ASYNC_DB_MAX_OVERFLOW", "5"))
+
+def async_database_url(url: str) -> str:
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.drivername}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+def build_async_engine(url: str = None, **overrides) -> AsyncEngine:
+    """
+    Async counterpart of database.config.build_engine, with its own pool size
+    and the sync engine's other settings. Connections are served without a
+    thread per request, so the pool size bounds concurrent queries rather than
+    concurrent requests.
+    """
+    settings = engine_settings()
+    settings.update(pool_size=ASYNC_POOL_SIZE, max_overflow=ASYNC_MAX_OVERFLOW)
+    settings.update(overrides)
+    sync_url = settings.pop("url")
+    url = make_url(url or os.getenv("LMS_ASYNC_DATABASE_URL") or async_database_url(sync_url))
+    connect_timeout = settings.pop("connect_timeout")
+    isolation_level = settings.pop("isolation_level")
+    options = {"echo": settings.pop("echo")}
+    if isolation_level:
+        options["isolation_level"] = isolation_level
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"timeout": connect_timeout}
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+            settings = {}
+    else:
+        options["connect_args"] = {"connect_timeout": connect_timeout}
+    if settings:
+        options["poolclass"] = AsyncAdaptedQueuePool
+        options.update(settings)
+    engine = create_async_engine(url, **options)
+    track_pool_events(engine.sync_engine)
+    return engine
+
+async_engine = build_async_engine()
+# Objects stay usable after commit: attribute access must never trigger lazy IO
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False, autoflush=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
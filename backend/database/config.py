@@ -0,0 +1,121 @@
+import os
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool, StaticPool
+
+# Engine configuration, read from the environment:
+#
+#   LMS_DATABASE_URL          SQLAlchemy URL (default: the local XAMPP database)
+#   LMS_DB_POOL_SIZE          connections kept open per process
+#   LMS_DB_MAX_OVERFLOW       extra connections opened under bursts
+#   LMS_DB_POOL_TIMEOUT       seconds to wait for a free connection
+#   LMS_DB_POOL_RECYCLE       seconds before a connection is replaced; keep it
+#                             below MySQL's wait_timeout (28800 by default)
+#   LMS_DB_POOL_PRE_PING      test connections on checkout (1/0)
+#   LMS_DB_CONNECT_TIMEOUT    seconds to wait when opening a connection
+#   LMS_DB_ISOLATION_LEVEL    e.g. "READ COMMITTED"; driver default when unset
+#   LMS_DB_ECHO               log every statement (1/0)
+#
+# Sync endpoints run in Starlette's threadpool (40 threads by default), so the
+# default pool_size + max_overflow lets every thread hold a connection instead
+# of timing out in the pool.
+DEFAULT_DATABASE_URL = "mysql+pymysql://root:@localhost/lms_db"  # XAMPP (no password case)
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def engine_settings() -> dict:
+    return {
+        "url": os.getenv("LMS_DATABASE_URL", DEFAULT_DATABASE_URL),
+        "pool_size": int(os.getenv("LMS_DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("LMS_DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": float(os.getenv("LMS_DB_POOL_TIMEOUT", "10")),
+        "pool_recycle": int(os.getenv("LMS_DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _env_bool("LMS_DB_POOL_PRE_PING", True),
+        "connect_timeout": int(os.getenv("LMS_DB_CONNECT_TIMEOUT", "10")),
+        "isolation_level": os.getenv("LMS_DB_ISOLATION_LEVEL") or None,
+        "echo": _env_bool("LMS_DB_ECHO", False),
+    }
+
+def build_engine(url: str = None, **overrides) -> Engine:
+    """
+    Creates an engine from engine_settings(), with `url` and any keyword
+    overriding the environment. SQLite URLs (tests, local datasets) get a
+    thread-shareable connection, and in-memory ones a single static connection.
+    """
+    settings = engine_settings()
+    settings.update(overrides)
+    if url is not None:
+        settings["url"] = url
+    url = make_url(settings.pop("url"))
+    connect_timeout = settings.pop("connect_timeout")
+    isolation_level = settings.pop("isolation_level")
+    options = {"echo": settings.pop("echo")}
+    if isolation_level:
+        options["isolation_level"] = isolation_level
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False, "timeout": connect_timeout}
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+            return track_pool_events(create_engine(url, **options))
+    else:
+        options["connect_args"] = {"connect_timeout": connect_timeout}
+    options["poolclass"] = QueuePool
+    options.update(settings)
+    return track_pool_events(create_engine(url, **options))
+
+
+class PoolCounters:
+    """
+    Running totals of pool events, next to the pool's own size/checkout counts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+
+    def increment(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self) -> dict:
+        return {"connects": self.connects, "checkouts": self.checkouts, "invalidations": self.invalidations}
+
+def track_pool_events(engine: Engine) -> Engine:
+    counters = PoolCounters()
+    engine.pool_counters = counters
+    event.listen(engine, "connect", lambda *args: counters.increment("connects"))
+    event.listen(engine, "checkout", lambda *args: counters.increment("checkouts"))
+    event.listen(engine, "invalidate", lambda *args: counters.increment("invalidations"))
+    return engine
+
+def pool_status(engine: Engine) -> dict:
+    """
+    Live pool statistics for /health: configured limits, connections open,
+    checked out and in overflow, and event totals since startup.
+    """
+    pool = engine.pool
+    status = {"pool": type(pool).__name__, "database": engine.url.render_as_string(hide_password=True)}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "recycle": pool._recycle,
+            "pre_ping": pool._pre_ping,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    counters = getattr(engine, "pool_counters", None)
+    if counters is not None:
+        status.update(counters.as_dict())
+    return status
@@ -0,0 +1,201 @@
+import contextlib
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Per-request SQL instrumentation, a debugging aid read from the environment.
+# Everything is off by default; development setups turn on what they need:
+#
+#   LMS_SQL_METRICS            record queries per request, aggregate per route and
+#                              log likely N+1 patterns (1/0)
+#   LMS_SQL_DEBUG_HEADERS      add X-SQL-* headers to every response (1/0); records
+#                              each request's queries even without LMS_SQL_METRICS
+#   LMS_SQL_METRICS_ENDPOINT   serve the per-route totals at /metrics/sql, admins only (1/0)
+#   LMS_SQL_N_PLUS_ONE         an identical statement run this many times in one
+#                              request is reported as a likely N+1 pattern
+SQL_METRICS_ENABLED = os.getenv("LMS_SQL_METRICS", "0") == "1"
+SQL_DEBUG_HEADERS = os.getenv("LMS_SQL_DEBUG_HEADERS", "0") == "1"
+SQL_METRICS_ENDPOINT = os.getenv("LMS_SQL_METRICS_ENDPOINT", "0") == "1"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("LMS_SQL_N_PLUS_ONE", "5"))
+STATEMENT_PREVIEW_CHARS = 500
+# Requests that matched no route (404s, scanners) share one entry, so arbitrary
+# paths cannot grow route_metrics without bound
+UNMATCHED_ROUTE = "<unmatched>"
+
+_current = contextvars.ContextVar("sql_request_stats", default=None)
+
+
+class RequestQueryStats:
+    """
+    Queries of one request. The middleware sets it in a context variable, and
+    threadpool endpoints (run in a copy of the context) add to the same object.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+        self.statements = Counter()
+
+    def record(self, statement: str, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.statements[statement] += 1
+            if seconds >= self.slowest_seconds:
+                self.slowest_seconds = seconds
+                self.slowest_statement = statement
+
+    def repeated_statements(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> list:
+        with self._lock:
+            return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+class RouteMetrics:
+    """
+    Running per-route totals: requests, queries, DB time, the slowest
+    statement seen and how often the route tripped the N+1 check.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def record(self, route: str, stats: RequestQueryStats, repeated: list):
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0, "queries": 0, "max_queries": 0, "db_seconds": 0.0,
+                "slowest_ms": 0.0, "slowest_statement": None,
+                "n_plus_one_requests": 0, "n_plus_one_statement": None,
+            })
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            entry["db_seconds"] += stats.total_seconds
+            if stats.slowest_seconds * 1000 >= entry["slowest_ms"] and stats.slowest_statement:
+                entry["slowest_ms"] = stats.slowest_seconds * 1000
+                entry["slowest_statement"] = _preview(stats.slowest_statement)
+            if repeated:
+                entry["n_plus_one_requests"] += 1
+                entry["n_plus_one_statement"] = _preview(repeated[0][0])
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            routes = {route: dict(entry) for route, entry in self._routes.items()}
+        for entry in routes.values():
+            entry["avg_queries"] = round(entry["queries"] / entry["requests"], 2)
+            entry["avg_db_ms"] = round(entry["db_seconds"] * 1000 / entry["requests"], 3)
+            entry["db_ms"] = round(entry.pop("db_seconds") * 1000, 3)
+            entry["slowest_ms"] = round(entry["slowest_ms"], 3)
+        return dict(sorted(routes.items(), key=lambda item: item[1]["db_ms"], reverse=True))
+
+    def clear(self):
+        with self._lock:
+            self._routes.clear()
+
+route_metrics = RouteMetrics()
+
+def _preview(statement: str) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= STATEMENT_PREVIEW_CHARS else statement[:STATEMENT_PREVIEW_CHARS] + "..."
+
+def current_request_stats():
+    return _current.get()
+
+@contextlib.contextmanager
+def collect_queries():
+    """
+    Records the queries run inside the block, outside of any request (scripts,
+    query-count checks). Yields the RequestQueryStats being filled.
+    """
+    stats = RequestQueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+# Listening on the Engine class covers every engine: primary, replicas and the
+# async engine's sync core. Outside a request (scripts, report jobs) nothing is recorded.
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("sql_started", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is not None and conn.info.get("sql_started"):
+        stats.record(statement, time.perf_counter() - conn.info["sql_started"].pop())
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Collects the queries of each HTTP request. When the response starts, it adds
+    X-SQL-Query-Count, X-SQL-Time-ms, X-SQL-Slowest-ms and X-SQL-N-Plus-One
+    headers if LMS_SQL_DEBUG_HEADERS is set. Once the body is sent, including
+    streamed exports, it adds the request to route_metrics under
+    "<METHOD> <route path>" (or UNMATCHED_ROUTE) and logs any statement
+    repeated past the N+1 threshold.
+    """
+
+    def __init__(self, app, debug_headers: bool = SQL_DEBUG_HEADERS, metrics: bool = SQL_METRICS_ENABLED):
+        self.app = app
+        self.debug_headers = debug_headers
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (self.metrics or self.debug_headers):
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current.set(stats)
+        finished = False
+
+        def finish():
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            if not self.metrics:
+                return
+            route = scope.get("route")
+            name = f"{scope['method']} {route.path}" if route is not None else UNMATCHED_ROUTE
+            repeated = stats.repeated_statements()
+            if repeated:
+                statement, count = repeated[0]
+                logger.warning("Possible N+1 in %s: statement run %d times: %s", name, count, _preview(statement))
+            route_metrics.record(name, stats, repeated)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.debug_headers:
+                headers = list(message.get("headers", []))
+                headers += [
+                    (b"x-sql-query-count", str(stats.count).encode()),
+                    (b"x-sql-time-ms", f"{stats.total_seconds * 1000:.3f}".encode()),
+                    (b"x-sql-slowest-ms", f"{stats.slowest_seconds * 1000:.3f}".encode()),
+                ]
+                repeated = stats.repeated_statements()
+                if repeated:
+                    headers.append((b"x-sql-n-plus-one", str(repeated[0][1]).encode()))
+                message = dict(message, headers=headers)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            finish()
+            _current.reset(token)
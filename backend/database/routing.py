@@ -0,0 +1,170 @@
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+# Read replicas, read from the environment:
+#
+#   LMS_DATABASE_REPLICA_URLS       comma-separated SQLAlchemy URLs; unset = primary only
+#   LMS_DB_REPLICA_STICKY_SECONDS   after a client's write, its reads stay on the
+#                                   primary this long so it sees its own changes
+#   LMS_DB_REPLICA_RETRY_SECONDS    a replica that failed is skipped this long
+REPLICA_STICKY_SECONDS = float(os.getenv("LMS_DB_REPLICA_STICKY_SECONDS", "5"))
+REPLICA_RETRY_SECONDS = float(os.getenv("LMS_DB_REPLICA_RETRY_SECONDS", "30"))
+STICKY_MAX_CLIENTS = 10000
+
+def replica_urls() -> List[str]:
+    return [url.strip() for url in os.getenv("LMS_DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+
+class ReplicaSet:
+    """
+    Round-robin over the replica engines, skipping any that recently failed.
+    A replica is marked down when one of its connections errors out as a
+    disconnect (server gone, refused, timed out) and comes back after
+    REPLICA_RETRY_SECONDS.
+    """
+
+    def __init__(self, engines: List[Engine], retry_seconds: float = REPLICA_RETRY_SECONDS):
+        self.engines = list(engines)
+        self.retry_seconds = retry_seconds
+        self._down_until = {}
+        self._cycle = itertools.cycle(range(len(self.engines))) if self.engines else None
+        self._lock = threading.Lock()
+        for engine in self.engines:
+            event.listen(engine, "handle_error", self._on_error(engine))
+
+    def _on_error(self, engine: Engine):
+        def handle_error(context):
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(engine)
+        return handle_error
+
+    def mark_down(self, engine: Engine):
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self.retry_seconds
+        logger.warning("Read replica %s marked down for %.0fs", engine.url.render_as_string(hide_password=True), self.retry_seconds)
+
+    def is_healthy(self, engine: Engine) -> bool:
+        return self._down_until.get(engine, 0) <= time.monotonic()
+
+    def pick(self) -> Optional[Engine]:
+        if not self.engines:
+            return None
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = self.engines[next(self._cycle)]
+                if self.is_healthy(engine):
+                    return engine
+        return None
+
+    def status(self) -> list:
+        return [
+            {"database": engine.url.render_as_string(hide_password=True), "healthy": self.is_healthy(engine)}
+            for engine in self.engines
+        ]
+
+
+class StickyWindow:
+    """
+    Clients (keyed by token or address) that wrote recently, with the time
+    until which their reads must stay on the primary.
+    """
+
+    def __init__(self, seconds: float = REPLICA_STICKY_SECONDS, max_clients: int = STICKY_MAX_CLIENTS):
+        self.seconds = seconds
+        self.max_clients = max_clients
+        self._until = {}
+        self._lock = threading.Lock()
+
+    def touch(self, client_key: Optional[str]):
+        if client_key is None or self.seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._until) >= self.max_clients:
+                self._until = {key: until for key, until in self._until.items() if until > now}
+            self._until[client_key] = now + self.seconds
+
+    def is_sticky(self, client_key: Optional[str]) -> bool:
+        return client_key is not None and self._until.get(client_key, 0) > time.monotonic()
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica when it was opened for a read-only
+    request (info["read_only"]) and a healthy replica exists; flushes and
+    INSERT/UPDATE/DELETE statements always go to the primary (the session's
+    bind), and so does everything after the session's first write. Committing
+    a write starts the client's sticky window. on_primary() sends a session's
+    remaining reads to the primary.
+
+    The replica is picked once per session (info["replica"]), so all reads of
+    a request share one connection and one snapshot. If that replica fails
+    mid-request, the failed statement is run again on the primary and the
+    rest of the session stays there.
+    """
+
+    replicas: ReplicaSet = ReplicaSet([])
+    sticky: StickyWindow = StickyWindow()
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+        if self.info.get("read_only") and not self.info.get("wrote") and not self.info.get("primary") and not self._flushing:
+            if "replica" not in self.info:
+                self.info["replica"] = self.replicas.pick()
+            if self.info["replica"] is not None:
+                return self.info["replica"]
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _retry_on_primary(self, run):
+        try:
+            return run()
+        except DBAPIError:
+            replica = self.info.get("replica")
+            # Only a replica this error just marked down; anything else is the
+            # statement's own failure
+            if replica is None or self.info.get("wrote") or self.replicas.is_healthy(replica):
+                raise
+            self.rollback()
+            self.info["replica"] = None
+            return run()
+
+    def execute(self, *args, **kw):
+        return self._retry_on_primary(lambda: super(RoutingSession, self).execute(*args, **kw))
+
+    def scalar(self, *args, **kw):
+        return self._retry_on_primary(lambda: super(RoutingSession, self).scalar(*args, **kw))
+
+    def scalars(self, *args, **kw):
+        return self._retry_on_primary(lambda: super(RoutingSession, self).scalars(*args, **kw))
+
+def on_primary(session: Session) -> Session:
+    """
+    Sends the session's remaining reads to the primary and returns it. For
+    results kept beyond the request (the report caches): computed on a lagging
+    replica right after a write invalidated them, they would be stored stale
+    for the cache's full TTL.
+    """
+    session.info["primary"] = True
+    return session
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary(session, flush_context):
+    session.info["wrote"] = True
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_sticky_window(session):
+    if session.info.get("wrote") or not session.info.get("read_only"):
+        RoutingSession.sticky.touch(session.info.get("client_key"))
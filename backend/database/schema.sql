@@ -122,6 +122,68 @@ CREATE TABLE IF NOT EXISTS attendance_records (
     UNIQUE (offering_id, student_id, attendance_date) -- Prevents duplicate entries
 );
 
+-- Attendance rollups, maintained by the attendance crud in the same transaction
+-- as attendance_records. Rebuild with: python -m scripts.rebuild_attendance_summary
+CREATE TABLE IF NOT EXISTS attendance_student_summary (
+    offering_id INT NOT NULL,
+    student_id VARCHAR(20) NOT NULL,
+    present_count INT NOT NULL DEFAULT 0,
+    absent_count INT NOT NULL DEFAULT 0,
+    leave_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (offering_id, student_id),
+    INDEX idx_attendance_student_summary_student (student_id),
+
+    CONSTRAINT fk_attend_summary_offering FOREIGN KEY (offering_id)
+        REFERENCES course_offerings(offering_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+
+    CONSTRAINT fk_attend_summary_student FOREIGN KEY (student_id)
+        REFERENCES students(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS attendance_daily_summary (
+    offering_id INT NOT NULL,
+    attendance_date DATE NOT NULL,
+    present_count INT NOT NULL DEFAULT 0,
+    absent_count INT NOT NULL DEFAULT 0,
+    leave_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (offering_id, attendance_date),
+
+    CONSTRAINT fk_attend_daily_offering FOREIGN KEY (offering_id)
+        REFERENCES course_offerings(offering_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- Nightly early-warning snapshot (scripts/snapshot_student_risk.py)
+CREATE TABLE IF NOT EXISTS student_risk_snapshot (
+    offering_id INT NOT NULL,
+    student_id VARCHAR(20) NOT NULL,
+    student_name VARCHAR(201) NOT NULL,
+    department VARCHAR(255),
+    course_id VARCHAR(20),
+    attendance_percentage FLOAT,
+    exam_percentage FLOAT,
+    exam_percentile FLOAT,
+    risk_score FLOAT NOT NULL,
+    risk_level VARCHAR(10) NOT NULL,
+    offering_rank INT NOT NULL,
+    overall_rank INT NOT NULL,
+    computed_at DATETIME NOT NULL,
+    PRIMARY KEY (offering_id, student_id),
+    INDEX idx_student_risk_offering_rank (offering_id, offering_rank),
+    INDEX idx_student_risk_overall_rank (overall_rank),
+    INDEX idx_student_risk_department_rank (department, overall_rank),
+
+    CONSTRAINT fk_student_risk_offering FOREIGN KEY (offering_id)
+        REFERENCES course_offerings(offering_id)
+        ON DELETE CASCADE ON UPDATE CASCADE,
+
+    CONSTRAINT fk_student_risk_student FOREIGN KEY (student_id)
+        REFERENCES students(student_id)
+        ON DELETE CASCADE ON UPDATE CASCADE
+);
+
 CREATE TABLE IF NOT EXISTS course_materials (
     material_id INT AUTO_INCREMENT PRIMARY KEY,
     offering_id INT NOT NULL,
@@ -194,5 +256,23 @@ CREATE TABLE IF NOT EXISTS admin_user_roles (
     PRIMARY KEY (admin_id, role_id)
 );
 
+-- Change counters of the reference tables and students, bumped by every write
+-- to them (database/table_versions.py); the ETags of the reference-data routes
+-- and the search indexes follow them
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(64) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL
+);
+
+INSERT IGNORE INTO table_versions (table_name, version, updated_at) VALUES
+    ('departments', 0, UTC_TIMESTAMP()),
+    ('sections', 0, UTC_TIMESTAMP()),
+    ('courses', 0, UTC_TIMESTAMP()),
+    ('course_prerequisites', 0, UTC_TIMESTAMP()),
+    ('course_offerings', 0, UTC_TIMESTAMP()),
+    ('instructors', 0, UTC_TIMESTAMP()),
+    ('students', 0, UTC_TIMESTAMP());
+
 -- Re-enable foreign key checks
 SET FOREIGN_KEY_CHECKS = 1;
\ No newline at end of file
@@ -0,0 +1,116 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import BigInteger, Column, DateTime, String, event, insert, select, update
+from sqlalchemy.orm import Session
+
+from database import Base
+from database.routing import RoutingSession
+
+# Change counters for the reference tables and students. A write to one of
+# them bumps its row in table_versions in the same transaction, so every worker
+# and replica sees the new version exactly when it sees the new data.
+# Conditional GETs (crud/conditional.py) compare the counters with the client's
+# ETag and skip the list query entirely when nothing changed; the in-process
+# search indexes (crud/search.py) rebuild when another process moved them.
+# Only the API's sessions (RoutingSession) bump; a script writing these tables
+# through a plain session should call bump_versions() before committing.
+VERSIONED_TABLES = ("departments", "sections", "courses", "course_prerequisites", "course_offerings", "instructors", "students")
+
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_versions(target, connection, **kw):
+    connection.execute(insert(TableVersion), [
+        {"table_name": name, "version": 0, "updated_at": _now()} for name in VERSIONED_TABLES
+    ])
+
+def _dependents(table) -> set:
+    """
+    Versioned tables whose rows change with `table`'s through ON DELETE / ON
+    UPDATE actions, which the database applies without the session seeing them.
+    """
+    names = set()
+    for other in table.metadata.tables.values():
+        for fk in other.foreign_keys:
+            if fk.column.table is table and (fk.ondelete or fk.onupdate) and other.name in VERSIONED_TABLES:
+                names.add(other.name)
+    return names
+
+def _touched(table, cascade: bool) -> set:
+    names = {table.name} if table.name in VERSIONED_TABLES else set()
+    if cascade:
+        names |= _dependents(table)
+    return names
+
+def bump_versions(session: Session, tables: Iterable[str]):
+    """
+    Increments the counters of `tables` inside the session's transaction, one
+    UPDATE for all of them; rows missing from an older database are inserted.
+    """
+    names = sorted(set(tables))
+    if not names:
+        return
+    now = _now()
+    result = session.execute(
+        update(TableVersion)
+        .where(TableVersion.table_name.in_(names))
+        .values(version=TableVersion.version + 1, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount < len(names):
+        existing = set(session.execute(select(TableVersion.table_name).where(TableVersion.table_name.in_(names))).scalars())
+        session.execute(insert(TableVersion), [
+            {"table_name": name, "version": 1, "updated_at": now} for name in names if name not in existing
+        ])
+
+@event.listens_for(RoutingSession, "after_flush")
+def _bump_flushed(session, flush_context):
+    tables = set()
+    for obj in session.new:
+        tables |= _touched(obj.__table__, cascade=False)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            tables |= _touched(obj.__table__, cascade=True)
+    for obj in session.deleted:
+        tables |= _touched(obj.__table__, cascade=True)
+    bump_versions(session, tables)
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _bump_executed(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE statements (query.delete(), insert() with a
+    # list of rows) bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table
+        if table.name != TableVersion.__tablename__:
+            bump_versions(orm_execute_state.session, _touched(table, cascade=not orm_execute_state.is_insert))
+
+def read_versions(db: Session, tables: Iterable[str]) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """
+    {table: (version, updated_at)} for `tables`, in one primary-key read.
+    """
+    names = sorted(set(tables))
+    rows = db.execute(
+        select(TableVersion.table_name, TableVersion.version, TableVersion.updated_at)
+        .where(TableVersion.table_name.in_(names))
+    ).all()
+    versions = {name: (0, None) for name in names}
+    versions.update({name: (version, updated_at) for name, version, updated_at in rows})
+    return versions
+
+def version_tag(versions: Dict[str, Tuple[int, Optional[datetime]]]) -> str:
+    # updated_at is part of the tag, so a recreated database starting again
+    # from version 0 does not reuse old tags
+    key = ";".join(f"{name}:{version}:{updated_at.isoformat() if updated_at else ''}" for name, (version, updated_at) in sorted(versions.items()))
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
@@ -1,14 +1,15 @@
 import os
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 import logging
 
 from routers.admin import instructor, student, course, department, section, pre_course, course_offerings
-from routers.shared import announcements
+from routers.shared import announcements, autocomplete
 from routers.instructor import (
     instructor_auth_router,
     instructor_course_router,
@@ -20,6 +21,13 @@ from routers.student import student_auth_router, attendance, exam_record, course
 from routers.admin import admin_auth_router
 from routers.admin import report as admin_report_router
 from routers.admin import admins as admin_router
+from crud.admin.report_jobs import report_jobs
+from crud.search import build_search_indexes
+from crud.pagination import PAGE_HEADERS
+from crud.conditional import CONDITIONAL_HEADERS
+import database
+from database import aio as database_aio
+from database.instrumentation import SQL_METRICS_ENDPOINT, SQLInstrumentationMiddleware, route_metrics
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +40,8 @@ app = FastAPI(
     title="University LMS API",
     description="Learning Management System API",
     version="1.0.0",
+    # orjson instead of the stdlib encoder for every route's JSON body
+    default_response_class=ORJSONResponse,
     # docs_url="/api/docs",
     # redoc_url="/api/redoc",
     # openapi_url="/api/openapi.json"
@@ -54,8 +64,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGE_HEADERS + CONDITIONAL_HEADERS,  # pagination cursor/total (crud/pagination.py), ETag (crud/conditional.py)
 )
 
+# Response compression, read from the environment:
+#
+#   LMS_GZIP_MIN_SIZE   bodies smaller than this many bytes are sent as is
+#   LMS_GZIP_LEVEL      zlib level, 1 (fastest) to 9 (smallest)
+#
+# Only for clients that send Accept-Encoding: gzip, which every browser does.
+GZIP_MIN_SIZE = int(os.getenv("LMS_GZIP_MIN_SIZE", "1000"))
+GZIP_LEVEL = int(os.getenv("LMS_GZIP_LEVEL", "5"))
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
+# Per-request query counts and timings (database/instrumentation.py)
+app.add_middleware(SQLInstrumentationMiddleware)
+
 # Error handling middleware
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -73,6 +97,20 @@ async def general_exception_handler(request: Request, exc: Exception):
         content={"detail": "An unexpected error occurred"}
     )
 
+@app.on_event("startup")
+def start_search_indexes():
+    # Built in the background; search and autocomplete use SQL until each
+    # index is ready
+    build_search_indexes()
+
+@app.on_event("shutdown")
+def shutdown_report_jobs():
+    report_jobs.shutdown()
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await database_aio.async_engine.dispose()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to University LMS API"}
@@ -81,9 +119,18 @@ async def root():
 async def health_check():
     return JSONResponse(
         status_code=200,
-        content={"status": "healthy", "message": "API is running"}
+        content={"status": "healthy", "message": "API is running", "database": database.database_status(), "async_database": database.pool_status(database_aio.async_engine.sync_engine)}
     )
 
+if SQL_METRICS_ENDPOINT:
+    @app.get("/metrics/sql", dependencies=[Depends(admin_auth_router.get_current_admin)])
+    async def sql_metrics():
+        return route_metrics.snapshot()
+
+    @app.delete("/metrics/sql", status_code=204, dependencies=[Depends(admin_auth_router.get_current_admin)])
+    async def reset_sql_metrics():
+        route_metrics.clear()
+
 # Include routers
 app.include_router(instructor.router, prefix="/api/instructors", tags=["Instructors"])
 app.include_router(instructor_auth_router.router, prefix="/api/instructor", tags=["Instructor Auth"])
@@ -95,6 +142,7 @@ app.include_router(course.router, prefix="/api/courses", tags=["Courses"])
 app.include_router(pre_course.router, prefix="/api/course_prerequisites", tags=["Course Prerequisites"])
 app.include_router(course_offerings.router, prefix="/api/course_offerings", tags=["Course Offerings"])
 app.include_router(announcements.router, prefix="/api/announcements", tags=["Announcements"])
+app.include_router(autocomplete.router, prefix="/api/autocomplete", tags=["Autocomplete"])
 app.include_router(admin_auth_router.router, prefix="/api", tags=["Admin Auth"])
 app.include_router(admin_router.router, prefix="/api/admin", tags=["Admin Management"])
 app.include_router(instructor_course_router.router, prefix="/api/instructor", tags=["Instructor Courses"])
@@ -0,0 +1,58 @@
+"""
+Alembic environment for the LMS schema.
+
+database/schema.sql is the baseline (revision 0001_baseline). Later schema
+changes are revisions in migrations/versions, applied from the backend directory:
+
+    alembic upgrade head                                   # LMS_DATABASE_URL, as the API
+    alembic revision --autogenerate -m "add some column"   # diff models against the database
+"""
+import importlib
+from logging.config import fileConfig
+from pathlib import Path
+
+from alembic import context
+
+import database
+import models
+from database.config import build_engine
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Import every model module so autogenerate sees the full metadata (the
+# models subpackages are namespace packages, so walk the files)
+MODELS_DIR = Path(models.__file__).parent
+for path in sorted(MODELS_DIR.rglob("*.py")):
+    if path.name != "__init__.py":
+        importlib.import_module(".".join(("models",) + path.relative_to(MODELS_DIR).with_suffix("").parts))
+target_metadata = database.Base.metadata
+
+def run_migrations_offline() -> None:
+    """
+    Emits the migration SQL (alembic upgrade head --sql) instead of running it.
+    """
+    context.configure(
+        url=database.SQLALCHEMY_DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    connectable = build_engine(database.SQLALCHEMY_DATABASE_URL)
+    try:
+        with connectable.connect() as connection:
+            context.configure(connection=connection, target_metadata=target_metadata)
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        connectable.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
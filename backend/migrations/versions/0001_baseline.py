@@ -0,0 +1,47 @@
+"""Baseline: the schema created by database/schema.sql
+
+Existing databases were set up from database/schema.sql; this revision stands
+for that schema. database/schema.sql never created the announcements table,
+so it is created here when missing.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table('announcements'):
+        return
+    op.create_table(
+        'announcements',
+        sa.Column('announcement_id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('sender_type', sa.String(50), nullable=False, server_default='Admin'),
+        sa.Column('sender_id', sa.String(20), nullable=True),
+        sa.Column('title', sa.String(255), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('recipient_type', sa.String(50), nullable=False),
+        sa.Column('recipient_ids', sa.Text(), nullable=True),
+        sa.Column('department_name', sa.String(255), sa.ForeignKey('departments.department_name'), nullable=True),
+        sa.Column('priority', sa.Enum('Normal', 'High', name='priority_enum'), nullable=False, server_default='Normal'),
+        sa.Column('valid_until', sa.Date(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_announcements_announcement_id', 'announcements', ['announcement_id'])
+
+
+def downgrade() -> None:
+    # The baseline schema is owned by database/schema.sql
+    pass
@@ -0,0 +1,56 @@
+"""Indexes for the hot access paths
+
+Student dashboards read attendance and exam records by student. Instructor
+and report screens read them by offering and date or exam type. Cohort
+reports filter students by program and section, enrollments are joined by
+offering, course materials are listed per offering, and announcement lists
+sort and filter by creation date and expiry.
+
+Revision ID: 0002_hot_path_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-18 00:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_hot_path_indexes'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('attendance_records', 'idx_attendance_student_offering', ['student_id', 'offering_id']),
+    ('attendance_records', 'idx_attendance_offering_date', ['offering_id', 'attendance_date']),
+    ('exam_records', 'idx_exam_records_offering_type', ['offering_id', 'exam_type']),
+    ('exam_records', 'idx_exam_records_student_offering', ['student_id', 'offering_id']),
+    ('student_course_enrollments', 'idx_enrollments_offering_student', ['offering_id', 'student_id']),
+    ('course_materials', 'idx_course_materials_offering', ['offering_id']),
+    ('students', 'idx_students_program', ['program']),
+    ('students', 'idx_students_section', ['section']),
+    ('announcements', 'idx_announcements_created_at', ['created_at']),
+    ('announcements', 'idx_announcements_valid_until', ['valid_until']),
+]
+
+
+def _existing_indexes(table: str) -> set:
+    if context.is_offline_mode():
+        return set()
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    # Databases created from the models (create_all) already have them
+    for table, name, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for table, name, columns in reversed(INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
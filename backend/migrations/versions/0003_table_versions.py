@@ -0,0 +1,44 @@
+"""Change counters for the reference tables
+
+Every write to departments, sections, courses, course_prerequisites,
+course_offerings or instructors bumps the table's row here in the same
+transaction. The reference-data routes derive their ETag from these counters
+and answer If-None-Match with 304 without running the list query.
+
+Revision ID: 0003_table_versions
+Revises: 0002_hot_path_indexes
+Create Date: 2026-10-18 00:00:02
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_table_versions'
+down_revision: Union[str, None] = '0002_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ['departments', 'sections', 'courses', 'course_prerequisites', 'course_offerings', 'instructors']
+
+
+def upgrade() -> None:
+    # Databases created from the models (create_all) already have it
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table('table_versions'):
+        return
+    table_versions = op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(64), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.bulk_insert(table_versions, [{'table_name': name, 'version': 0, 'updated_at': now} for name in VERSIONED_TABLES])
+
+
+def downgrade() -> None:
+    op.drop_table('table_versions')
@@ -0,0 +1,79 @@
+"""Normalized announcement recipients
+
+One row per target of an announcement (role, target type, target ID), so the
+student and instructor feeds find their announcements through an index
+instead of parsing recipient_ids in Python. Existing announcements are
+backfilled from recipient_type / recipient_ids / department_name; types the
+API does not know get no rows.
+
+Revision ID: 0004_announcement_recipients
+Revises: 0003_table_versions
+Create Date: 2026-10-18 00:00:03
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_announcement_recipients'
+down_revision: Union[str, None] = '0003_table_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# As RECIPIENT_TARGETS in crud/shared/announcements.py at this revision
+RECIPIENT_TARGETS = {
+    'all': [('student', 'all', None), ('instructor', 'all', None)],
+    'all_students': [('student', 'all', None)],
+    'all_instructors': [('instructor', 'all', None)],
+    'specific_students': [('student', 'id', 'recipient_ids')],
+    'specific_instructors': [('instructor', 'id', 'recipient_ids')],
+    'department_students': [('student', 'department', 'department_name')],
+    'department_instructors': [('instructor', 'department', 'department_name')],
+    'section_students': [('student', 'section', 'recipient_ids')],
+}
+
+
+def _targets(announcement) -> set:
+    sources = {
+        None: [''],
+        'recipient_ids': [part.strip() for part in (announcement.recipient_ids or '').split(',') if part.strip()],
+        'department_name': [announcement.department_name] if announcement.department_name else [],
+    }
+    return {
+        (announcement.announcement_id, role, target_type, target_id)
+        for role, target_type, source in RECIPIENT_TARGETS.get(announcement.recipient_type, [])
+        for target_id in sources[source]
+    }
+
+
+def upgrade() -> None:
+    # Databases created from the models (create_all) already have it
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table('announcement_recipients'):
+        return
+    recipients = op.create_table(
+        'announcement_recipients',
+        sa.Column('announcement_id', sa.Integer(), sa.ForeignKey('announcements.announcement_id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('role', sa.String(20), primary_key=True),
+        sa.Column('target_type', sa.String(20), primary_key=True),
+        sa.Column('target_id', sa.String(255), primary_key=True),
+    )
+    op.create_index('idx_announcement_recipients_target', 'announcement_recipients', ['role', 'target_type', 'target_id'])
+    if context.is_offline_mode():
+        return
+    announcements = op.get_bind().execute(sa.text(
+        'SELECT announcement_id, recipient_type, recipient_ids, department_name FROM announcements'
+    )).all()
+    rows = set().union(*(_targets(announcement) for announcement in announcements))
+    if rows:
+        op.bulk_insert(recipients, [
+            {'announcement_id': announcement_id, 'role': role, 'target_type': target_type, 'target_id': target_id}
+            for announcement_id, role, target_type, target_id in sorted(rows)
+        ])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_announcement_recipients_target', table_name='announcement_recipients')
+    op.drop_table('announcement_recipients')
@@ -0,0 +1,99 @@
+"""Attendance rollups and the student risk snapshot
+
+attendance_student_summary and attendance_daily_summary (kept in step with
+attendance_records by the attendance crud) and student_risk_snapshot (the
+nightly early-warning snapshot) were only added to database/schema.sql, so
+databases upgraded with alembic never got them. Each table is created when
+missing, and newly created rollups are backfilled from attendance_records.
+In offline mode (--sql) there is no backfill; run
+scripts/rebuild_attendance_summary.py after applying the SQL.
+
+Revision ID: 0005_rollup_and_risk_tables
+Revises: 0004_announcement_recipients
+Create Date: 2026-10-18 00:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_rollup_and_risk_tables'
+down_revision: Union[str, None] = '0004_announcement_recipients'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ['attendance_student_summary', 'attendance_daily_summary']
+
+
+def _offering_fk() -> sa.ForeignKey:
+    return sa.ForeignKey('course_offerings.offering_id', ondelete='CASCADE', onupdate='CASCADE')
+
+
+def _student_fk() -> sa.ForeignKey:
+    return sa.ForeignKey('students.student_id', ondelete='CASCADE', onupdate='CASCADE')
+
+
+def _counts() -> list:
+    return [sa.Column(name, sa.Integer(), nullable=False, server_default='0') for name in ('present_count', 'absent_count', 'leave_count')]
+
+
+def _missing(table: str) -> bool:
+    return context.is_offline_mode() or not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    created = []
+    if _missing('attendance_student_summary'):
+        op.create_table(
+            'attendance_student_summary',
+            sa.Column('offering_id', sa.Integer(), _offering_fk(), primary_key=True),
+            sa.Column('student_id', sa.String(20), _student_fk(), primary_key=True),
+            *_counts(),
+        )
+        op.create_index('idx_attendance_student_summary_student', 'attendance_student_summary', ['student_id'])
+        created.append('attendance_student_summary')
+    if _missing('attendance_daily_summary'):
+        op.create_table(
+            'attendance_daily_summary',
+            sa.Column('offering_id', sa.Integer(), _offering_fk(), primary_key=True),
+            sa.Column('attendance_date', sa.Date(), primary_key=True),
+            *_counts(),
+        )
+        created.append('attendance_daily_summary')
+    if _missing('student_risk_snapshot'):
+        op.create_table(
+            'student_risk_snapshot',
+            sa.Column('offering_id', sa.Integer(), _offering_fk(), primary_key=True),
+            sa.Column('student_id', sa.String(20), _student_fk(), primary_key=True),
+            sa.Column('student_name', sa.String(201), nullable=False),
+            sa.Column('department', sa.String(255)),
+            sa.Column('course_id', sa.String(20)),
+            sa.Column('attendance_percentage', sa.Float()),
+            sa.Column('exam_percentage', sa.Float()),
+            sa.Column('exam_percentile', sa.Float()),
+            sa.Column('risk_score', sa.Float(), nullable=False),
+            sa.Column('risk_level', sa.String(10), nullable=False),
+            sa.Column('offering_rank', sa.Integer(), nullable=False),
+            sa.Column('overall_rank', sa.Integer(), nullable=False),
+            sa.Column('computed_at', sa.DateTime(), nullable=False),
+        )
+        op.create_index('idx_student_risk_offering_rank', 'student_risk_snapshot', ['offering_id', 'offering_rank'])
+        op.create_index('idx_student_risk_overall_rank', 'student_risk_snapshot', ['overall_rank'])
+        op.create_index('idx_student_risk_department_rank', 'student_risk_snapshot', ['department', 'overall_rank'])
+
+    if created and not context.is_offline_mode():
+        # Imported here: the crud module pulls in the models, which env.py has
+        # already loaded for online runs
+        from crud.instructor.attendance_summary import rebuild_attendance_summaries
+        # The session joins alembic's transaction; its commit does not end it
+        rebuild_attendance_summaries(Session(bind=op.get_bind()))
+
+
+def downgrade() -> None:
+    op.drop_table('student_risk_snapshot')
+    op.drop_table('attendance_daily_summary')
+    op.drop_table('attendance_student_summary')
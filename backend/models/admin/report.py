@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
+from datetime import datetime
 
 # Exam Report
 class ExamReportFilter(BaseModel):
@@ -26,4 +27,29 @@ class AttendanceReportStats(BaseModel):
     total_students: int
     present: int
     absent: int
-    leave: int 
\ No newline at end of file
+    leave: int 
+
+# Report Jobs
+class ReportJobCreate(BaseModel):
+    report_type: str = Field(..., pattern="^(exam|attendance)$")
+    format: str = Field('xlsx', pattern="^(xlsx|csv|ndjson|parquet)$")
+    department: Optional[str] = None
+    semester: Optional[str] = None
+    course: Optional[str] = None
+    exam_type: Optional[str] = None  # exam reports only
+    from_date: Optional[str] = None  # attendance reports only, ISO date string
+    to_date: Optional[str] = None
+
+class ReportJobResponse(BaseModel):
+    job_id: str
+    report_type: str
+    format: str
+    status: str  # queued, running, completed, failed
+    progress: float
+    rows_written: int
+    total_rows: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    download_url: Optional[str] = None
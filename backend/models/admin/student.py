@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from pydantic import BaseModel
@@ -6,7 +6,11 @@ from typing import Optional
 
 class Student(Base):
     __tablename__ = "students"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('idx_students_program', 'program'),
+        Index('idx_students_section', 'section'),
+        {'extend_existing': True},
+    )
 
     student_id = Column(String(20), primary_key=True, index=True)  # Not auto-increment
     first_name = Column(String(100), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Float, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from database import Base
 from pydantic import BaseModel
@@ -23,6 +23,7 @@ class StudentCourseEnrollment(Base):
     # Ensure a student can enroll in a specific course offering only once
     __table_args__ = (
         UniqueConstraint('student_id', 'offering_id', name='unique_student_offering_enrollment'),
+        Index('idx_enrollments_offering_student', 'offering_id', 'student_id'),
     )
 
     def __repr__(self):
@@ -0,0 +1,59 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Index
+from database import Base
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+# Latest early-warning snapshot, one row per enrollment, rebuilt nightly by
+# scripts/snapshot_student_risk.py (crud/admin/student_risk.py). Names,
+# department and course are copied in so a dashboard page is one indexed read.
+
+class StudentRiskSnapshot(Base):
+    __tablename__ = "student_risk_snapshot"
+
+    offering_id = Column(Integer, ForeignKey("course_offerings.offering_id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    student_id = Column(String(20), ForeignKey("students.student_id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    student_name = Column(String(201), nullable=False)
+    department = Column(String(255))
+    course_id = Column(String(20))
+    attendance_percentage = Column(Float)
+    exam_percentage = Column(Float)
+    exam_percentile = Column(Float)
+    risk_score = Column(Float, nullable=False)
+    risk_level = Column(String(10), nullable=False)
+    offering_rank = Column(Integer, nullable=False)
+    overall_rank = Column(Integer, nullable=False)
+    computed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_student_risk_offering_rank', 'offering_id', 'offering_rank'),
+        Index('idx_student_risk_overall_rank', 'overall_rank'),
+        Index('idx_student_risk_department_rank', 'department', 'overall_rank'),
+    )
+
+    def __repr__(self):
+        return f"<StudentRiskSnapshot(offering_id={self.offering_id}, student_id='{self.student_id}', risk_score={self.risk_score})>"
+
+
+# Pydantic Models
+class StudentRiskResponse(BaseModel):
+    offering_id: int
+    student_id: str
+    student_name: str
+    department: Optional[str] = None
+    course_id: Optional[str] = None
+    attendance_percentage: Optional[float] = None
+    exam_percentage: Optional[float] = None
+    exam_percentile: Optional[float] = None
+    risk_score: float
+    risk_level: str
+    offering_rank: int
+    overall_rank: int
+    computed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class StudentRiskSnapshotResult(BaseModel):
+    rows: int
+    computed_at: datetime
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Enum, Text, Date, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Enum, Text, Date, DateTime, Index
 from sqlalchemy.orm import relationship
 from database import Base
 import enum
@@ -26,6 +26,8 @@ class Attendance(Base):
 
     __table_args__ = (
         UniqueConstraint('offering_id', 'student_id', 'attendance_date', name='unique_attendance_entry'),
+        Index('idx_attendance_student_offering', 'student_id', 'offering_id'),
+        Index('idx_attendance_offering_date', 'offering_id', 'attendance_date'),
     )
 
     def to_dict(self):
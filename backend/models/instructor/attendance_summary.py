@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Index
+from database import Base
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date
+
+# Rollup tables kept in step with attendance_records by
+# crud/instructor/attendance_records.py (same transaction as the raw write).
+# They can be rebuilt from the raw table with scripts/rebuild_attendance_summary.py
+
+class AttendanceStudentSummary(Base):
+    __tablename__ = "attendance_student_summary"
+
+    offering_id = Column(Integer, ForeignKey("course_offerings.offering_id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    student_id = Column(String(20), ForeignKey("students.student_id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    present_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+    leave_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('idx_attendance_student_summary_student', 'student_id'),
+    )
+
+    def __repr__(self):
+        return f"<AttendanceStudentSummary(offering_id={self.offering_id}, student_id='{self.student_id}')>"
+
+
+class AttendanceDailySummary(Base):
+    __tablename__ = "attendance_daily_summary"
+
+    offering_id = Column(Integer, ForeignKey("course_offerings.offering_id", ondelete="CASCADE", onupdate="CASCADE"), primary_key=True)
+    attendance_date = Column(Date, primary_key=True)
+    present_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+    leave_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AttendanceDailySummary(offering_id={self.offering_id}, attendance_date='{self.attendance_date}')>"
+
+
+# Pydantic Models
+class AttendanceCounts(BaseModel):
+    present_count: int
+    absent_count: int
+    leave_count: int
+    attendance_percentage: Optional[float] = None
+
+class AttendanceStudentSummaryResponse(AttendanceCounts):
+    offering_id: int
+    student_id: str
+
+    class Config:
+        from_attributes = True
+
+class AttendanceDailySummaryResponse(AttendanceCounts):
+    offering_id: int
+    attendance_date: date
+
+    class Config:
+        from_attributes = True
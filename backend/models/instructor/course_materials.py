@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Enum, Text, Date, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Enum, Text, Date, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from database import Base
 import enum
@@ -19,6 +19,7 @@ class CourseMaterial(Base):
 
     __table_args__ = (
         UniqueConstraint('file_path', name='unique_file_path'),
+        Index('idx_course_materials_offering', 'offering_id'),
     )
 
     def to_dict(self):
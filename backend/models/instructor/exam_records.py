@@ -1,10 +1,10 @@
 import enum
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum, DateTime, Index
 from sqlalchemy.orm import relationship
 from database import Base
 import enum
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 class ExamTypeEnum(enum.Enum):
@@ -16,7 +16,11 @@ class ExamTypeEnum(enum.Enum):
 
 class ExamRecord(Base):
     __tablename__ = "exam_records"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('idx_exam_records_offering_type', 'offering_id', 'exam_type'),
+        Index('idx_exam_records_student_offering', 'student_id', 'offering_id'),
+        {'extend_existing': True},
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     offering_id = Column(Integer, ForeignKey("course_offerings.offering_id"))
@@ -67,3 +71,23 @@ class ExamRecordResponse(ExamRecordBase):
 
     class Config:
         from_attributes = True
+
+class GradeHistogramBucket(BaseModel):
+    lower: float
+    upper: float
+    count: int
+
+class GradeDistribution(BaseModel):
+    exam_type: ExamTypeEnum
+    count: int
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    percentiles: Dict[str, float]
+    histogram: List[GradeHistogramBucket]
+
+class GradeDistributionResponse(BaseModel):
+    offering_id: int
+    exam_types: List[GradeDistribution]
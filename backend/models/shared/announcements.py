@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, date
 from pydantic import BaseModel, Field
@@ -26,11 +26,40 @@ class Announcement(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     department = relationship('Department', back_populates='announcements')
+    recipients = relationship('AnnouncementRecipient', back_populates='announcement', cascade='all, delete-orphan')
+
+    __table_args__ = (
+        Index('idx_announcements_created_at', 'created_at'),
+        Index('idx_announcements_valid_until', 'valid_until'),
+    )
 
     def __repr__(self):
         return f"<Announcement(title='{self.title}', sender='{self.sender_type}', recipient_type='{self.recipient_type}')>"
 
 
+class AnnouncementRecipient(Base):
+    """
+    Who an announcement is for, one row per target, derived from
+    recipient_type / recipient_ids / department_name when the announcement is
+    saved (crud/shared/announcements.py). `role` is 'student' or
+    'instructor'; `target_type` is 'all' (target_id ''), 'id' (a student or
+    instructor ID), 'department' or 'section'.
+    """
+    __tablename__ = "announcement_recipients"
+
+    announcement_id = Column(Integer, ForeignKey('announcements.announcement_id', ondelete='CASCADE'), primary_key=True)
+    role = Column(String(20), primary_key=True)
+    target_type = Column(String(20), primary_key=True)
+    target_id = Column(String(255), primary_key=True, default='')
+
+    announcement = relationship('Announcement', back_populates='recipients')
+
+    __table_args__ = (
+        # The per-user feed looks targets up by (role, type, id)
+        Index('idx_announcement_recipients_target', 'role', 'target_type', 'target_id'),
+    )
+
+
 # Pydantic models
 class AnnouncementBase(BaseModel):
     title: str = Field(..., max_length=255)
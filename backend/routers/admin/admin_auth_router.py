@@ -4,8 +4,10 @@ from typing import Optional
 from jose import jwt
 from jose.exceptions import JWTError
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from database import get_db
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.aio import get_async_db
 from models.admin.admins import AdminUser  # Adjust import if needed
 from passlib.context import CryptContext
 
@@ -32,9 +34,10 @@ async def get_current_admin(token: Optional[str] = Depends(OAuth2PasswordBearer(
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 @router.post("/token")
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    admin = db.query(AdminUser).filter(AdminUser.username == form_data.username).first()
-    if not admin or not pwd_context.verify(form_data.password, admin.password_hash):
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    admin = (await db.execute(select(AdminUser).where(AdminUser.username == form_data.username))).scalars().first()
+    # bcrypt is deliberately slow; keep it off the event loop
+    if not admin or not await run_in_threadpool(pwd_context.verify, form_data.password, admin.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
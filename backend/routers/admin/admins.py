@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Form, Body, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 from typing import List
 
 from database import get_db
+from crud.pagination import Keyset, PageParams, paginate
 from models.admin.admins import AdminUser, AdminRole, AdminPermission, AdminRolePermission, AdminUserRole
 from crud.admin import admins as admin_crud  # assuming the crud file is named admin_crud.py
 
@@ -63,18 +65,10 @@ def assign_permission(role_id: int = Form(...), permission_id: int = Form(...),
     return {"message": "Permission assigned to role"}
 
 @router.get("/all")
-def get_all_admins(db: Session = Depends(get_db)):
-    admins = db.query(AdminUser).all()
-    return [
-        {
-            "admin_id": admin.admin_id,
-            "username": admin.username,
-            "email": admin.email,
-            "full_name": admin.full_name,
-            "created_at": admin.created_at
-        }
-        for admin in admins
-    ]
+def get_all_admins(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    # A fixed projection: password hashes are never selected
+    fields = ["admin_id", "username", "email", "full_name", "created_at"]
+    return page.respond(response, paginate(db, select(AdminUser), Keyset(AdminUser.admin_id), page, fields=fields))
 
 @router.get("/{admin_id}")
 def get_admin(admin_id: int, db: Session = Depends(get_db)):
@@ -104,7 +98,6 @@ def update_admin(admin_id: int, db: Session = Depends(get_db), username: str = B
         from crud.admin.admins import hash_password
         admin.password_hash = hash_password(password)
     db.commit()
-    db.refresh(admin)
     return {"message": "Admin updated", "admin_id": admin.admin_id}
 
 @router.delete("/{admin_id}")
@@ -117,17 +110,11 @@ def delete_admin(admin_id: int, db: Session = Depends(get_db)):
     return {"message": "Admin deleted"}
 
 @router.get("/roles/all")
-def get_all_roles(db: Session = Depends(get_db)):
-    roles = db.query(AdminRole).all()
-    return [
-        {"role_id": role.role_id, "role_name": role.role_name, "description": role.description}
-        for role in roles
-    ]
+def get_all_roles(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    fields = ["role_id", "role_name", "description"]
+    return page.respond(response, paginate(db, select(AdminRole), Keyset(AdminRole.role_id), page, fields=fields))
 
 @router.get("/permissions/all")
-def get_all_permissions(db: Session = Depends(get_db)):
-    permissions = db.query(AdminPermission).all()
-    return [
-        {"permission_id": perm.permission_id, "permission_name": perm.permission_name, "description": perm.description}
-        for perm in permissions
-    ]
+def get_all_permissions(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    fields = ["permission_id", "permission_name", "description"]
+    return page.respond(response, paginate(db, select(AdminPermission), Keyset(AdminPermission.permission_id), page, fields=fields))
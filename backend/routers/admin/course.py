@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response, Query
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.search import SEARCH_LIMIT_DEFAULT, SEARCH_LIMIT_MAX
+from crud.conditional import reference_data
 from crud.admin  import course as crud
 import shutil
 import os
@@ -27,20 +30,24 @@ def create_course(
     return crud.create_course(db, course_data)
 
 # GET all courses
-@router.get("/")
-def get_courses(db: Session = Depends(get_db)):
-    return crud.get_courses(db)
+@router.get("/", dependencies=[reference_data("courses")])
+def get_courses(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_courses(db, page))
 
 # SEARCH course by name or ID
-@router.get("/search/")
-def search_course(keyword: str, db: Session = Depends(get_db)):
-    result = crud.search_course(db, keyword)
+@router.get("/search/", dependencies=[reference_data("courses")])
+def search_course(
+    keyword: str,
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    db: Session = Depends(get_db)
+):
+    result = crud.search_course(db, keyword, limit)
     if not result:
         raise HTTPException(status_code=404, detail="course not found")
     return result
 
 # VIEW course by ID (renamed path for clarity)
-@router.get("/id/{course_id}") # <-- CHANGED THIS LINE
+@router.get("/id/{course_id}", dependencies=[reference_data("courses")]) # <-- CHANGED THIS LINE
 def get_course_by_id_endpoint(course_id: str, db: Session = Depends(get_db)): # Renamed function for clarity
     course = crud.get_course_by_id(db, course_id)
     if not course:
@@ -48,7 +55,7 @@ def get_course_by_id_endpoint(course_id: str, db: Session = Depends(get_db)): #
     return course
 
 # VIEW course by name (renamed path for clarity)
-@router.get("/name/{course_name}") # <-- CHANGED THIS LINE
+@router.get("/name/{course_name}", dependencies=[reference_data("courses")]) # <-- CHANGED THIS LINE
 def get_course_by_name_endpoint(course_name: str, db: Session = Depends(get_db)): # Renamed function for clarity
     course = crud.get_course_by_name(db, course_name)
     if not course:
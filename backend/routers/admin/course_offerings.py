@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, status
+from fastapi import APIRouter, Depends, HTTPException, Form, status, Response
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.conditional import reference_data
 from pydantic import BaseModel
 from crud.admin  import course_offerings as crud_offering
 from crud.admin  import course as crud_course
@@ -84,13 +86,13 @@ def create_offering(
 
 
 # --- Get All ---
-@router.get("/", response_model=list[CourseOfferingRead])
-def get_all_offerings(db: Session = Depends(get_db)):
-    return crud_offering.get_all_course_offerings(db)
+@router.get("/", response_model=list[CourseOfferingRead], dependencies=[reference_data("course_offerings")])
+def get_all_offerings(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud_offering.get_all_course_offerings(db, page), CourseOfferingRead)
 
 
 # --- Get by ID ---
-@router.get("/{offering_id}", response_model=CourseOfferingRead)
+@router.get("/{offering_id}", response_model=CourseOfferingRead, dependencies=[reference_data("course_offerings")])
 def get_offering_by_id(offering_id: int, db: Session = Depends(get_db)):
     offering = crud_offering.get_course_offering_by_id(db, offering_id)
     if not offering:
@@ -99,15 +101,15 @@ def get_offering_by_id(offering_id: int, db: Session = Depends(get_db)):
 
 
 # --- Get by Course ---
-@router.get("/course/{course_id}", response_model=list[CourseOfferingRead])
-def get_offerings_by_course(course_id: str, db: Session = Depends(get_db)):
-    return crud_offering.get_offerings_by_course(db, course_id)
+@router.get("/course/{course_id}", response_model=list[CourseOfferingRead], dependencies=[reference_data("course_offerings")])
+def get_offerings_by_course(course_id: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud_offering.get_offerings_by_course(db, course_id, page), CourseOfferingRead)
 
 
 # --- Get by Instructor ---
-@router.get("/instructor/{instructor_id}", response_model=list[CourseOfferingRead])
-def get_offerings_by_instructor(instructor_id: str, db: Session = Depends(get_db)):
-    return crud_offering.get_offerings_by_instructor(db, instructor_id)
+@router.get("/instructor/{instructor_id}", response_model=list[CourseOfferingRead], dependencies=[reference_data("course_offerings")])
+def get_offerings_by_instructor(instructor_id: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud_offering.get_offerings_by_instructor(db, instructor_id, page), CourseOfferingRead)
 
 
 # --- Update ---
@@ -144,26 +146,17 @@ def update_offering(
 
 
 # --- Get by Section with Details (New Functionality) ---
-@router.get("/section/{section_name}/details", response_model=list[CourseOfferingNestedResponse])
+@router.get("/section/{section_name}/details", response_model=list[CourseOfferingNestedResponse], dependencies=[reference_data("course_offerings", "courses", "instructors")])
 def get_offerings_by_section_details(
     section_name: str,
+    response: Response,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    details = crud_offering.get_course_offerings_by_section_details(db, section_name)
-    if not details:
+    details = crud_offering.get_course_offerings_by_section_details(db, section_name, page)
+    if not details.items:
         raise HTTPException(status_code=404, detail="No course offerings found for this section.")
-
-    # Map the returned tuples/rows to the nested Pydantic model
-    return [
-        CourseOfferingNestedResponse(
-            offering_id=d[0],
-            capacity=d[1],
-            section_name=section_name,
-            course_rel={"course_name": d[2]},
-            instructor_rel={"first_name": d[3], "last_name": d[4]}
-        )
-        for d in details
-    ]
+    return page.respond(response, details, CourseOfferingNestedResponse)
 
 # --- Delete ---
 @router.delete("/{offering_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.conditional import reference_data
 from crud.admin  import department as crud
 import shutil
 import os
@@ -22,12 +24,12 @@ def create_department(
     return crud.create_department(db, department_data)
 
 # GET all departments
-@router.get("/")
-def get_department(db: Session = Depends(get_db)):
-    return crud.get_department(db)
+@router.get("/", dependencies=[reference_data("departments")])
+def get_department(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_department(db, page))
 
 # SEARCH instructor by name 
-@router.get("/search/")
+@router.get("/search/", dependencies=[reference_data("departments")])
 def search_department(keyword: str, db: Session = Depends(get_db)):
     result = crud.search_department(db, keyword)
     if not result:
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response, Query
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.search import SEARCH_LIMIT_DEFAULT, SEARCH_LIMIT_MAX
 from crud.admin  import instructor as crud
 import shutil
 import os
@@ -48,13 +50,17 @@ def create_instructor(
 
 # GET all instructors
 @router.get("/")
-def get_instructors(db: Session = Depends(get_db)):
-    return crud.get_instructors(db)
+def get_instructors(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_instructors(db, page))
 
 # SEARCH instructor by name or ID
 @router.get("/search/")
-def search_instructor(keyword: str, db: Session = Depends(get_db)):
-    result = crud.search_instructor(db, keyword)
+def search_instructor(
+    keyword: str,
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    db: Session = Depends(get_db)
+):
+    result = crud.search_instructor(db, keyword, limit)
     if not result:
         raise HTTPException(status_code=404, detail="Instructor not found")
     return result
@@ -1,8 +1,10 @@
 # routers/course_prerequisites.py
 
-from fastapi import APIRouter, Depends, Form, HTTPException, status
+from fastapi import APIRouter, Depends, Form, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.conditional import reference_data
 from crud.admin  import pre_course as crud_prereq # Your new CRUD file
 from crud.admin  import course as crud_course # Assuming you have a separate CRUD for main Courses
 
@@ -53,33 +55,33 @@ def assign_prerequisite(
     return new_link
 
 # --- Endpoint to Get All Prerequisite Links (for admin overview) ---
-@router.get("/", response_model=list[CoursePrerequisiteRead])
-def get_all_prerequisite_links(db: Session = Depends(get_db)):
-    return crud_prereq.get_all_prerequisite_links(db)
+@router.get("/", response_model=list[CoursePrerequisiteRead], dependencies=[reference_data("course_prerequisites")])
+def get_all_prerequisite_links(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud_prereq.get_all_prerequisite_links(db, page), CoursePrerequisiteRead)
 
 # --- Endpoint to Get Prerequisites FOR a specific main course ---
-@router.get("/{main_course_id}/prerequisites", response_model=list[CoursePrerequisiteRead])
-def get_prerequisites_for_a_specific_course(main_course_id: str, db: Session = Depends(get_db)):
+@router.get("/{main_course_id}/prerequisites", response_model=list[CoursePrerequisiteRead], dependencies=[reference_data("courses", "course_prerequisites")])
+def get_prerequisites_for_a_specific_course(main_course_id: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
     # Optional: Check if main_course_id actually exists in 'courses'
     if not crud_course.get_course_by_id(db, main_course_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Course with ID '{main_course_id}' not found.")
 
-    prerequisites = crud_prereq.get_prerequisites_for_course(db, main_course_id)
+    prerequisites = crud_prereq.get_prerequisites_for_course(db, main_course_id, page)
     # if not prerequisites: # Decide if 404 for no prereqs or empty list is better
     #     raise HTTPException(status_code=404, detail=f"No prerequisites found for course {main_course_id}")
-    return prerequisites
+    return page.respond(response, prerequisites, CoursePrerequisiteRead)
 
 # --- Endpoint to Get Courses FOR WHICH a specific course IS a prerequisite ---
-@router.get("/{prereq_course_id}/required_by", response_model=list[CoursePrerequisiteRead])
-def get_courses_requiring_this_prereq_course(prereq_course_id: str, db: Session = Depends(get_db)):
+@router.get("/{prereq_course_id}/required_by", response_model=list[CoursePrerequisiteRead], dependencies=[reference_data("courses", "course_prerequisites")])
+def get_courses_requiring_this_prereq_course(prereq_course_id: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
     # Optional: Check if prereq_course_id actually exists in 'courses'
     if not crud_course.get_course_by_id(db, prereq_course_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Prerequisite course with ID '{prereq_course_id}' not found.")
         
-    courses_requiring_it = crud_prereq.get_courses_requiring_this_prereq(db, prereq_course_id)
+    courses_requiring_it = crud_prereq.get_courses_requiring_this_prereq(db, prereq_course_id, page)
     # if not courses_requiring_it: # Decide if 404 for no courses or empty list is better
     #     raise HTTPException(status_code=404, detail=f"Course {prereq_course_id} is not a prerequisite for any other course")
-    return courses_requiring_it
+    return page.respond(response, courses_requiring_it, CoursePrerequisiteRead)
 
 # --- Endpoint to Delete a specific Prerequisite Link ---
 @router.delete("/{course_id}/{prereq_course_id}", status_code=status.HTTP_204_NO_CONTENT)
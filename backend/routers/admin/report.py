@@ -1,14 +1,26 @@
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import StreamingResponse, FileResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from crud.admin import report as crud_report
-from models.admin.report import ExamReportStats, AttendanceReportStats
+from crud.admin import report_export
+from crud.admin.report_cache import report_cache
+from crud.admin.report_jobs import report_jobs
+from crud.instructor import grade_distribution as crud_grades
+from crud.admin import student_risk as crud_risk
+from models.admin.report import ExamReportStats, AttendanceReportStats, ReportJobCreate, ReportJobResponse
+from models.instructor.exam_records import ExamTypeEnum, GradeDistributionResponse
+from models.admin.student_risk import StudentRiskResponse, StudentRiskSnapshotResult
 from database import get_db
-import io
-import pandas as pd
 
 router = APIRouter(prefix="/reports", tags=["Admin Reports"])
 
+def _export_response(export: dict, fmt: str):
+    # Detailed export, streamed from a server-side cursor in the requested format
+    export_format = report_export.EXPORT_FORMATS[fmt]
+    headers = {'Content-Disposition': f"attachment; filename={export['name']}.{export_format['extension']}"}
+    return StreamingResponse(report_export.iter_report_chunks(fmt, export), media_type=export_format['media_type'], headers=headers)
+
 @router.get("/exam", response_model=ExamReportStats)
 def get_exam_report(
     department: Optional[str] = Query(None),
@@ -16,31 +28,12 @@ def get_exam_report(
     course: Optional[str] = Query(None),
     exam_type: Optional[str] = Query(None),
     export: Optional[bool] = Query(False),
+    format: Optional[str] = Query(None, pattern=report_export.EXPORT_FORMAT_PATTERN),
     db: Session = Depends(get_db)
 ):
-    stats = crud_report.get_exam_report_stats(db, department, semester, course, exam_type)
-    if export:
-        # Detailed export
-        detailed_rows = crud_report.get_exam_report_detailed_rows(db, department, semester, course, exam_type)
-        df = pd.DataFrame(detailed_rows)
-        # Add filter info as a header row
-        filter_info = {
-            'Department': department,
-            'Semester': semester,
-            'Course ID': detailed_rows[0]['Course ID'] if detailed_rows else course,
-            'Course Name': detailed_rows[0]['Course Name'] if detailed_rows else '',
-            'Exam Type': exam_type
-        }
-        # Insert filter info as the first row (optional)
-        df_filters = pd.DataFrame([filter_info])
-        df = pd.concat([df_filters, df], ignore_index=True)
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Exam Report')
-        output.seek(0)
-        headers = {'Content-Disposition': 'attachment; filename=exam_report.xlsx'}
-        return Response(content=output.read(), media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', headers=headers)
-    return stats
+    if export or format:
+        return _export_response(crud_report.get_exam_report_export(db, department, semester, course, exam_type), format or 'xlsx')
+    return crud_report.get_cached_exam_report_stats(db, department, semester, course, exam_type)
 
 @router.get("/attendance", response_model=AttendanceReportStats)
 def get_attendance_report(
@@ -50,28 +43,95 @@ def get_attendance_report(
     from_date: Optional[str] = Query(None),
     to_date: Optional[str] = Query(None),
     export: Optional[bool] = Query(False),
+    format: Optional[str] = Query(None, pattern=report_export.EXPORT_FORMAT_PATTERN),
+    db: Session = Depends(get_db)
+):
+    if export or format:
+        return _export_response(crud_report.get_attendance_report_export(db, department, semester, course, from_date, to_date), format or 'xlsx')
+    return crud_report.get_cached_attendance_report_stats(db, department, semester, course, from_date, to_date)
+
+@router.get("/grade-distribution", response_model=GradeDistributionResponse)
+def get_grade_distribution_report(
+    course: int = Query(..., description="Offering ID"),
+    exam_type: Optional[ExamTypeEnum] = Query(None),
+    db: Session = Depends(get_db)
+):
+    return crud_grades.get_cached_grade_distribution(db, course, exam_type.value if exam_type else None)
+
+# -------------------- AT-RISK STUDENTS --------------------
+# Served from the nightly snapshot; live=true scores one offering on the spot,
+# optionally with different thresholds (which are rejected without live=true).
+
+@router.get("/at-risk", response_model=List[StudentRiskResponse])
+def get_at_risk_students(
+    course: Optional[int] = Query(None, description="Offering ID"),
+    department: Optional[str] = Query(None),
+    risk_level: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
+    limit: int = Query(50, ge=1, le=500),
+    live: bool = Query(False),
+    attendance_threshold: Optional[float] = Query(None, gt=0, le=100),
+    exam_threshold: Optional[float] = Query(None, gt=0, le=100),
+    attendance_weight: Optional[float] = Query(None, ge=0),
+    exam_weight: Optional[float] = Query(None, ge=0),
     db: Session = Depends(get_db)
 ):
-    stats = crud_report.get_attendance_report_stats(db, department, semester, course, from_date, to_date)
-    if export:
-        detailed_rows = crud_report.get_attendance_report_detailed_rows(db, department, semester, course, from_date, to_date)
-        df = pd.DataFrame(detailed_rows)
-        # Build filter row with all columns from df
-        filter_info = {col: '' for col in df.columns}
-        filter_info.update({
-            'Department': department,
-            'Semester': semester,
-            'Course ID': detailed_rows[0]['Course ID'] if detailed_rows and 'Course ID' in detailed_rows[0] else course,
-            'Course Name': detailed_rows[0]['Course Name'] if detailed_rows and 'Course Name' in detailed_rows[0] else '',
-            'From Date': from_date,
-            'To Date': to_date
-        })
-        df_filters = pd.DataFrame([filter_info])
-        df = pd.concat([df_filters, df], ignore_index=True)
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Attendance Report')
-        output.seek(0)
-        headers = {'Content-Disposition': 'attachment; filename=attendance_report.xlsx'}
-        return Response(content=output.read(), media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', headers=headers)
-    return stats 
\ No newline at end of file
+    thresholds = {
+        name: value for name, value in (
+            ("attendance_threshold", attendance_threshold),
+            ("exam_threshold", exam_threshold),
+            ("attendance_weight", attendance_weight),
+            ("exam_weight", exam_weight),
+        ) if value is not None
+    }
+    if not live:
+        # The snapshot was scored with the configured thresholds; it cannot honour others
+        if thresholds:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{', '.join(thresholds)} only apply with live=true")
+        return crud_risk.get_risk_snapshot(db, offering_id=course, department=department, risk_level=risk_level, limit=limit)
+    if course is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Live scoring needs a course (offering ID)")
+    return crud_risk.get_live_risk(db, course, risk_level=risk_level, limit=limit, **thresholds)
+
+@router.post("/at-risk/snapshot", response_model=StudentRiskSnapshotResult)
+def rebuild_at_risk_snapshot(db: Session = Depends(get_db)):
+    return crud_risk.rebuild_risk_snapshot(db)
+
+@router.get("/cache/stats")
+def get_report_cache_stats():
+    return report_cache.stats()
+
+@router.delete("/cache")
+def clear_report_cache():
+    report_cache.clear()
+    return {"message": "Report cache cleared"}
+
+# -------------------- REPORT JOBS --------------------
+# Large exports run in the background: POST the filters, poll the job, then download the file.
+
+def _job_response(job):
+    data = job.to_dict()
+    if job.status == "completed":
+        data["download_url"] = f"/api/admin/reports/jobs/{job.job_id}/download"
+    return data
+
+@router.post("/jobs", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(job_request: ReportJobCreate):
+    job = report_jobs.submit(job_request.report_type, job_request.format, job_request.dict(exclude={"report_type", "format"}))
+    return _job_response(job)
+
+@router.get("/jobs/{job_id}", response_model=ReportJobResponse)
+def get_report_job(job_id: str):
+    job = report_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return _job_response(job)
+
+@router.get("/jobs/{job_id}/download")
+def download_report_job(job_id: str):
+    job = report_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if job.status != "completed":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Report job is {job.status}")
+    return FileResponse(path=job.file_path, filename=job.filename, media_type=report_export.EXPORT_FORMATS[job.format]['media_type'])
+
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response, Query
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.search import SEARCH_LIMIT_DEFAULT, SEARCH_LIMIT_MAX
+from crud.conditional import reference_data
 from crud.admin  import section as crud
 import shutil
 import os
@@ -25,20 +28,24 @@ def create_section(
     return crud.create_section(db, section_data)
 
 # GET all sections
-@router.get("/")
-def get_sections(db: Session = Depends(get_db)):
-    return crud.get_sections(db)
+@router.get("/", dependencies=[reference_data("sections")])
+def get_sections(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_sections(db, page))
 
 # SEARCH section by name or ID
-@router.get("/search/")
-def search_section(keyword: str, db: Session = Depends(get_db)):
-    result = crud.search_section(db, keyword)
+@router.get("/search/", dependencies=[reference_data("sections")])
+def search_section(
+    keyword: str,
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    db: Session = Depends(get_db)
+):
+    result = crud.search_section(db, keyword, limit)
     if not result:
         raise HTTPException(status_code=404, detail="section not found")
     return result
 
 # VIEW section by ID
-@router.get("/{section_name}")
+@router.get("/{section_name}", dependencies=[reference_data("sections")])
 def get_section(section_name: str, db: Session = Depends(get_db)):
     section = crud.get_section_by_name(db, section_name)
     if not section:
@@ -73,6 +80,6 @@ def delete_section(section_name: str, db: Session = Depends(get_db)):
     return {"message": "section deleted successfully"}
 
 # GET sections by department and semester
-@router.get("/by-department-semester/")
-def get_sections_by_department_semester(department: str, semester: str, db: Session = Depends(get_db)):
-    return crud.get_sections_by_department_semester(db, department, semester)
+@router.get("/by-department-semester/", dependencies=[reference_data("sections")])
+def get_sections_by_department_semester(department: str, semester: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_sections_by_department_semester(db, department, semester, page))
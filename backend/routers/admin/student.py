@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Response, Query
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
+from crud.search import SEARCH_LIMIT_DEFAULT, SEARCH_LIMIT_MAX
 from crud.admin  import student as crud
 import shutil
 import os
@@ -46,13 +48,17 @@ def create_student(
 
 # GET all students
 @router.get("/")
-def get_students(db: Session = Depends(get_db)):
-    return crud.get_students(db)
+def get_students(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, crud.get_students(db, page))
 
 # SEARCH student by name or ID
 @router.get("/search/")
-def search_student(keyword: str, db: Session = Depends(get_db)):
-    result = crud.search_student(db, keyword)
+def search_student(
+    keyword: str,
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    db: Session = Depends(get_db)
+):
+    result = crud.search_student(db, keyword, limit)
     if not result:
         raise HTTPException(status_code=404, detail="student not found")
     return result
@@ -4,9 +4,12 @@ from typing import List, Optional
 from datetime import date
 
 from database import get_db
+from crud.serialization import json_list
 from crud.instructor import attendance_records as crud_attendance
+from crud.instructor import attendance_summary as crud_attendance_summary
 from crud.admin import student as crud_student
 from models.instructor.attendance_records import Attendance, AttendanceStatusEnum, AttendanceCreate, AttendanceUpdate, AttendanceResponse
+from models.instructor.attendance_summary import AttendanceStudentSummaryResponse, AttendanceDailySummaryResponse
 from models.admin.student import StudentResponse
 from routers.instructor.instructor_auth_router import get_current_instructor
 
@@ -23,7 +26,7 @@ def get_attendance_records_for_offering(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud_attendance.get_attendance_records(db, offering_id)
-    return [AttendanceResponse.from_orm(record) for record in records]
+    return json_list(AttendanceResponse, records)
 
 @router.get("/offering/{offering_id}/date/{date_val}", response_model=List[AttendanceResponse])
 def get_attendance_by_specific_date(
@@ -36,7 +39,7 @@ def get_attendance_by_specific_date(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud_attendance.get_attendance_by_date(db, offering_id, date_val)
-    return [AttendanceResponse.from_orm(record) for record in records]
+    return json_list(AttendanceResponse, records)
 
 @router.get("/offering/{offering_id}/date-range/", response_model=List[AttendanceResponse])
 def get_attendance_by_date_range_api(
@@ -50,7 +53,7 @@ def get_attendance_by_date_range_api(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud_attendance.get_attendance_by_date_range(db, offering_id, start_date, end_date)
-    return [AttendanceResponse.from_orm(record) for record in records]
+    return json_list(AttendanceResponse, records)
 
 @router.get("/student/{student_id}", response_model=List[AttendanceResponse])
 def get_student_attendance_api(
@@ -63,7 +66,7 @@ def get_student_attendance_api(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud_attendance.get_attendance_by_student(db, student_id, offering_id)
-    return [AttendanceResponse.from_orm(record) for record in records]
+    return json_list(AttendanceResponse, records)
 
 @router.get("/offering/{offering_id}/students", response_model=List[StudentResponse])
 def get_students_in_offering(
@@ -77,7 +80,31 @@ def get_students_in_offering(
     students = crud_student.get_students_by_offering_id(db, offering_id)
     if not students:
         return []
-    return [StudentResponse.from_orm(student) for student in students]
+    return json_list(StudentResponse, students)
+
+@router.get("/offering/{offering_id}/summary/students", response_model=List[AttendanceStudentSummaryResponse])
+def get_offering_student_summary(
+    offering_id: int,
+    db: Session = Depends(get_db),
+    current_instructor: Optional[dict] = Depends(get_current_instructor)
+):
+    if not current_instructor:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
+    
+    return crud_attendance_summary.get_offering_student_summaries(db, offering_id)
+
+@router.get("/offering/{offering_id}/summary/dates", response_model=List[AttendanceDailySummaryResponse])
+def get_offering_daily_summary(
+    offering_id: int,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_instructor: Optional[dict] = Depends(get_current_instructor)
+):
+    if not current_instructor:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
+    
+    return crud_attendance_summary.get_offering_daily_summaries(db, offering_id, start_date, end_date)
 
 @router.post("", response_model=AttendanceResponse, status_code=status.HTTP_201_CREATED)
 def add_attendance_record_api(
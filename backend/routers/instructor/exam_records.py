@@ -4,8 +4,10 @@ from typing import List, Optional
 from datetime import datetime
 
 from database import get_db
-from models.instructor.exam_records import ExamRecord, ExamTypeEnum, ExamRecordCreate, ExamRecordUpdate, ExamRecordResponse
+from crud.serialization import json_list
+from models.instructor.exam_records import ExamRecord, ExamTypeEnum, ExamRecordCreate, ExamRecordUpdate, ExamRecordResponse, GradeDistributionResponse
 from crud.instructor import exam_records as crud
+from crud.instructor import grade_distribution as crud_grades
 from routers.instructor.instructor_auth_router import get_current_instructor
 
 router = APIRouter(prefix="/exam-records", tags=["Instructor Exam Records"])
@@ -21,7 +23,7 @@ def get_exam_records_for_offering(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud.get_exam_records(db, offering_id)
-    return [ExamRecordResponse.from_orm(record) for record in records]
+    return json_list(ExamRecordResponse, records)
 
 @router.get("/offering/{offering_id}/date/{date_val}", response_model=List[ExamRecordResponse])
 def get_exam_by_specific_date(
@@ -34,7 +36,7 @@ def get_exam_by_specific_date(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud.get_exam_by_date(db, offering_id, date_val)
-    return [ExamRecordResponse.from_orm(record) for record in records]
+    return json_list(ExamRecordResponse, records)
 
 @router.get("/offering/{offering_id}/date-range/", response_model=List[ExamRecordResponse])
 def get_exam_by_date_range_api(
@@ -48,7 +50,19 @@ def get_exam_by_date_range_api(
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
     
     records = crud.get_exam_by_date_range(db, offering_id, start_date, end_date)
-    return [ExamRecordResponse.from_orm(record) for record in records]
+    return json_list(ExamRecordResponse, records)
+
+@router.get("/offering/{offering_id}/distribution", response_model=GradeDistributionResponse)
+def get_grade_distribution_api(
+    offering_id: int,
+    exam_type: Optional[ExamTypeEnum] = None,
+    db: Session = Depends(get_db),
+    current_instructor: Optional[dict] = Depends(get_current_instructor)
+):
+    if not current_instructor:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
+    
+    return crud_grades.get_cached_grade_distribution(db, offering_id, exam_type.value if exam_type else None)
 
 @router.post("", response_model=ExamRecordResponse, status_code=status.HTTP_201_CREATED)
 def add_exam_record_api(
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from database import get_db
 from crud.instructor import instructor_course_crud
+from crud.admin import student_risk as crud_risk
 from models.instructor.course_offerings import CourseOfferingResponse
+from models.admin.student_risk import StudentRiskResponse
 from routers.instructor.instructor_auth_router import get_current_instructor
 
 router = APIRouter( tags=["Instructor Courses"])
@@ -38,4 +40,19 @@ def get_instructor_courses(
         return courses
     except Exception as e:
         print(f"DEBUG: Error in get_course_offerings_by_instructor_id: {e}") # Debugging line
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch courses: {e}") 
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch courses: {e}")
+
+@router.get("/courses/{offering_id}/at-risk", response_model=List[StudentRiskResponse])
+def get_course_at_risk_students(
+    offering_id: int,
+    risk_level: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
+    limit: int = Query(50, ge=1, le=500),
+    live: bool = Query(False, description="Score now instead of reading the nightly snapshot"),
+    db: Session = Depends(get_db),
+    current_instructor: Optional[dict] = Depends(get_current_instructor)
+):
+    if not current_instructor:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated as instructor")
+    if live:
+        return crud_risk.get_live_risk(db, offering_id, risk_level=risk_level, limit=limit)
+    return crud_risk.get_risk_snapshot(db, offering_id=offering_id, risk_level=risk_level, limit=limit)
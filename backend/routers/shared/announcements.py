@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, status
+from fastapi import APIRouter, Depends, HTTPException, Form, status, Response
 from sqlalchemy.orm import Session
 from database import get_db
+from crud.pagination import PageParams
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date, datetime
@@ -24,18 +25,18 @@ class DepartmentRead(BaseModel):
 class AnnouncementBase(BaseModel):
     title: str
     message: str
-    recipient_type: str = Field(..., description="Can be 'all_students', 'all_instructors', 'specific_students', 'specific_instructors', 'department_instructors', or 'all'")
-    recipient_ids: Optional[str] = Field(None, description="Comma-separated IDs if recipient_type is 'specific_students' or 'specific_instructors'")
-    department_name: Optional[str] = Field(None, description="Department Name if recipient_type is 'department_instructors'")
+    recipient_type: str = Field(..., description="Can be 'all_students', 'all_instructors', 'specific_students', 'specific_instructors', 'department_students', 'department_instructors', 'section_students', or 'all'")
+    recipient_ids: Optional[str] = Field(None, description="Comma-separated IDs if recipient_type is 'specific_students' or 'specific_instructors', section names if 'section_students'")
+    department_name: Optional[str] = Field(None, description="Department Name if recipient_type is 'department_students' or 'department_instructors'")
     priority: str = Field('Normal', description="Can be 'Normal' or 'High'")
     valid_until: Optional[date]
 
 class AnnouncementUpdate(BaseModel):
     title: Optional[str] = None
     message: Optional[str] = None
-    recipient_type: Optional[str] = Field(None, description="Can be 'all_students', 'all_instructors', 'specific_students', 'specific_instructors', 'department_instructors', or 'all'")
-    recipient_ids: Optional[str] = Field(None, description="Comma-separated IDs if recipient_type is 'specific_students' or 'specific_instructors'")
-    department_name: Optional[str] = Field(None, description="Department Name if recipient_type is 'department_instructors'")
+    recipient_type: Optional[str] = Field(None, description="Can be 'all_students', 'all_instructors', 'specific_students', 'specific_instructors', 'department_students', 'department_instructors', 'section_students', or 'all'")
+    recipient_ids: Optional[str] = Field(None, description="Comma-separated IDs if recipient_type is 'specific_students' or 'specific_instructors', section names if 'section_students'")
+    department_name: Optional[str] = Field(None, description="Department Name if recipient_type is 'department_students' or 'department_instructors'")
     priority: Optional[str] = Field(None, description="Can be 'Normal' or 'High'")
     valid_until: Optional[date] = None
 
@@ -128,9 +129,9 @@ def create_announcement_endpoint(
 
 # GET All Announcements
 @router.get("/", response_model=List[AnnouncementResponse])
-def get_all_announcements_endpoint(db: Session = Depends(get_db)):
-    announcements = crud_announcement.get_all_announcements(db)
-    return announcements
+def get_all_announcements_endpoint(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    announcements = crud_announcement.get_all_announcements(db, page)
+    return page.respond(response, announcements, AnnouncementResponse)
 
 # GET Announcement by ID
 @router.get("/{announcement_id}", response_model=AnnouncementResponse)
@@ -151,17 +152,20 @@ def update_announcement_endpoint(
     # Convert valid_until date to string if present, before passing to crud
     valid_until_str = announcement.valid_until.isoformat() if announcement.valid_until else None
 
-    updated_announcement = crud_announcement.update_announcement(
-        db=db,
-        announcement_id=announcement_id,
-        title=announcement.title,
-        message=announcement.message,
-        recipient_type=announcement.recipient_type,
-        recipient_ids=announcement.recipient_ids,
-        department_name=announcement.department_name,
-        priority=announcement.priority,
-        valid_until=valid_until_str
-    )
+    try:
+        updated_announcement = crud_announcement.update_announcement(
+            db=db,
+            announcement_id=announcement_id,
+            title=announcement.title,
+            message=announcement.message,
+            recipient_type=announcement.recipient_type,
+            recipient_ids=announcement.recipient_ids,
+            department_name=announcement.department_name,
+            priority=announcement.priority,
+            valid_until=valid_until_str
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     if not updated_announcement:
         raise HTTPException(status_code=404, detail="Announcement not found")
     return updated_announcement
@@ -176,6 +180,18 @@ def delete_announcement_endpoint(announcement_id: int, db: Session = Depends(get
 
 # SEARCH Announcements
 @router.get("/search/", response_model=List[AnnouncementResponse])
-def search_announcements_endpoint(keyword: str, db: Session = Depends(get_db)):
-    announcements = crud_announcement.search_announcements(db, keyword)
-    return announcements 
\ No newline at end of file
+def search_announcements_endpoint(keyword: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    announcements = crud_announcement.search_announcements(db, keyword, page)
+    return page.respond(response, announcements, AnnouncementResponse)
+
+# GET a student's announcements: everyone, their department, their section, or them
+@router.get("/feed/students/{student_id}", response_model=List[AnnouncementResponse])
+def get_student_feed_endpoint(student_id: str, response: Response, include_expired: bool = False, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    announcements = crud_announcement.get_announcement_feed(db, 'student', student_id, page, include_expired)
+    return page.respond(response, announcements, AnnouncementResponse)
+
+# GET an instructor's announcements: everyone, their department, or them
+@router.get("/feed/instructors/{instructor_id}", response_model=List[AnnouncementResponse])
+def get_instructor_feed_endpoint(instructor_id: str, response: Response, include_expired: bool = False, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    announcements = crud_announcement.get_announcement_feed(db, 'instructor', instructor_id, page, include_expired)
+    return page.respond(response, announcements, AnnouncementResponse)
@@ -0,0 +1,32 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from database import get_db
+from crud.shared import autocomplete as crud_autocomplete
+from crud.shared.autocomplete import AUTOCOMPLETE_LIMIT_DEFAULT, AUTOCOMPLETE_LIMIT_MAX, AUTOCOMPLETE_SOURCES
+
+router = APIRouter(tags=["Autocomplete"])
+
+
+class Suggestion(BaseModel):
+    type: str
+    id: str
+    label: str
+
+
+# Type-ahead suggestions for students, instructors, courses and sections
+@router.get("/", response_model=List[Suggestion])
+def autocomplete(
+    q: str = Query(..., min_length=1, description="What the user has typed so far: the start of an ID or name"),
+    types: Optional[str] = Query(None, description="Comma-separated kinds to suggest, e.g. student,course (default: all)"),
+    limit: int = Query(AUTOCOMPLETE_LIMIT_DEFAULT, ge=1, le=AUTOCOMPLETE_LIMIT_MAX),
+    db: Session = Depends(get_db)
+):
+    requested = [name.strip() for name in types.split(",") if name.strip()] if types else None
+    unknown = [name for name in requested or [] if name not in AUTOCOMPLETE_SOURCES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown type(s): {', '.join(unknown)}. Available: {', '.join(AUTOCOMPLETE_SOURCES)}")
+    return crud_autocomplete.autocomplete(db, q, requested, limit)
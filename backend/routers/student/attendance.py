@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from crud.student import attendance as crud_attendance
-from database import get_db
+from crud.instructor import attendance_summary as crud_attendance_summary
+from models.instructor.attendance_summary import AttendanceStudentSummaryResponse
+from database.aio import get_async_db
+from crud.pagination import PageParams
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import date
@@ -19,6 +22,10 @@ class AttendanceRecordResponse(BaseModel):
 router = APIRouter()
 
 @router.get("/students/{student_id}/attendance", response_model=List[AttendanceRecordResponse])
-def read_attendance_records(student_id: str, offering_id: Optional[int] = None, db: Session = Depends(get_db)):
-    attendance_records = crud_attendance.get_attendance_records(db, student_id=student_id, offering_id=offering_id)
-    return attendance_records 
\ No newline at end of file
+async def read_attendance_records(student_id: str, response: Response, offering_id: Optional[int] = None, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db)):
+    attendance_records = await crud_attendance.get_attendance_records_async(db, student_id=student_id, offering_id=offering_id, page=page)
+    return page.respond(response, attendance_records, AttendanceRecordResponse)
+
+@router.get("/students/{student_id}/attendance/summary", response_model=List[AttendanceStudentSummaryResponse])
+async def read_attendance_summary(student_id: str, offering_id: Optional[int] = None, db: AsyncSession = Depends(get_async_db)):
+    return await crud_attendance_summary.get_student_summaries_async(db, student_id=student_id, offering_id=offering_id)
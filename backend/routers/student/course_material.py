@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from crud.student import course_material as crud_course_material
 from database import get_db
+from database.aio import get_async_db
+from crud.pagination import PageParams
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
@@ -23,14 +26,14 @@ class CourseMaterialResponse(BaseModel):
 router = APIRouter()
 
 @router.get("/students/{student_id}/course_materials", response_model=List[CourseMaterialResponse])
-def read_course_materials_by_student(student_id: str, offering_id: Optional[int] = None, db: Session = Depends(get_db)):
-    course_materials = crud_course_material.get_course_materials(db, student_id=student_id, offering_id=offering_id)
-    return course_materials
+async def read_course_materials_by_student(student_id: str, response: Response, offering_id: Optional[int] = None, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db)):
+    course_materials = await crud_course_material.get_course_materials_async(db, student_id=student_id, offering_id=offering_id, page=page)
+    return page.respond(response, course_materials, CourseMaterialResponse)
 
 @router.get("/offerings/{offering_id}/course_materials", response_model=List[CourseMaterialResponse])
-def read_course_materials(offering_id: int, db: Session = Depends(get_db)):
-    course_materials = crud_course_material.get_course_materials(db, offering_id=offering_id)
-    return course_materials
+async def read_course_materials(offering_id: int, response: Response, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db)):
+    course_materials = await crud_course_material.get_course_materials_async(db, offering_id=offering_id, page=page)
+    return page.respond(response, course_materials, CourseMaterialResponse)
 
 @router.get("/course_materials/{material_id}/download")
 def download_course_material(material_id: int, db: Session = Depends(get_db)):
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from crud.student import exam_record as crud_exam_record
-from database import get_db
+from database.aio import get_async_db
+from crud.pagination import PageParams
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import date
@@ -22,6 +23,6 @@ class ExamRecordResponse(BaseModel):
 router = APIRouter()
 
 @router.get("/students/{student_id}/exam_records", response_model=List[ExamRecordResponse])
-def read_exam_records(student_id: str, offering_id: Optional[int] = None, db: Session = Depends(get_db)):
-    exam_records = crud_exam_record.get_exam_records(db, student_id=student_id, offering_id=offering_id)
-    return exam_records 
\ No newline at end of file
+async def read_exam_records(student_id: str, response: Response, offering_id: Optional[int] = None, page: PageParams = Depends(), db: AsyncSession = Depends(get_async_db)):
+    exam_records = await crud_exam_record.get_exam_records_async(db, student_id=student_id, offering_id=offering_id, page=page)
+    return page.respond(response, exam_records, ExamRecordResponse)
\ No newline at end of file
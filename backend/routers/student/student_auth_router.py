@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 
-from database import get_db
+from database.aio import get_async_db
 from crud.student import student_crud as crud_student
 from models.student.student_auth import Token, TokenData
 
@@ -28,8 +28,8 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 @router.post("/token", response_model=Token)
-async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    student = crud_student.verify_student_password(db, form_data.username, form_data.password)
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    student = await crud_student.verify_student_password_async(db, form_data.username, form_data.password)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
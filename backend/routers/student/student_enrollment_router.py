@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 
 from database import get_db
+from crud.pagination import PageParams
+from crud.serialization import json_list
+from database.aio import get_async_db
 from crud.admin import student_enrollment_crud
 from models.admin.student_enrollment import StudentCourseEnrollmentCreate, StudentCourseEnrollmentUpdate, StudentCourseEnrollmentResponse
 from models.admin.student import StudentResponse
@@ -30,14 +34,13 @@ def bulk_enroll_students(
     """Bulk enrolls a list of students into a specific course offering."""
     try:
         new_enrollments = student_enrollment_crud.bulk_create_student_enrollments(db, offering_id, student_ids)
-        return [StudentCourseEnrollmentResponse.from_orm(enrollment) for enrollment in new_enrollments]
+        return json_list(StudentCourseEnrollmentResponse, new_enrollments, status_code=status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error during bulk enrollment: {e}")
 
 @router.get("", response_model=List[StudentCourseEnrollmentResponse])
-def get_all_enrollments(db: Session = Depends(get_db)):
-    enrollments = student_enrollment_crud.get_all_enrollments(db)
-    return [StudentCourseEnrollmentResponse.from_orm(enrollment) for enrollment in enrollments]
+def get_all_enrollments(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return page.respond(response, student_enrollment_crud.get_all_enrollments(db, page), StudentCourseEnrollmentResponse)
 
 @router.get("/{enrollment_id}", response_model=StudentCourseEnrollmentResponse)
 def get_enrollment_by_id(
@@ -50,20 +53,22 @@ def get_enrollment_by_id(
     return StudentCourseEnrollmentResponse.from_orm(enrollment)
 
 @router.get("/student/{student_id}", response_model=List[StudentCourseEnrollmentResponse])
-def get_enrollments_by_student_id(
+async def get_enrollments_by_student_id(
     student_id: str,
-    db: Session = Depends(get_db)
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    enrollments = student_enrollment_crud.get_enrollments_by_student_id(db, student_id)
-    return [StudentCourseEnrollmentResponse.from_orm(enrollment) for enrollment in enrollments]
+    return page.respond(response, await student_enrollment_crud.get_enrollments_by_student_id_async(db, student_id, page), StudentCourseEnrollmentResponse)
 
 @router.get("/offering/{offering_id}", response_model=List[StudentCourseEnrollmentResponse])
 def get_enrollments_by_offering_id(
     offering_id: int,
+    response: Response,
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    enrollments = student_enrollment_crud.get_enrollments_by_offering_id(db, offering_id)
-    return [StudentCourseEnrollmentResponse.from_orm(enrollment) for enrollment in enrollments]
+    return page.respond(response, student_enrollment_crud.get_enrollments_by_offering_id(db, offering_id, page), StudentCourseEnrollmentResponse)
 
 @router.put("/{enrollment_id}", response_model=StudentCourseEnrollmentResponse)
 def update_enrollment(
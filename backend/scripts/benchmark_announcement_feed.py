@@ -0,0 +1,105 @@
+"""
+Measures a student's announcement feed on an in-memory SQLite database:
+    parse   the old way: load every announcement and match recipient_type /
+            recipient_ids against the student in Python
+    feed    crud/shared/announcements.get_announcement_feed, one query over
+            announcement_recipients (first page of 100)
+
+Run from the backend directory:
+    python -m scripts.benchmark_announcement_feed
+    python -m scripts.benchmark_announcement_feed --announcements 100000
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+import database
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.department import Department
+from models.admin.section import Section
+from models.admin.student import Student
+from models.shared.announcements import Announcement
+from crud.pagination import PageParams
+from crud.shared.announcements import _recipients, get_announcement_feed
+
+def populate(db, count: int, students: int, rng: random.Random):
+    db.add_all([Department(department_name="CS"), Department(department_name="EE")])
+    db.add_all([Section(section_name="CS-1", department="CS", semester="1"), Section(section_name="EE-1", department="EE", semester="1")])
+    db.add_all(Student(
+        student_id=f"S{i:06d}", first_name="Student", last_name=str(i), email=f"s{i}@example.com", phone_number=f"{i:011d}",
+        cnic=f"{i:013d}", program="CS" if i % 2 else "EE", section="CS-1" if i % 2 else "EE-1", enrollment_year=2024,
+    ) for i in range(students))
+    for i in range(count):
+        kind = rng.choice(["all", "all_students", "all_instructors", "specific_students", "department_instructors", "department_students", "section_students"])
+        ids = {
+            "specific_students": ",".join(f"S{rng.randrange(students):06d}" for _ in range(rng.randint(1, 30))),
+            "section_students": rng.choice(["CS-1", "EE-1"]),
+        }.get(kind)
+        department_name = rng.choice(["CS", "EE"]) if kind.startswith("department") else None
+        db.add(Announcement(
+            title=f"Announcement {i}", message="benchmark", recipient_type=kind, recipient_ids=ids, department_name=department_name,
+            priority="Normal", created_at=datetime(2025, 1, 1) + timedelta(minutes=i), recipients=_recipients(kind, ids, department_name),
+        ))
+    db.commit()
+
+def parse(db, student_id: str) -> list:
+    student = db.get(Student, student_id)
+    visible = []
+    for announcement in db.execute(select(Announcement)).scalars():
+        ids = [part.strip() for part in (announcement.recipient_ids or "").split(",")]
+        kind = announcement.recipient_type
+        if (kind in ("all", "all_students")
+                or (kind == "specific_students" and student_id in ids)
+                or (kind == "department_students" and announcement.department_name == student.program)
+                or (kind == "section_students" and student.section in ids)):
+            if announcement.valid_until is None or announcement.valid_until >= date.today():
+                visible.append(announcement)
+    visible.sort(key=lambda a: (a.created_at, a.announcement_id), reverse=True)
+    return visible[:100]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-student announcement feed")
+    parser.add_argument("--announcements", type=int, default=20000, help="Announcements in the database")
+    parser.add_argument("--students", type=int, default=1000, help="Students in the database")
+    parser.add_argument("--iterations", type=int, default=20, help="Feeds per variant")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    populate(db, args.announcements, args.students, rng)
+    page = PageParams(request=None, limit=100, cursor=None, include_total=False, fields=None)
+
+    print(f"{args.announcements} announcements, {args.iterations} feeds per variant")
+    print(f"{'variant':<8}{'p50 ms':>9}{'p95 ms':>9}")
+    try:
+        student_ids = [f"S{rng.randrange(args.students):06d}" for _ in range(args.iterations)]
+        variants = [
+            ("parse", lambda student_id: parse(db, student_id)),
+            ("feed", lambda student_id: get_announcement_feed(db, "student", student_id, page).items),
+        ]
+        results = {}
+        for name, run in variants:
+            samples = []
+            for student_id in student_ids:
+                db.expunge_all()
+                started = time.perf_counter()
+                results.setdefault(name, []).append([a.announcement_id for a in run(student_id)])
+                samples.append((time.perf_counter() - started) * 1000)
+            print(f"{name:<8}{statistics.median(samples):>9.1f}{statistics.quantiles(samples, n=20)[-1]:>9.1f}")
+        if results["parse"] != results["feed"]:
+            raise SystemExit("parse and feed returned different announcements")
+    finally:
+        db.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
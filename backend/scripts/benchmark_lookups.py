@@ -0,0 +1,107 @@
+"""
+Measures the Python-side cost of the fixed-shape crud lookups (one row by
+primary key or unique name) on an in-memory SQLite database, where query
+execution is cheap enough that statement construction and compilation
+dominate.
+
+Variants per lookup:
+    legacy query      db.query(Model).filter(column == value).first()
+    prebuilt select   the module-level statements from crud/lookups.py
+    session.get       identity-map lookup, each call on a fresh session (cold)
+                      and repeated on one session (warm, no SQL)
+
+Run from the backend directory:
+    python -m scripts.benchmark_lookups
+    python -m scripts.benchmark_lookups --rows 5000 --iterations 20000
+"""
+import argparse
+import random
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+import database
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.course import Course
+from models.admin.student import Student
+from crud.lookups import fetch_one
+from crud.admin import course as course_crud
+from crud.student import student_crud
+
+def populate(db, rows: int):
+    db.add_all(Course(course_id=f"C{i:05d}", course_name=f"Course {i}", course_description="benchmark", course_credit_hours=3) for i in range(rows))
+    db.add_all(Student(
+        student_id=f"S{i:06d}", first_name=f"Student {i}", last_name="Benchmark", email=f"s{i}@example.com",
+        phone_number=f"{i:011d}", cnic=f"{i:013d}", program="BSCS", section=None, enrollment_year=2024,
+    ) for i in range(rows))
+    db.commit()
+
+def lookup_cases(SessionLocal) -> list:
+    """
+    (name, run(key)) pairs; run() opens and closes its own session so that
+    no case benefits from another's identity map, except the warm get.
+    """
+    def with_session(fn):
+        def run(key):
+            db = SessionLocal()
+            try:
+                return fn(db, key)
+            finally:
+                db.close()
+        return run
+
+    warm = SessionLocal()
+    cases = []
+    for label, model, column, statement in [
+        ("course by id", Course, Course.course_id, course_crud._COURSE_BY_ID),
+        ("course by name", Course, Course.course_name, course_crud._COURSE_BY_NAME),
+        ("student by id", Student, Student.student_id, student_crud._STUDENT_BY_ID),
+    ]:
+        cases.append((f"{label}: legacy query", with_session(
+            lambda db, key, model=model, column=column: db.query(model).filter(column == key).first())))
+        cases.append((f"{label}: prebuilt select", with_session(
+            lambda db, key, statement=statement: fetch_one(db, statement, key))))
+        if column.primary_key:
+            cases.append((f"{label}: session.get cold", with_session(lambda db, key, model=model: db.get(model, key))))
+            cases.append((f"{label}: session.get warm", lambda key, model=model: warm.get(model, key)))
+    return cases
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the by-id/by-name crud lookups")
+    parser.add_argument("--rows", type=int, default=1000, help="Courses and students in the database")
+    parser.add_argument("--iterations", type=int, default=5000, help="Lookups per variant")
+    args = parser.parse_args()
+
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    populate(db, args.rows)
+    db.close()
+
+    rng = random.Random(42)
+    indexes = [rng.randrange(args.rows) for _ in range(args.iterations)]
+    keys = {
+        "course by id": [f"C{i:05d}" for i in indexes],
+        "course by name": [f"Course {i}" for i in indexes],
+        "student by id": [f"S{i:06d}" for i in indexes],
+    }
+
+    print(f"{args.iterations} lookups per variant, {args.rows} rows per table")
+    print(f"{'variant':<36}{'total s':>10}{'us/lookup':>12}")
+    for name, run in lookup_cases(SessionLocal):
+        lookup_keys = keys[name.split(":")[0]]
+        for key in lookup_keys[:100]:  # warm the compiled cache
+            run(key)
+        started = time.perf_counter()
+        for key in lookup_keys:
+            if run(key) is None:
+                raise SystemExit(f"{name}: no row for {key}")
+        elapsed = time.perf_counter() - started
+        print(f"{name:<36}{elapsed:>10.3f}{elapsed * 1e6 / len(lookup_keys):>12.1f}")
+    engine.dispose()
+
+if __name__ == "__main__":
+    main()
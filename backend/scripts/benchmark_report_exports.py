@@ -0,0 +1,91 @@
+"""
+Compares the report export formats on a synthetic attendance-style report
+(one row per student, one column per date), without touching the database.
+
+For every format it measures wall time, peak Python heap (tracemalloc) and
+output size. The legacy export (build a pandas DataFrame, then to_excel) is
+included as the baseline.
+
+Run from the backend directory:
+    python -m scripts.benchmark_report_exports
+    python -m scripts.benchmark_report_exports --rows 50000 --dates 120
+"""
+import argparse
+import io
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from crud.admin import report_export
+
+BASE_COLUMNS = ['Student Name', 'Student ID', 'Course Name', 'Course ID', 'Department', 'Semester']
+STATUSES = ['Present', 'Absent', 'Leave', None]
+
+def make_export(rows: int, dates: int, seed: int = 42) -> dict:
+    start = date(2025, 1, 1)
+    date_columns = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(dates)]
+    columns = BASE_COLUMNS + date_columns + ['From Date', 'To Date']
+    filter_row = {'Department': 'CS', 'Semester': '1', 'Course ID': 'C1', 'From Date': date_columns[0], 'To Date': date_columns[-1]}
+
+    def generate():
+        rng = random.Random(seed)
+        for i in range(rows):
+            row = {
+                'Student Name': f'Student {i}',
+                'Student ID': f'S{i:06d}',
+                'Course Name': 'Benchmark Course',
+                'Course ID': 'C1',
+                'Department': 'CS',
+                'Semester': '1',
+            }
+            for column in date_columns:
+                row[column] = rng.choice(STATUSES)
+            yield row
+
+    return {'name': 'attendance_report', 'sheet_name': 'Attendance Report', 'columns': columns, 'filter_row': filter_row, 'rows': generate}
+
+def run_legacy(export: dict, output):
+    # The pre-streaming export: materialize every row, then hand the frame to pandas
+    import pandas as pd
+    df = pd.DataFrame([export['filter_row']] + list(export['rows']()), columns=export['columns'])
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, index=False, sheet_name=export['sheet_name'])
+
+def run_format(fmt: str, export: dict, output):
+    report_export.write_report(fmt, output, dict(export, rows=export['rows']()))
+
+def measure(fn) -> tuple:
+    output = io.BytesIO()
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn(output)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # BytesIO holds the whole output, so leave it out of the working-set figure
+    return elapsed, max(peak - output.getbuffer().nbytes, 0), output.getbuffer().nbytes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report export formats")
+    parser.add_argument("--rows", type=int, default=10000, help="Number of student rows")
+    parser.add_argument("--dates", type=int, default=120, help="Number of date columns")
+    parser.add_argument("--skip-legacy", action="store_true", help="Skip the pandas to_excel baseline")
+    args = parser.parse_args()
+
+    export = make_export(args.rows, args.dates)
+    cases = [] if args.skip_legacy else [('legacy (pandas)', lambda out: run_legacy(export, out))]
+    cases += [(fmt, lambda out, fmt=fmt: run_format(fmt, export, out)) for fmt in report_export.EXPORT_FORMATS]
+
+    print(f"{args.rows} rows x {len(export['columns'])} columns")
+    print(f"{'format':<16}{'seconds':>10}{'peak MiB':>12}{'size MiB':>12}")
+    for label, fn in cases:
+        try:
+            elapsed, peak, size = measure(fn)
+        except ImportError as e:
+            print(f"{label:<16}  skipped ({e})")
+            continue
+        print(f"{label:<16}{elapsed:>10.2f}{peak / 2**20:>12.1f}{size / 2**20:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measures the admin student search and autocomplete (crud/search.py) against
+the SQL LIKE queries they replace, on an in-memory SQLite database of
+generated students.
+
+For each query shape (ID prefix, first name, substring, two words, one
+letter) it reports the median and 95th percentile latency of
+    index   the in-process index plus the primary-key fetch of the results
+    scan    the old filter: ilike('%keyword%') on ID, first and last name
+    complete      the index's prefix matches, answered from memory
+    prefix scan   ilike('keyword%') per word, the fallback autocomplete query
+and the mean number of results, and prints how long the index took to build
+and how much memory it holds.
+
+Run from the backend directory:
+    python -m scripts.benchmark_search
+    python -m scripts.benchmark_search --students 200000 --iterations 500
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import sessionmaker
+
+import database
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.student import Student
+from crud.search import SearchIndex, SEARCH_LIMIT_DEFAULT
+
+FIRST_NAMES = ["Ali", "Ahmed", "Ayesha", "Fatima", "Hassan", "Hina", "Imran", "Maryam", "Omar", "Sana",
+               "Usman", "Zainab", "Bilal", "Amna", "Kamran", "Nadia", "Saad", "Mehwish", "Tariq", "Rabia"]
+LAST_NAMES = ["Khan", "Malik", "Hussain", "Qureshi", "Sheikh", "Butt", "Chaudhry", "Raza", "Siddiqui", "Javed",
+              "Iqbal", "Aslam", "Farooq", "Mirza", "Abbasi", "Anwar", "Rehman", "Baig", "Nawaz", "Saleem"]
+
+def populate(db, students: int, rng: random.Random):
+    for start in range(0, students, 10000):
+        db.add_all(Student(
+            student_id=f"S{i:06d}", first_name=f"{rng.choice(FIRST_NAMES)}{i % 97 or ''}", last_name=rng.choice(LAST_NAMES),
+            email=f"s{i}@example.com", phone_number=f"{i:011d}", cnic=f"{i:013d}", program=None, section=None, enrollment_year=2024,
+        ) for i in range(start, min(start + 10000, students)))
+        db.flush()
+    db.commit()
+
+def queries(students: int, rng: random.Random) -> dict:
+    return {
+        "id prefix": [f"S{rng.randrange(students // 10):05d}" for _ in range(50)],
+        "first name": [rng.choice(FIRST_NAMES) for _ in range(50)],
+        "substring": [rng.choice(LAST_NAMES)[1:5] for _ in range(50)],
+        "two words": [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(50)],
+        "one letter": [rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(50)],
+    }
+
+def scan(db, keyword: str, limit: int):
+    return db.execute(select(Student).where(or_(
+        Student.student_id.ilike(f"%{keyword}%"),
+        Student.first_name.ilike(f"%{keyword}%"),
+        Student.last_name.ilike(f"%{keyword}%"),
+    )).limit(limit)).scalars().all()
+
+def prefix_scan(db, keyword: str, limit: int):
+    statement = select(Student.student_id, Student.first_name, Student.last_name)
+    for term in keyword.split():
+        statement = statement.where(or_(*[
+            column.ilike(pattern) for column in (Student.student_id, Student.first_name, Student.last_name)
+            for pattern in (f"{term}%", f"% {term}%")
+        ]))
+    return db.execute(statement.order_by(Student.student_id).limit(limit)).all()
+
+def timed(run, keywords: list, iterations: int) -> list:
+    samples = []
+    for i in range(iterations):
+        keyword = keywords[i % len(keywords)]
+        started = time.perf_counter()
+        run(keyword)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the student search index")
+    parser.add_argument("--students", type=int, default=100000, help="Students in the database")
+    parser.add_argument("--iterations", type=int, default=200, help="Searches per query shape and variant")
+    parser.add_argument("--limit", type=int, default=SEARCH_LIMIT_DEFAULT, help="Results per search")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    db = SessionLocal()
+    populate(db, args.students, rng)
+
+    index = SearchIndex(Student.student_id, [Student.student_id, Student.first_name, Student.last_name], session_factory=SessionLocal)
+    tracemalloc.start()
+    started = time.perf_counter()
+    index.build()
+    build_seconds = time.perf_counter() - started
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{args.students} students: index built in {build_seconds:.2f}s, {memory / 2 ** 20:.0f} MB")
+
+    print(f"{'query':<14}{'variant':<13}{'p50 ms':>9}{'p95 ms':>9}{'results':>9}")
+    try:
+        for shape, keywords in queries(args.students, rng).items():
+            for variant, run in [
+                ("index", lambda keyword: index.search(db, keyword, args.limit)),
+                ("scan", lambda keyword: scan(db, keyword, args.limit)),
+                ("complete", lambda keyword: index.complete(db, keyword, args.limit)),
+                ("prefix scan", lambda keyword: prefix_scan(db, keyword, args.limit)),
+            ]:
+                samples = timed(run, keywords, args.iterations)
+                results = statistics.mean(len(run(keyword)) for keyword in keywords)
+                p95 = statistics.quantiles(samples, n=20)[-1]
+                print(f"{shape:<14}{variant:<13}{statistics.median(samples):>9.2f}{p95:>9.2f}{results:>9.1f}")
+    finally:
+        db.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Measures how long the largest list endpoints take to turn their rows into a
+response body, on an in-memory SQLite database. The rows are loaded once; only
+serialization is timed, so the numbers are the per-request CPU cost on top
+of the query.
+
+Variants per endpoint:
+    from_orm + json    the old path: X.from_orm(row) per row, then FastAPI's
+                       response_model pass and the stdlib JSONResponse
+    response_model     ORM rows through response_model, encoded by orjson
+                       (the default response class in main.py)
+    json_list          one TypeAdapter validation and pydantic-core JSON
+                       (crud/serialization.py)
+
+It also prints the gzip size and time of each body, at the level main.py
+uses (LMS_GZIP_LEVEL).
+
+Run from the backend directory:
+    python -m scripts.benchmark_serialization
+    python -m scripts.benchmark_serialization --rows 20000 --iterations 20
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import time
+from datetime import date, timedelta
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, sessionmaker
+
+import database
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.course import Course
+from models.admin.course_offerings import CourseOffering
+from models.admin.department import Department
+from models.admin.instructor import Instructor
+from models.admin.section import Section
+from models.admin.student import Student
+from models.admin.student_enrollment import StudentCourseEnrollment, StudentCourseEnrollmentResponse
+from models.instructor.attendance_records import Attendance, AttendanceResponse, AttendanceStatusEnum
+from crud.serialization import json_list
+
+def populate(db, rows: int):
+    db.add(Department(department_name="CS"))
+    db.add(Section(section_name="CS-1", department="CS", semester="1"))
+    db.add(Course(course_id="C1", course_name="Algorithms", course_description="benchmark", course_credit_hours=3))
+    db.add(Instructor(instructor_id="I1", first_name="Ada", last_name="Lovelace", email="ada@example.com", phone_number="1", cnic="1", department="CS"))
+    db.add(CourseOffering(offering_id=1, course_id="C1", section_name="CS-1", instructor_id="I1", capacity=rows))
+    students = max(rows // 10, 1)
+    db.add_all(Student(
+        student_id=f"S{i:06d}", first_name=f"Student {i}", last_name="Benchmark", email=f"s{i}@example.com",
+        phone_number=f"{i:011d}", cnic=f"{i:013d}", program="CS", section="CS-1", enrollment_year=2024,
+    ) for i in range(students))
+    db.add_all(StudentCourseEnrollment(student_id=f"S{i:06d}", offering_id=1, enrollment_date=date(2025, 1, 1)) for i in range(students))
+    statuses = list(AttendanceStatusEnum)
+    db.add_all(Attendance(
+        offering_id=1, student_id=f"S{i % students:06d}", attendance_date=date(2025, 1, 1) + timedelta(days=i // students),
+        status=statuses[i % len(statuses)],
+    ) for i in range(rows))
+    db.commit()
+
+def endpoints(db) -> list:
+    """
+    (name, response schema, rows) for the instructor attendance list and the
+    enrollment list with its nested offering, course and instructor.
+    """
+    attendance = db.execute(select(Attendance).order_by(Attendance.attendance_id)).scalars().all()
+    enrollments = db.execute(select(StudentCourseEnrollment).options(
+        joinedload(StudentCourseEnrollment.offering_rel).joinedload(CourseOffering.course_rel),
+        joinedload(StudentCourseEnrollment.offering_rel).joinedload(CourseOffering.instructor_rel),
+    )).unique().scalars().all()
+    return [
+        ("attendance by offering", AttendanceResponse, attendance),
+        ("enrollments", StudentCourseEnrollmentResponse, enrollments),
+    ]
+
+def variants(schema, rows, loop) -> list:
+    field = create_response_field(name="benchmark", type_=List[schema])
+
+    def through_response_model(content, response_class):
+        return response_class(loop.run_until_complete(serialize_response(field=field, response_content=content))).body
+
+    return [
+        ("from_orm + json", lambda: through_response_model([schema.from_orm(row) for row in rows], JSONResponse)),
+        ("response_model", lambda: through_response_model(rows, ORJSONResponse)),
+        ("json_list", lambda: json_list(schema, rows).body),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serialization of the largest list endpoints")
+    parser.add_argument("--rows", type=int, default=5000, help="Attendance records in the database")
+    parser.add_argument("--iterations", type=int, default=10, help="Serializations per variant")
+    parser.add_argument("--gzip-level", type=int, default=int(os.getenv("LMS_GZIP_LEVEL", "5")), help="zlib level, as LMS_GZIP_LEVEL in main.py")
+    args = parser.parse_args()
+
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    populate(db, args.rows)
+    loop = asyncio.new_event_loop()
+
+    print(f"{args.iterations} serializations per variant, gzip level {args.gzip_level}")
+    print(f"{'endpoint / variant':<44}{'rows':>7}{'ms':>9}{'KB':>9}{'gzip KB':>9}{'gzip ms':>9}")
+    try:
+        for name, schema, rows in endpoints(db):
+            bodies = {}
+            for label, run in variants(schema, rows, loop):
+                run()  # warm the schema caches
+                started = time.perf_counter()
+                for _ in range(args.iterations):
+                    body = run()
+                elapsed = (time.perf_counter() - started) / args.iterations
+                started = time.perf_counter()
+                compressed = gzip.compress(body, compresslevel=args.gzip_level)
+                gzip_elapsed = time.perf_counter() - started
+                bodies[label] = body
+                print(f"{name + ': ' + label:<44}{len(rows):>7}{elapsed * 1000:>9.1f}{len(body) / 1024:>9.0f}{len(compressed) / 1024:>9.0f}{gzip_elapsed * 1000:>9.1f}")
+            # Same data whatever the encoder; only whitespace may differ
+            decoded = [json.loads(body) for body in bodies.values()]
+            if any(other != decoded[0] for other in decoded[1:]):
+                raise SystemExit(f"{name}: variants produced different JSON")
+    finally:
+        loop.close()
+        db.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Query-count check for the admin report stats (crud/admin/report.py): each
+report must cost a fixed number of statements whatever the size of the cohort,
+with no ID lists built in Python and no query per student. Runs the exam and
+attendance stats for every filter shape against a small and a large in-memory
+SQLite database, counts the statements each one issues
+(database/instrumentation.py) and compares the two counts.
+
+Exits with status 1 when a count differs between the cohorts, so it can run in CI.
+From the backend directory:
+    python -m scripts.check_report_queries
+    python -m scripts.check_report_queries --small 10 --large 5000
+"""
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+import database
+from database.instrumentation import collect_queries
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from crud.admin.report import get_attendance_report_stats, get_exam_report_stats
+from crud.instructor.attendance_summary import rebuild_attendance_summaries
+
+SECTIONS = [("CS-1", "1", "C1"), ("CS-2", "2", "C2")]
+DAYS = 5
+
+def populate(db, students: int):
+    db.execute(insert(department.Department), [{"department_name": "CS"}])
+    db.execute(insert(section.Section), [{"section_name": name, "department": "CS", "semester": semester} for name, semester, _ in SECTIONS])
+    db.execute(insert(course.Course), [
+        {"course_id": course_id, "course_name": f"Course {course_id}", "course_description": "check", "course_credit_hours": 3}
+        for _, _, course_id in SECTIONS
+    ])
+    db.execute(insert(instructor.Instructor), [{
+        "instructor_id": "I1", "first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com",
+        "phone_number": "1", "cnic": "1", "department": "CS",
+    }])
+    db.execute(insert(course_offerings.CourseOffering), [
+        {"offering_id": n, "course_id": course_id, "section_name": name, "instructor_id": "I1", "capacity": students}
+        for n, (name, _, course_id) in enumerate(SECTIONS, start=1)
+    ])
+    cohort = [(f"S{i:06d}", i % len(SECTIONS) + 1) for i in range(students)]
+    db.execute(insert(student.Student), [{
+        "student_id": student_id, "first_name": f"Student {student_id}", "last_name": "Check", "email": f"{student_id}@example.com",
+        "phone_number": student_id, "cnic": student_id, "program": "CS", "section": SECTIONS[offering_id - 1][0], "enrollment_year": 2024,
+    } for student_id, offering_id in cohort])
+    db.execute(insert(student_enrollment.StudentCourseEnrollment), [
+        {"student_id": student_id, "offering_id": offering_id, "enrollment_date": date(2025, 1, 1)} for student_id, offering_id in cohort
+    ])
+    statuses = list(attendance_records.AttendanceStatusEnum)
+    db.execute(insert(attendance_records.Attendance), [
+        {"offering_id": offering_id, "student_id": student_id, "attendance_date": date(2025, 1, 1) + timedelta(days=day), "status": statuses[(n + day) % len(statuses)]}
+        for n, (student_id, offering_id) in enumerate(cohort) for day in range(DAYS)
+    ])
+    db.execute(insert(exam_records.ExamRecord), [{
+        "offering_id": offering_id, "student_id": student_id, "exam_type": exam_records.ExamTypeEnum.midterm, "obtained_marks": float(n % 50),
+        "total_marks": 50.0, "exam_date": datetime(2025, 2, 1), "remarks": ["pass", "fail", "absent"][n % 3],
+    } for n, (student_id, offering_id) in enumerate(cohort)])
+    db.commit()
+    rebuild_attendance_summaries(db)
+    db.commit()
+
+def cases() -> list:
+    """
+    (name, report(db)) for every filter shape, covering both branches of the
+    attendance stats: the per-student rollup (no date range) and
+    attendance_records (date range).
+    """
+    dates = dict(from_date="2025-01-02", to_date="2025-01-04")
+    return [
+        ("exam, no filter", lambda db: get_exam_report_stats(db, None, None, None, None)),
+        ("exam, department", lambda db: get_exam_report_stats(db, "CS", None, None, None)),
+        ("exam, semester", lambda db: get_exam_report_stats(db, None, "1", None, None)),
+        ("exam, course", lambda db: get_exam_report_stats(db, None, None, "1", None)),
+        ("exam, all filters", lambda db: get_exam_report_stats(db, "CS", "1", "1", "midterm")),
+        ("attendance, no filter", lambda db: get_attendance_report_stats(db, None, None, None, None, None)),
+        ("attendance, semester", lambda db: get_attendance_report_stats(db, None, "2", None, None, None)),
+        ("attendance, dates", lambda db: get_attendance_report_stats(db, None, None, None, **dates)),
+        ("attendance, course + dates", lambda db: get_attendance_report_stats(db, None, None, "2", **dates)),
+        ("attendance, department + dates", lambda db: get_attendance_report_stats(db, "CS", None, None, **dates)),
+        ("attendance, all filters", lambda db: get_attendance_report_stats(db, "CS", "1", "1", **dates)),
+    ]
+
+def count_queries(students: int) -> list:
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    db = database.SessionLocal(bind=engine)
+    try:
+        populate(db, students)
+        counts = []
+        for name, report in cases():
+            with collect_queries() as stats:
+                report(db)
+            counts.append(stats.count)
+        return counts
+    finally:
+        db.close()
+        engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that report query counts do not grow with the cohort")
+    parser.add_argument("--small", type=int, default=10, help="Students in the small cohort")
+    parser.add_argument("--large", type=int, default=2000, help="Students in the large cohort")
+    args = parser.parse_args()
+
+    small, large = count_queries(args.small), count_queries(args.large)
+
+    failures = 0
+    print(f"{'case':<34}{args.small:>9}{args.large:>9}")
+    for (name, _), small_count, large_count in zip(cases(), small, large):
+        ok = small_count == large_count
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {name:<32}{small_count:>9}{large_count:>9}")
+
+    if failures:
+        print(f"\n{failures} case(s) issue more statements for the larger cohort")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
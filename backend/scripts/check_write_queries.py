@@ -0,0 +1,125 @@
+"""
+Query-count check for the crud write path: create/update functions must not
+re-fetch what they wrote, and bulk enrollment must not cost a query per
+student. Runs each function on an in-memory SQLite database, counts the
+SELECTs it issues (database/instrumentation.py) and the queries needed to
+serialize its result, and compares them with a fixed budget.
+
+Exits with status 1 when any budget is exceeded, so it can run in CI.
+From the backend directory:
+    python -m scripts.check_write_queries
+    python -m scripts.check_write_queries --students 1000
+"""
+import argparse
+import sys
+from datetime import date, datetime
+
+import database
+from database.instrumentation import collect_queries
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.department import Department
+from models.admin.section import Section
+from models.admin.instructor import Instructor
+from models.admin.student import Student
+from models.admin.student_enrollment import StudentCourseEnrollmentCreate, StudentCourseEnrollmentResponse
+from models.instructor.attendance_records import AttendanceCreate, AttendanceResponse, AttendanceStatusEnum
+from models.instructor.exam_records import ExamRecordCreate, ExamRecordUpdate, ExamRecordResponse, ExamTypeEnum
+from crud.admin import course as course_crud
+from crud.admin import course_offerings as offering_crud
+from crud.admin import student as student_crud
+from crud.admin import student_enrollment_crud
+from crud.instructor import attendance_records as attendance_crud
+from crud.instructor import exam_records as exam_crud
+
+def populate(db, students: int):
+    db.add(Department(department_name="CS"))
+    db.add(Section(section_name="CS-1", department="CS", semester="1"))
+    db.add(Instructor(instructor_id="I1", first_name="Ada", last_name="Lovelace", email="ada@example.com", phone_number="1", cnic="1", department="CS"))
+    db.add_all(Student(
+        student_id=f"S{i:06d}", first_name=f"Student {i}", last_name="Check", email=f"s{i}@example.com",
+        phone_number=f"{i:011d}", cnic=f"{i:013d}", program="CS", section="CS-1", enrollment_year=2024,
+    ) for i in range(students))
+    db.commit()
+
+def count_selects(stats) -> int:
+    return sum(count for statement, count in stats.statements.items() if statement.lstrip().upper().startswith("SELECT"))
+
+def cases(students: int) -> list:
+    """
+    (name, write(db), serialize(result), SELECT budget, query budget). The
+    SELECT budget covers the lookups a function needs before writing
+    (duplicate checks, loading the row to update); the query budget also
+    counts the writes, so a bulk operation cannot fall back to a statement
+    per row. Writes to the reference tables and students also bump their change counter
+    (database/table_versions.py), one UPDATE per flush. Serializing the result
+    must not query at all.
+    """
+    student_ids = [f"S{i:06d}" for i in range(students)]
+    return [
+        ("create course", lambda db: course_crud.create_course(db, {
+            "course_id": "C1", "course_name": "Algorithms", "course_description": "check", "course_credit_hours": 3,
+        }), lambda course: course.course_id, 0, 2),
+        ("update course", lambda db: course_crud.update_course(db, "Algorithms", {"course_credit_hours": 4}),
+         lambda course: course.course_credit_hours, 1, 3),
+        ("create offering", lambda db: offering_crud.create_course_offering(db, "C1", "CS-1", "I1", 50),
+         lambda offering: offering.offering_id, 1, 3),
+        ("update offering", lambda db: offering_crud.update_course_offering(db, 1, {"capacity": 60}),
+         lambda offering: offering.capacity, 1, 3),
+        ("create student", lambda db: student_crud.create_student(db, {
+            "student_id": "NEW", "first_name": "New", "last_name": "Student", "email": "new@example.com",
+            "phone_number": "new", "cnic": "new", "program": "CS", "section": "CS-1", "enrollment_year": 2025,
+        }), lambda student: student.student_id, 0, 2),
+        ("create enrollment", lambda db: student_enrollment_crud.create_student_enrollment(db, StudentCourseEnrollmentCreate(
+            student_id="NEW", offering_id=1, enrollment_date=date.today(),
+        )), lambda enrollment: enrollment.enrollment_id, 0, 1),
+        (f"bulk enroll {students} students", lambda db: student_enrollment_crud.bulk_create_student_enrollments(db, 1, student_ids),
+         lambda enrollments: [StudentCourseEnrollmentResponse.model_validate(e, from_attributes=True) for e in enrollments], 1, 2),
+        ("create attendance", lambda db: attendance_crud.create_attendance_record(db, AttendanceCreate(
+            offering_id=1, student_id=student_ids[0], attendance_date=date(2025, 1, 1), status=AttendanceStatusEnum.Present,
+        )), lambda record: AttendanceResponse.model_validate(record, from_attributes=True), 1, 3),
+        ("create exam record", lambda db: exam_crud.create_exam_record(db, ExamRecordCreate(
+            offering_id=1, student_id=student_ids[0], exam_type=ExamTypeEnum.midterm, obtained_marks=40,
+            total_marks=50, exam_date=datetime(2025, 2, 1),
+        )), lambda record: ExamRecordResponse.model_validate(record, from_attributes=True), 0, 1),
+        ("update exam record", lambda db: exam_crud.update_exam_record(db, 1, ExamRecordUpdate(obtained_marks=45)),
+         lambda record: ExamRecordResponse.model_validate(record, from_attributes=True), 1, 2),
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Check query counts of the crud write path")
+    parser.add_argument("--students", type=int, default=300, help="Students in the bulk enrollment")
+    args = parser.parse_args()
+
+    engine = database.build_engine("sqlite://")
+    database.Base.metadata.create_all(engine)
+    db = database.SessionLocal(bind=engine)
+    populate(db, args.students)
+    db.close()
+
+    failures = 0
+    print(f"{'case':<32}{'selects':>9}{'budget':>8}{'queries':>9}{'budget':>8}{'serialize':>11}")
+    for name, write, serialize, select_budget, query_budget in cases(args.students):
+        # A fresh session per case, as a request would have
+        db = database.SessionLocal(bind=engine)
+        try:
+            with collect_queries() as write_stats:
+                result = write(db)
+            # Serialized while the session is open, as FastAPI does before get_db closes it
+            with collect_queries() as serialize_stats:
+                serialize(result)
+        finally:
+            db.close()
+        selects = count_selects(write_stats)
+        ok = selects <= select_budget and write_stats.count <= query_budget and serialize_stats.count == 0
+        failures += not ok
+        print(f"{'✅' if ok else '❌'} {name:<30}{selects:>9}{select_budget:>8}{write_stats.count:>9}{query_budget:>8}{serialize_stats.count:>11}")
+    engine.dispose()
+
+    if failures:
+        print(f"\n{failures} case(s) over budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
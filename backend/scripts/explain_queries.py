@@ -0,0 +1,130 @@
+"""
+Runs EXPLAIN on the main crud queries and reports, per query, which index
+each table is read through, flagging full table scans.
+
+The sample parameters are taken from the database, so the plans match real
+data; run it after `alembic upgrade head` against a populated database
+(e.g. one from scripts/generate_dataset.py). From the backend directory:
+    python -m scripts.explain_queries
+    python -m scripts.explain_queries --database-url sqlite:///lms_small.db --verbose
+    python -m scripts.explain_queries --strict        # exit 1 on any full scan
+"""
+import argparse
+import sys
+from datetime import date
+
+from sqlalchemy import desc, or_, select
+from sqlalchemy.orm import sessionmaker
+
+import database
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.student import Student
+from models.admin.student_enrollment import StudentCourseEnrollment
+from models.instructor.attendance_records import Attendance
+from models.instructor.exam_records import ExamRecord
+from models.shared.announcements import Announcement
+from crud.admin.report import ReportCohort
+from crud.admin.student_enrollment_crud import _enrollments_by_student_query
+from crud.student.attendance import _attendance_records_query
+from crud.student.exam_record import _exam_records_query
+from crud.student.course_material import _course_materials_query
+
+def sample_parameters(db) -> dict:
+    enrollment = db.query(StudentCourseEnrollment).first()
+    if enrollment is None:
+        raise SystemExit("No enrollments found: populate the database first (scripts/generate_dataset.py)")
+    student = db.get(Student, enrollment.student_id)
+    exam = db.query(ExamRecord.exam_type).filter(ExamRecord.offering_id == enrollment.offering_id).first()
+    day = db.query(Attendance.attendance_date).filter(Attendance.offering_id == enrollment.offering_id).first()
+    return {
+        "student_id": enrollment.student_id,
+        "offering_id": enrollment.offering_id,
+        "program": student.program,
+        "section": student.section,
+        "exam_type": exam[0] if exam else None,
+        "attendance_date": day[0] if day else date.today(),
+    }
+
+def hot_queries(db, p: dict) -> list:
+    """
+    (name, statement) for the queries behind the dashboards, instructor
+    screens, reports and announcement lists.
+    """
+    cohort = ReportCohort(p["program"], None, p["offering_id"])
+    return [
+        ("student attendance records", _attendance_records_query(p["student_id"], p["offering_id"])),
+        ("student exam records", _exam_records_query(p["student_id"])),
+        ("student enrollments", _enrollments_by_student_query(p["student_id"])),
+        ("student course materials", _course_materials_query(p["student_id"])),
+        ("offering enrollments", select(StudentCourseEnrollment).where(StudentCourseEnrollment.offering_id == p["offering_id"])),
+        ("offering attendance by date", select(Attendance).where(
+            Attendance.offering_id == p["offering_id"], Attendance.attendance_date == p["attendance_date"])),
+        ("offering exam records by type", select(ExamRecord).where(
+            ExamRecord.offering_id == p["offering_id"], ExamRecord.exam_type == p["exam_type"])),
+        ("students by program", select(Student).where(Student.program == p["program"])),
+        ("students by section", select(Student).where(Student.section == p["section"])),
+        ("attendance report cohort", cohort.with_attendance(
+            cohort.query(db, Student.student_id, Attendance.attendance_date, Attendance.status), None, None).statement),
+        ("exam report cohort", cohort.with_exam_records(
+            cohort.query(db, Student.student_id, ExamRecord.obtained_marks), p["exam_type"]).statement),
+        ("active announcements", select(Announcement).where(
+            or_(Announcement.valid_until.is_(None), Announcement.valid_until >= date.today())
+        ).order_by(desc(Announcement.created_at)).limit(50)),
+    ]
+
+def explain(connection, statement) -> list:
+    """
+    Returns [(table, access, full_scan)] from the dialect's EXPLAIN.
+    """
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        plan = []
+        for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).mappings():
+            detail = row["detail"]
+            if detail.startswith(("SCAN", "SEARCH")):
+                table = detail.split()[1]
+                full_scan = detail.startswith("SCAN") and "INDEX" not in detail
+                plan.append((table, detail, full_scan))
+        return plan
+    if dialect == "mysql":
+        plan = []
+        for row in connection.exec_driver_sql("EXPLAIN " + sql).mappings():
+            access = f"type={row['type']} key={row['key']} rows={row['rows']}"
+            plan.append((row["table"], access, row["type"] == "ALL"))
+        return plan
+    raise SystemExit(f"EXPLAIN output for {dialect} is not supported")
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN the main crud queries")
+    parser.add_argument("--database-url", default=database.SQLALCHEMY_DATABASE_URL, help="Database to inspect")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan step, not only full scans")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 when any query scans a full table")
+    args = parser.parse_args()
+
+    engine = database.build_engine(args.database_url)
+    db = sessionmaker(bind=engine)()
+    full_scans = 0
+    try:
+        params = sample_parameters(db)
+        connection = db.connection()
+        for name, statement in hot_queries(db, params):
+            plan = explain(connection, statement)
+            scans = [step for step in plan if step[2]]
+            full_scans += len(scans)
+            print(f"{'❌' if scans else '✅'} {name}")
+            for table, access, full_scan in plan:
+                if args.verbose or full_scan:
+                    print(f"     {'FULL SCAN ' if full_scan else ''}{table}: {access}")
+    finally:
+        db.close()
+        engine.dispose()
+
+    print(f"\n{full_scans} full table scan(s)")
+    if args.strict and full_scans:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
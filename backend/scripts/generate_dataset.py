@@ -0,0 +1,294 @@
+"""
+Populates the LMS schema with a synthetic, university-sized dataset for
+performance work: departments, sections, courses, instructors, offerings,
+students, enrollments, attendance and exam records, course materials and
+announcements with their recipients. The attendance rollups are rebuilt at the end.
+
+Rows are generated deterministically from --seed and inserted with batched
+executemany statements, so the same scale always produces the same data.
+
+Run from the backend directory:
+    python -m scripts.generate_dataset --scale small --database-url sqlite:///lms_small.db --create-schema
+    python -m scripts.generate_dataset --scale university          # the configured MySQL database
+    python -m scripts.generate_dataset --scale medium --students 20000 --days 40
+
+Point the generator at an empty database: IDs are assigned from fixed
+prefixes and will collide with existing rows.
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+import database
+# Import every model so Base.metadata holds the full schema and the mappers can configure
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from crud.instructor.attendance_summary import rebuild_attendance_summaries
+from crud.shared.announcements import _recipients
+
+INSERT_BATCH_SIZE = 10000
+
+# sections are per department and semester, courses per department,
+# offerings per section, days of attendance and exams per enrollment
+SCALES = {
+    "small": dict(departments=3, sections=2, semesters=2, courses=6, offerings=3, students=500, days=10, exams=3, announcements=50),
+    "medium": dict(departments=10, sections=4, semesters=4, courses=20, offerings=4, students=5000, days=20, exams=4, announcements=500),
+    "university": dict(departments=30, sections=10, semesters=8, courses=40, offerings=5, students=50000, days=24, exams=6, announcements=5000),
+}
+
+FIRST_NAMES = ["Ali", "Sara", "Usman", "Ayesha", "Hamza", "Fatima", "Bilal", "Zainab", "Omar", "Hira", "Ahmed", "Maryam", "Hassan", "Iqra", "Danish", "Noor"]
+LAST_NAMES = ["Khan", "Ahmed", "Malik", "Hussain", "Raza", "Sheikh", "Qureshi", "Butt", "Chaudhry", "Siddiqui", "Iqbal", "Mirza"]
+DEPARTMENT_NAMES = ["Computer Science", "Software Engineering", "Electrical Engineering", "Mechanical Engineering", "Civil Engineering", "Mathematics", "Physics", "Chemistry", "Business Administration", "Economics", "English", "Psychology", "Biotechnology", "Architecture", "Data Science"]
+ATTENDANCE_WEIGHTS = [("Present", 80), ("Absent", 12), ("Leave", 8)]
+EXAM_TYPES = ["midterm", "final", "quiz", "assignment"]
+EXAM_TOTALS = {"midterm": 30.0, "final": 50.0, "quiz": 10.0, "assignment": 10.0}
+SEMESTER_START = date(2025, 2, 3)
+
+
+class DatasetGenerator:
+    def __init__(self, engine, rng: random.Random, **scale):
+        self.engine = engine
+        self.rng = rng
+        self.scale = scale
+        self.counts = {}
+
+    def _insert(self, conn, model, rows):
+        """
+        Inserts rows (any iterable of dicts) in INSERT_BATCH_SIZE executemany batches.
+        """
+        table = model.__table__
+        batch, total = [], 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) == INSERT_BATCH_SIZE:
+                conn.execute(insert(table), batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            conn.execute(insert(table), batch)
+            total += len(batch)
+        self.counts[table.name] = self.counts.get(table.name, 0) + total
+        print(f"  {table.name}: {self.counts[table.name]} rows")
+
+    def _person(self, prefix: str, phone_prefix: str, n: int) -> dict:
+        return {
+            "first_name": self.rng.choice(FIRST_NAMES),
+            "last_name": self.rng.choice(LAST_NAMES),
+            "email": f"{prefix.lower()}{n}@lms.example.edu",
+            "phone_number": f"{phone_prefix}{n:08d}",
+            "cnic": f"{prefix}-{n:09d}",
+        }
+
+    def generate(self):
+        s = self.scale
+        with self.engine.begin() as conn:
+            departments = self._department_names(s["departments"])
+            self._insert(conn, department.Department, ({"department_name": name} for name in departments))
+
+            sections = []  # (section_name, department, semester)
+            for dept_index, dept in enumerate(departments):
+                for semester in range(1, s["semesters"] + 1):
+                    for number in range(s["sections"]):
+                        sections.append((f"D{dept_index:02d}-S{semester}-{number + 1:02d}", dept, str(semester)))
+            self._insert(conn, section.Section, ({"section_name": name, "department": dept, "semester": sem} for name, dept, sem in sections))
+
+            courses = {}  # department -> [course_id]
+            course_rows = []
+            for dept_index, dept in enumerate(departments):
+                courses[dept] = [f"D{dept_index:02d}C{c:03d}" for c in range(s["courses"])]
+                for c, course_id in enumerate(courses[dept]):
+                    course_rows.append({
+                        "course_id": course_id,
+                        "course_name": f"{dept} {c + 101}",
+                        "course_description": f"Synthetic course {c + 101} of {dept}",
+                        "course_credit_hours": self.rng.choice([2, 3, 3, 4]),
+                    })
+            self._insert(conn, course.Course, course_rows)
+            self._insert(conn, pre_course.CoursePrerequisite, (
+                {"course_id": ids[c], "prereq_course_id": ids[c - 1]}
+                for ids in courses.values() for c in range(1, len(ids), 3)
+            ))
+
+            # Roughly one instructor per two offerings, per department
+            instructors = {}
+            instructor_rows = []
+            per_department = max(1, s["sections"] * s["semesters"] * s["offerings"] // 2)
+            for dept_index, dept in enumerate(departments):
+                instructors[dept] = []
+                for i in range(per_department):
+                    n = dept_index * per_department + i
+                    instructor_id = f"INS{n:05d}"
+                    instructors[dept].append(instructor_id)
+                    instructor_rows.append(dict(
+                        self._person("IN", "031", n), instructor_id=instructor_id, department=dept,
+                        qualification=self.rng.choice(["MS", "PhD"]), year_of_experience=self.rng.randint(1, 30),
+                    ))
+            self._insert(conn, instructor.Instructor, instructor_rows)
+
+            # Each section takes `offerings` courses of its department
+            offerings = {}  # section_name -> [offering_id]
+            offering_rows = []
+            for section_name, dept, semester in sections:
+                offerings[section_name] = []
+                for course_id in self.rng.sample(courses[dept], min(s["offerings"], len(courses[dept]))):
+                    offering_id = len(offering_rows) + 1
+                    offerings[section_name].append(offering_id)
+                    offering_rows.append({
+                        "offering_id": offering_id,
+                        "course_id": course_id,
+                        "section_name": section_name,
+                        "instructor_id": self.rng.choice(instructors[dept]),
+                        "capacity": 60,
+                    })
+            self._insert(conn, course_offerings.CourseOffering, offering_rows)
+
+            students = []  # (student_id, section_name)
+            student_rows = []
+            for n in range(s["students"]):
+                section_name, dept, semester = sections[n % len(sections)]
+                student_id = f"ST{n:06d}"
+                students.append((student_id, section_name))
+                student_rows.append(dict(
+                    self._person("ST", "032", n), student_id=student_id, program=dept, section=section_name,
+                    enrollment_year=2025 - (int(semester) - 1) // 2,
+                ))
+            self._insert(conn, student.Student, student_rows)
+
+            self._insert(conn, student_enrollment.StudentCourseEnrollment, (
+                {"student_id": student_id, "offering_id": offering_id, "enrollment_date": SEMESTER_START}
+                for student_id, section_name in students for offering_id in offerings[section_name]
+            ))
+
+            class_days = self._class_days(s["days"])
+            statuses, weights = zip(*ATTENDANCE_WEIGHTS)
+            self._insert(conn, attendance_records.Attendance, (
+                {"offering_id": offering_id, "student_id": student_id, "attendance_date": day, "status": status}
+                for student_id, section_name in students
+                for offering_id in offerings[section_name]
+                for day, status in zip(class_days, self.rng.choices(statuses, weights, k=len(class_days)))
+            ))
+
+            exam_plan = self._exam_plan(s["exams"])
+            self._insert(conn, exam_records.ExamRecord, (
+                self._exam_row(offering_id, student_id, exam_type, exam_date)
+                for student_id, section_name in students
+                for offering_id in offerings[section_name]
+                for exam_type, exam_date in exam_plan
+            ))
+
+            self._insert(conn, course_materials.CourseMaterial, (
+                {
+                    "offering_id": offering_id,
+                    "title": f"Week {week} notes",
+                    "description": "Synthetic lecture notes",
+                    "file_path": f"uploads/materials/offering_{offering_id}_week_{week}.pdf",
+                    "uploaded_at": datetime.combine(SEMESTER_START + timedelta(weeks=week - 1), datetime.min.time()),
+                    "is_guidebook": week == 1,
+                }
+                for offering_id in range(1, len(offering_rows) + 1) for week in (1, 2, 3)
+            ))
+
+            announcement_rows = [self._announcement_row(n, departments, instructors, students) for n in range(s["announcements"])]
+            self._insert(conn, announcements.Announcement, announcement_rows)
+            # Expanded like the API's create_announcement, so the feeds find them
+            self._insert(conn, announcements.AnnouncementRecipient, (
+                {"announcement_id": row["announcement_id"], "role": target.role, "target_type": target.target_type, "target_id": target.target_id}
+                for row in announcement_rows
+                for target in _recipients(row["recipient_type"], row["recipient_ids"], row["department_name"])
+            ))
+
+        db = sessionmaker(bind=self.engine)()
+        try:
+            rebuild_attendance_summaries(db)
+            print("  attendance rollups rebuilt")
+        finally:
+            db.close()
+
+    def _department_names(self, count: int):
+        names = DEPARTMENT_NAMES[:count]
+        return names + [f"Department {n}" for n in range(len(names) + 1, count + 1)]
+
+    def _class_days(self, count: int):
+        days, day = [], SEMESTER_START
+        while len(days) < count:
+            if day.weekday() < 5:
+                days.append(day)
+            day += timedelta(days=1)
+        return days
+
+    def _exam_plan(self, count: int):
+        # midterm and final once, then alternating quizzes and assignments
+        plan = [("midterm", SEMESTER_START + timedelta(weeks=8)), ("final", SEMESTER_START + timedelta(weeks=16))]
+        for n in range(max(count - 2, 0)):
+            plan.append((EXAM_TYPES[2 + n % 2], SEMESTER_START + timedelta(weeks=2 + n)))
+        return plan[:count]
+
+    def _exam_row(self, offering_id: int, student_id: str, exam_type: str, exam_date: date) -> dict:
+        total = EXAM_TOTALS[exam_type]
+        if self.rng.random() < 0.03:
+            obtained, remarks = 0.0, "absent"
+        else:
+            # Whole marks, as entered by instructors
+            obtained = float(round(min(max(self.rng.gauss(0.68, 0.16), 0.0), 1.0) * total))
+            remarks = "pass" if obtained >= total * 0.5 else "fail"
+        return {
+            "offering_id": offering_id,
+            "student_id": student_id,
+            "exam_type": exam_type,
+            "obtained_marks": obtained,
+            "total_marks": total,
+            "exam_date": datetime.combine(exam_date, datetime.min.time()),
+            "remarks": remarks,
+        }
+
+    def _announcement_row(self, n: int, departments, instructors, students) -> dict:
+        recipient_type = self.rng.choice(["all", "all_students", "all_instructors", "department_instructors", "specific_students"])
+        dept = self.rng.choice(departments)
+        recipient_ids = None
+        if recipient_type == "specific_students":
+            recipient_ids = ",".join(student_id for student_id, _ in self.rng.sample(students, min(20, len(students))))
+        from_instructor = self.rng.random() < 0.4
+        return {
+            "announcement_id": n + 1,
+            "sender_type": "Instructor" if from_instructor else "Admin",
+            "sender_id": self.rng.choice(instructors[dept]) if from_instructor else None,
+            "title": f"Announcement {n}",
+            "message": f"Synthetic announcement {n} for {recipient_type.replace('_', ' ')}.",
+            "recipient_type": recipient_type,
+            "recipient_ids": recipient_ids,
+            "department_name": dept if recipient_type == "department_instructors" else None,
+            "priority": "High" if self.rng.random() < 0.1 else "Normal",
+            "valid_until": SEMESTER_START + timedelta(days=self.rng.randint(7, 120)),
+            "created_at": datetime.combine(SEMESTER_START, datetime.min.time()) + timedelta(hours=n),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Populate the LMS schema with a synthetic dataset")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Preset volumes (default: small)")
+    parser.add_argument("--database-url", default=database.SQLALCHEMY_DATABASE_URL, help="Target database (default: the app's database)")
+    parser.add_argument("--create-schema", action="store_true", help="Create missing tables from the models first (for SQLite; MySQL uses database/schema.sql)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"Override the preset's {name}")
+    args = parser.parse_args()
+
+    scale = dict(SCALES[args.scale])
+    scale.update({name: getattr(args, name) for name in scale if getattr(args, name) is not None})
+
+    engine = database.build_engine(args.database_url)
+    if args.create_schema:
+        database.Base.metadata.create_all(engine)
+
+    print(f"Generating '{args.scale}' dataset: {scale}")
+    started = time.perf_counter()
+    DatasetGenerator(engine, random.Random(args.seed), **scale).generate()
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Load-test scenarios for the hot API routes, reporting latency percentiles and
+throughput per route.
+
+Scenarios (pick with --scenarios, weights decide how often each runs):
+    mark_attendance    instructor marks a student (POST /api/instructor/attendance)
+    student_dashboard  the student dashboard's attendance summary, exam records,
+                       enrollments and course materials
+    report_export      admin attendance and exam exports for one offering (CSV)
+    announcements      announcement listing
+
+Request parameters (offerings, their instructors, enrolled students) are
+sampled from the same database the API uses, e.g. one filled by
+scripts/generate_dataset.py.
+
+Run from the backend directory, against a running server:
+    uvicorn main:app --workers 4 &
+    python -m scripts.load_test --base-url http://127.0.0.1:8000 --concurrency 16 --duration 60
+
+or in-process against any database (needs httpx for FastAPI's TestClient):
+    python -m scripts.load_test --in-process --database-url sqlite:///lms_small.db --duration 30
+"""
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+import database
+from database import aio as database_aio
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, admins
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from models.admin.course_offerings import CourseOffering
+from models.admin.student_enrollment import StudentCourseEnrollment
+from routers.instructor.instructor_auth_router import create_access_token
+
+SAMPLE_SIZE = 2000
+PERCENTILES = (50, 90, 95, 99)
+# Attendance is marked on dates after the generated term so it never edits seeded rows
+MARK_ATTENDANCE_START = date(2026, 1, 5)
+
+
+class HttpTarget:
+    """
+    Sends requests to a running server, one keep-alive connection per worker thread.
+    """
+
+    def __init__(self, base_url: str):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self._local = threading.local()
+
+    def _connection(self):
+        if not hasattr(self._local, "connection"):
+            self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=120)
+        return self._local.connection
+
+    def request(self, method: str, path: str, body=None, headers=None) -> int:
+        headers = dict(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers["Content-Type"] = "application/json"
+        connection = self._connection()
+        try:
+            connection.request(method, self.prefix + path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            del self._local.connection
+            raise
+
+
+class InProcessTarget:
+    """
+    Drives the FastAPI app in this process through its TestClient.
+    """
+
+    def __init__(self):
+        from fastapi.testclient import TestClient
+        import main
+        # Server errors come back as 500 responses, as they would over HTTP
+        self.client = TestClient(main.app, raise_server_exceptions=False)
+        # Run every request on one event loop, as a server does; the async
+        # engine's pooled connections belong to the loop that opened them
+        self.client.__enter__()
+
+    def close(self):
+        self.client.__exit__(None, None, None)
+
+    def request(self, method: str, path: str, body=None, headers=None) -> int:
+        return self.client.request(method, path, json=body, headers=headers).status_code
+
+
+class Sample:
+    """
+    Offerings with their instructor and enrolled students, read once up front.
+    """
+
+    def __init__(self, db, size: int):
+        total = db.query(func.count(StudentCourseEnrollment.enrollment_id)).scalar() or 0
+        if not total:
+            raise SystemExit("No enrollments found: populate the database first (scripts/generate_dataset.py)")
+        step = max(total // size, 1)
+        rows = (
+            db.query(StudentCourseEnrollment.student_id, StudentCourseEnrollment.offering_id, CourseOffering.instructor_id)
+            .join(CourseOffering, CourseOffering.offering_id == StudentCourseEnrollment.offering_id)
+            .filter(StudentCourseEnrollment.enrollment_id % step == 0)
+            .limit(size)
+            .all()
+        )
+        self.enrollments = [(student_id, offering_id) for student_id, offering_id, _ in rows]
+        self.instructors = {offering_id: instructor_id for _, offering_id, instructor_id in rows}
+        self.offerings = list(self.instructors)
+        self.students = sorted({student_id for student_id, _ in self.enrollments})
+
+
+def mark_attendance(target, sample: Sample, rng: random.Random):
+    student_id, offering_id = rng.choice(sample.enrollments)
+    token = create_access_token({"sub": sample.instructors[offering_id]})
+    body = {
+        "offering_id": offering_id,
+        "student_id": student_id,
+        "attendance_date": (MARK_ATTENDANCE_START + timedelta(days=rng.randrange(365))).isoformat(),
+        "status": rng.choice(["Present", "Present", "Present", "Absent", "Leave"]),
+    }
+    yield "POST /api/instructor/attendance", target.request("POST", "/api/instructor/attendance", body, {"Authorization": f"Bearer {token}"})
+
+def student_dashboard(target, sample: Sample, rng: random.Random):
+    student_id = rng.choice(sample.students)
+    for route in (
+        "/api/student/students/{student_id}/attendance/summary",
+        "/api/student/students/{student_id}/exam_records",
+        "/api/student/enrollments/student/{student_id}",
+        "/api/student/students/{student_id}/course_materials",
+    ):
+        yield f"GET {route}", target.request("GET", route.format(student_id=student_id))
+
+def report_export(target, sample: Sample, rng: random.Random):
+    offering_id = rng.choice(sample.offerings)
+    for report in ("attendance", "exam"):
+        route = f"/api/admin/reports/{report}"
+        yield f"GET {route}?format=csv", target.request("GET", f"{route}?{urlencode({'course': offering_id, 'format': 'csv'})}")
+
+def list_announcements(target, sample: Sample, rng: random.Random):
+    yield "GET /api/announcements/", target.request("GET", "/api/announcements/")
+
+# name -> (steps, weight)
+SCENARIOS = {
+    "mark_attendance": (mark_attendance, 4),
+    "student_dashboard": (student_dashboard, 4),
+    "report_export": (report_export, 1),
+    "announcements": (list_announcements, 2),
+}
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, route: str, seconds: float, ok: bool):
+        with self._lock:
+            self.latencies[route].append(seconds)
+            if not ok:
+                self.errors[route] += 1
+
+    def report(self, elapsed: float) -> list:
+        rows = []
+        for route in sorted(self.latencies):
+            latencies = np.array(self.latencies[route]) * 1000
+            rows.append({
+                "route": route,
+                "requests": len(latencies),
+                "errors": self.errors[route],
+                "throughput_rps": round(len(latencies) / elapsed, 2),
+                **{f"p{p}_ms": round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(latencies, PERCENTILES))},
+                "max_ms": round(float(latencies.max()), 2),
+            })
+        return rows
+
+
+def run_worker(target, sample: Sample, scenarios: list, weights: list, recorder: Recorder, deadline: float, budget, seed: int):
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline and budget():
+        steps = rng.choices(scenarios, weights)[0]
+        started = time.perf_counter()
+        try:
+            for route, status in steps(target, sample, rng):
+                finished = time.perf_counter()
+                recorder.record(route, finished - started, status < 400)
+                started = finished
+        except Exception:
+            recorder.record(f"{steps.__name__} (transport error)", time.perf_counter() - started, False)
+
+def print_report(rows: list, elapsed: float):
+    total = sum(row["requests"] for row in rows)
+    print(f"\n{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)\n")
+    header = f"{'route':<58}{'reqs':>7}{'errs':>6}{'req/s':>8}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES) + f"{'max ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['route']:<58}{row['requests']:>7}{row['errors']:>6}{row['throughput_rps']:>8}"
+            + "".join(f"{row[f'p{p}_ms']:>10}" for p in PERCENTILES)
+            + f"{row['max_ms']:>10}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the hot API routes")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server to test (ignored with --in-process)")
+    parser.add_argument("--in-process", action="store_true", help="Run the app in this process instead of calling a server")
+    parser.add_argument("--database-url", default=database.SQLALCHEMY_DATABASE_URL, help="Database to sample parameters from (and to serve from with --in-process)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent workers")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many scenario runs")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (default: new each run; reusing one against the same database repeats attendance marks, which then fail as duplicates)")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    engine = database.build_engine(args.database_url)
+    if args.in_process:
+        database.engine = engine
+        database.SessionLocal.configure(bind=engine)
+        database_aio.async_engine = database_aio.build_async_engine(database_aio.async_database_url(args.database_url))
+        database_aio.AsyncSessionLocal.configure(bind=database_aio.async_engine)
+        target = InProcessTarget()
+    else:
+        target = HttpTarget(args.base_url)
+
+    db = sessionmaker(bind=engine)()
+    try:
+        sample = Sample(db, SAMPLE_SIZE)
+    finally:
+        db.close()
+
+    scenarios = [SCENARIOS[name][0] for name in names]
+    weights = [SCENARIOS[name][1] for name in names]
+    recorder = Recorder()
+    remaining = [args.requests]
+    remaining_lock = threading.Lock()
+
+    def budget() -> bool:
+        if remaining[0] is None:
+            return True
+        with remaining_lock:
+            remaining[0] -= 1
+            return remaining[0] >= 0
+
+    if args.seed is None:
+        args.seed = random.randrange(2**31)
+    print(f"Running {', '.join(names)} with {args.concurrency} workers for up to {args.duration:.0f}s (seed {args.seed})")
+    started = time.perf_counter()
+    deadline = started + args.duration
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for worker in range(args.concurrency):
+            executor.submit(run_worker, target, sample, scenarios, weights, recorder, deadline, budget, args.seed + worker)
+    elapsed = time.perf_counter() - started
+    if isinstance(target, InProcessTarget):
+        target.close()
+
+    rows = recorder.report(elapsed)
+    print_report(rows, elapsed)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"elapsed_seconds": elapsed, "concurrency": args.concurrency, "routes": rows}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Backfills the attendance rollup tables (attendance_student_summary and
+attendance_daily_summary) from attendance_records.
+
+Run from the backend directory:
+    python -m scripts.rebuild_attendance_summary              # every offering
+    python -m scripts.rebuild_attendance_summary --offering 12
+"""
+import argparse
+
+from database import SessionLocal
+# Import the models referenced by relationships so the mappers can configure
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from crud.instructor.attendance_summary import rebuild_attendance_summaries
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild attendance rollups from attendance_records")
+    parser.add_argument("--offering", type=int, default=None, help="Only rebuild this offering_id")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuild_attendance_summaries(db, offering_id=args.offering)
+        scope = f"offering {args.offering}" if args.offering is not None else "all offerings"
+        print(f"✅ Attendance summaries rebuilt for {scope}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
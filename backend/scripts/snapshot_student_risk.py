@@ -0,0 +1,28 @@
+"""
+Rebuilds student_risk_snapshot, the at-risk ranking behind
+/api/admin/reports/at-risk and /api/instructor/courses/{offering_id}/at-risk.
+Run nightly, after the attendance rollups are current:
+
+    # crontab, from the backend directory
+    0 2 * * * cd /path/to/backend && python -m scripts.snapshot_student_risk
+
+Thresholds and weights come from the LMS_RISK_* environment variables
+(crud/admin/student_risk.py).
+"""
+from database import SessionLocal
+# Import the models referenced by relationships so the mappers can configure
+from models.admin import department, section, course, pre_course, instructor, student, course_offerings, student_enrollment, student_risk
+from models.instructor import attendance_records, exam_records, course_materials, attendance_summary
+from models.shared import announcements
+from crud.admin.student_risk import rebuild_risk_snapshot
+
+def main():
+    db = SessionLocal()
+    try:
+        result = rebuild_risk_snapshot(db)
+        print(f"✅ Risk snapshot rebuilt: {result['rows']} enrollments scored at {result['computed_at']:%Y-%m-%d %H:%M:%S}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
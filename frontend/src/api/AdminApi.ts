@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const API_BASE = 'http://localhost:8000/api/admin';
 
@@ -44,7 +45,7 @@ export const createAdmin = (username: string, password: string, email: string, f
   axios.post(`${API_BASE}/create`, new URLSearchParams({ username, password, email, full_name }));
 
 export const getAllAdmins = () =>
-  axios.get(`${API_BASE}/all`);
+  getAllPages(`${API_BASE}/all`);
 
 export const assignRoleToAdmin = (admin_id: number, role_id: number) =>
   axios.post(`${API_BASE}/assign-role`, new URLSearchParams({ admin_id: admin_id.toString(), role_id: role_id.toString() }));
@@ -62,10 +63,10 @@ export const deleteAdmin = (admin_id: number) =>
   axios.delete(`${API_BASE}/${admin_id}`);
 
 export const getAllRoles = () =>
-  axios.get(`${API_BASE}/roles/all`);
+  getAllPages(`${API_BASE}/roles/all`);
 
 export const getAllPermissions = () =>
-  axios.get(`${API_BASE}/permissions/all`);
+  getAllPages(`${API_BASE}/permissions/all`);
 
 export const createRole = (role_name: string, description: string) =>
   axios.post(`${API_BASE}/roles/create`, new URLSearchParams({ role_name, description }));
\ No newline at end of file
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000/api/course_offerings';
 
@@ -50,7 +51,7 @@ export const createCourseOffering = (
 
 // Get all course offerings
 export const getCourseOfferings = async (): Promise<CourseOfferingResponse[]> => {
-    const response = await axios.get(BASE_URL);
+    const response = await getAllPages<CourseOfferingResponse>(BASE_URL);
     return response.data;
 };
 
@@ -60,11 +61,11 @@ export const getCourseOfferingById = (offering_id: number) =>
 
 // Get course offerings by course ID
 export const getCourseOfferingsByCourse = (course_id: string) => 
-    axios.get(`${BASE_URL}/course/${course_id}`);
+    getAllPages(`${BASE_URL}/course/${course_id}`);
 
 // Get course offerings by instructor ID
 export const getCourseOfferingsByInstructor = (instructor_id: string) => 
-    axios.get(`${BASE_URL}/instructor/${instructor_id}`);
+    getAllPages(`${BASE_URL}/instructor/${instructor_id}`);
 
 // Update a course offering
 export const updateCourseOffering = (
@@ -85,7 +86,7 @@ export const updateCourseOffering = (
 
 // Get detailed course offerings by section name
 export const getCourseOfferingsBySectionDetails = (section_name: string) => 
-    axios.get(`${BASE_URL}/section/${section_name}/details`);
+    getAllPages(`${BASE_URL}/section/${section_name}/details`);
 
 // Delete a course offering
 export const deleteCourseOffering = (offering_id: number) => 
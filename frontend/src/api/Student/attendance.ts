@@ -1,4 +1,4 @@
-import axios from 'axios';
+import { getAllPages } from '../pagination';
 
 const API_BASE_URL = 'http://localhost:8000/api/student';
 
@@ -15,7 +15,7 @@ export const getAttendanceRecords = async (studentId: string, offeringId?: numbe
     const url = offeringId 
       ? `${API_BASE_URL}/students/${studentId}/attendance?offering_id=${offeringId}`
       : `${API_BASE_URL}/students/${studentId}/attendance`;
-    const response = await axios.get<AttendanceRecord[]>(url);
+    const response = await getAllPages<AttendanceRecord>(url);
     return response.data;
   } catch (error) {
     console.error("Error fetching attendance records:", error);
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from '../pagination';
 
 const API_BASE_URL = 'http://localhost:8000/api/student';
 
@@ -16,7 +17,7 @@ export const getCourseMaterials = async (studentId: string, offeringId?: number)
     const url = offeringId 
       ? `${API_BASE_URL}/students/${studentId}/course_materials?offering_id=${offeringId}`
       : `${API_BASE_URL}/students/${studentId}/course_materials`;
-    const response = await axios.get<CourseMaterial[]>(url);
+    const response = await getAllPages<CourseMaterial>(url);
     return response.data;
   } catch (error) {
     console.error("Error fetching course materials:", error);
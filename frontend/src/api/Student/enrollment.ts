@@ -1,4 +1,4 @@
-import axios from 'axios';
+import { getAllPages } from '../pagination';
 
 const API_BASE_URL = 'http://localhost:8000/api'; // This is a shared API for student enrollments
 
@@ -30,7 +30,7 @@ export interface EnrolledCourse {
 
 export const getStudentEnrollments = async (studentId: string): Promise<EnrolledCourse[]> => {
   try {
-    const response = await axios.get<EnrolledCourse[]>(`${API_BASE_URL}/student/enrollments/student/${studentId}`);
+    const response = await getAllPages<EnrolledCourse>(`${API_BASE_URL}/student/enrollments/student/${studentId}`);
     return response.data;
   } catch (error) {
     console.error("Error fetching student enrollments:", error);
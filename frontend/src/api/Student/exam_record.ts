@@ -1,4 +1,4 @@
-import axios from 'axios';
+import { getAllPages } from '../pagination';
 
 const API_BASE_URL = 'http://localhost:8000/api/student';
 
@@ -18,7 +18,7 @@ export const getExamRecords = async (studentId: string, offeringId?: number): Pr
     const url = offeringId 
       ? `${API_BASE_URL}/students/${studentId}/exam_records?offering_id=${offeringId}`
       : `${API_BASE_URL}/students/${studentId}/exam_records`;
-    const response = await axios.get<ExamRecord[]>(url);
+    const response = await getAllPages<ExamRecord>(url);
     return response.data;
   } catch (error) {
     console.error("Error fetching exam records:", error);
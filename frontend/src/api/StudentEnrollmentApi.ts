@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000'; // Ensure this matches your backend
 
@@ -47,7 +48,7 @@ export const getStudentEnrollments = async (studentId: string): Promise<StudentC
         return Promise.reject(new Error("No authentication token found. Please log in."));
     }
     try {
-        const response = await axios.get(`${BASE_URL}/api/student/enrollments/student/${studentId}`, { headers });
+        const response = await getAllPages<StudentCourseEnrollmentResponse>(`${BASE_URL}/api/student/enrollments/student/${studentId}`, { headers });
         return response.data;
     } catch (error) {
         if (axios.isAxiosError(error)) {
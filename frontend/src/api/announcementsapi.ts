@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000/api/announcements';
 
@@ -25,7 +26,7 @@ export const createAnnouncement = (payload: any) => {
 };
 
 // Get all announcements
-export const getAllAnnouncements = () => axios.get(`${BASE_URL}`, { headers: getAuthHeaders() });
+export const getAllAnnouncements = () => getAllPages(`${BASE_URL}`, { headers: getAuthHeaders() });
 
 // Get announcement by ID
 export const getAnnouncementById = (announcement_id: number) => 
@@ -46,4 +47,4 @@ export const deleteAnnouncement = (announcement_id: number) =>
 
 // Search announcements by keyword
 export const searchAnnouncements = (keyword: string) => 
-    axios.get(`${BASE_URL}/search/?keyword=${keyword}`, { headers: getAuthHeaders() }); 
\ No newline at end of file
+    getAllPages(`${BASE_URL}/search/`, { params: { keyword }, headers: getAuthHeaders() }); 
\ No newline at end of file
@@ -1,8 +1,9 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000/api/courses'; // Corrected Base URL as per FastAPI docs
 
-export const getCourses = () => axios.get(`${BASE_URL}/`); 
+export const getCourses = () => getAllPages(`${BASE_URL}/`); 
 export const addCourse = (data: any) => axios.post(`${BASE_URL}/`, data); 
 export const getCourseByName = (name: string) => axios.get(`${BASE_URL}/name/${name}`); 
 export const getCourseById = (id: string) => axios.get(`${BASE_URL}/id/${id}`); 
@@ -0,0 +1,24 @@
+import axios, { AxiosRequestConfig, AxiosResponse } from 'axios';
+
+// List endpoints return one page at a time (backend crud/pagination.py): the
+// body is a JSON array and, when more rows follow, the X-Next-Cursor header
+// holds the cursor for the next page. Pages are requested at the largest size
+// the backend allows.
+const PAGE_SIZE = 500;
+
+// GET every page of a paginated list endpoint. Resolves like axios.get, with
+// `data` holding the rows of all pages.
+export const getAllPages = async <T = any>(url: string, config: AxiosRequestConfig = {}): Promise<AxiosResponse<T[]>> => {
+    const rows: T[] = [];
+    let cursor: string | undefined;
+    let response: AxiosResponse<T[]>;
+    do {
+        response = await axios.get<T[]>(url, {
+            ...config,
+            params: { ...config.params, limit: PAGE_SIZE, ...(cursor ? { cursor } : {}) },
+        });
+        rows.push(...response.data);
+        cursor = response.headers['x-next-cursor'];
+    } while (cursor);
+    return { ...response, data: rows };
+};
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000/api/course_prerequisites';
 
@@ -9,13 +10,13 @@ export const createPrerequisite = (courseId: string, prereqCourseId: string) =>
     return axios.post(`${BASE_URL}/`, formData);
 };
 
-export const getAllPrerequisites = () => axios.get(`${BASE_URL}/`);
+export const getAllPrerequisites = () => getAllPages(`${BASE_URL}/`);
 
 export const getPrerequisitesForCourse = (courseId: string) => 
-    axios.get(`${BASE_URL}/${courseId}/prerequisites`);
+    getAllPages(`${BASE_URL}/${courseId}/prerequisites`);
 
 export const getCoursesRequiringPrerequisite = (prereqCourseId: string) => 
-    axios.get(`${BASE_URL}/${prereqCourseId}/required_by`);
+    getAllPages(`${BASE_URL}/${prereqCourseId}/required_by`);
 
 export const deletePrerequisite = (courseId: string, prereqCourseId: string) => 
     axios.delete(`${BASE_URL}/${courseId}/${prereqCourseId}`); 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { getAllPages } from './pagination';
 
 const BASE_URL = 'http://localhost:8000/api/students';
 
@@ -16,7 +17,7 @@ export interface StudentResponse {
     // Add any other fields that might be needed
 }
 
-export const getStudents = () => axios.get<StudentResponse[]>(`${BASE_URL}/`);
+export const getStudents = () => getAllPages<StudentResponse>(`${BASE_URL}/`);
 export const addStudent = (data: any) => axios.post(`${BASE_URL}/`, data);
 export const getStudentById = (id: string) => axios.get<StudentResponse>(`${BASE_URL}/${id}`);
 export const updateStudent = (id: string, data: any) => axios.put(`${BASE_URL}/${id}`, data);